@@ -1,2 +1,12 @@
 from s_interpreter.compiler import *
 from s_interpreter.interpreter import *
+from s_interpreter.jit import *
+from s_interpreter.batch import *
+from s_interpreter.parallel import *
+from s_interpreter.profiler import *
+from s_interpreter.trace import *
+from s_interpreter.cache import *
+from s_interpreter.memo import *
+from s_interpreter.lazy import *
+from s_interpreter.dovetail import *
+from s_interpreter.idioms import *
@@ -0,0 +1,121 @@
+from s_interpreter.interpreter import (
+    Interpreter as _Interpreter,
+    InterpreterError as _InterpreterError,
+    Opcode as _Opcode
+)
+from typing import Any as _Any
+
+_INT64_MAX: int = 2 ** 63 - 1
+
+
+def run_batch(interpreter: _Interpreter,
+              inputs: _Any) -> _Any:
+    """
+    Runs the interpreter's program on every row of `inputs` (a 2-D array of lanes x inputs,
+    or a 1-D array of single inputs) in lockstep, and returns the array of outputs
+    (int64, or object if some output does not fit).
+
+    The register file of the running lanes is a (lanes x variables) int64 array.
+    On every iteration all lanes perform the instruction at their own program counter at once using masks,
+    lanes standing on the head of a summarized loop (see `LoopSummary`) apply it in closed form,
+    lanes standing on a native instruction evaluate it one by one,
+    and lanes that halted are retired.
+    Lanes whose inputs do not fit in an int64, or whose registers would overflow, are run again with Python ints.
+    """
+    import numpy as np
+
+    rows: list[tuple[int, ...]] = [
+        (int(row),) if np.ndim(row) == 0 else tuple(int(value) for value in row)
+        for row in inputs
+    ]
+    if any(value < 0 for row in rows for value in row):
+        raise _InterpreterError("Given negative input values! Only non-negatives in S!")
+
+    lowered = interpreter.lowered
+    outputs: list[int] = [0] * len(rows)
+    python_lanes: list[int] = [lane for lane, row in enumerate(rows) if max(row, default=0) > _INT64_MAX]
+
+    opcodes = np.array(lowered.opcodes, dtype=np.int64)
+    slots = np.array(lowered.slots, dtype=np.int64)
+    targets = np.array(lowered.targets, dtype=np.int64)
+    is_loop_head = np.zeros(len(opcodes), dtype=bool)
+    is_loop_head[list(lowered.loops)] = True
+
+    input_indices = np.array([lane for lane, row in enumerate(rows) if max(row, default=0) <= _INT64_MAX],
+                             dtype=np.int64)
+    registers = np.zeros((len(input_indices), len(lowered.variables)), dtype=np.int64)
+    for input_index, slot in lowered.input_slots.items():
+        registers[:, slot] = [rows[lane][input_index - 1] if input_index <= len(rows[lane]) else 0
+                              for lane in input_indices]
+    instruction_indices = np.zeros(len(input_indices), dtype=np.int64)
+
+    while len(input_indices) > 0:
+        lanes = np.arange(len(input_indices))
+        lane_opcodes = opcodes[instruction_indices]
+        lane_slots = slots[instruction_indices]
+        values = registers[lanes, lane_slots]
+
+        halted = lane_opcodes == _Opcode.Halt
+        overflowed = (lane_opcodes == _Opcode.Increment) & (values == _INT64_MAX)
+
+        if (at_loop_head := is_loop_head[instruction_indices]).any():
+            for head in np.unique(instruction_indices[at_loop_head]):
+                loop = lowered.loops[int(head)]
+                at_head = instruction_indices == head
+                head_registers = registers[at_head]
+                iterations = np.maximum(1, -(-head_registers[:, loop.counter] // loop.counter_decrements))
+                for slot, amount in loop.increments:
+                    overflowed[at_head] |= iterations > (_INT64_MAX - head_registers[:, slot]) // amount
+                with np.errstate(over="ignore"):
+                    head_registers[:, loop.counter] = 0
+                    for slot, amount in loop.increments:
+                        head_registers[:, slot] += amount * iterations
+                    for slot, amount in loop.decrements:
+                        head_registers[:, slot] = np.where(iterations >= -(-head_registers[:, slot] // amount),
+                                                           0,
+                                                           head_registers[:, slot] - amount * iterations)
+                registers[at_head] = head_registers
+                instruction_indices[at_head] = loop.tail + 1
+            lane_opcodes[at_loop_head] = _Opcode.Loop
+
+        if (at_native := lane_opcodes == _Opcode.Native).any():
+            # Native instructions are evaluated lane by lane, and send lanes they diverge on to the Python run
+            for lane in lanes[at_native]:
+                value = lowered.natives[int(instruction_indices[lane])].evaluate(registers[lane].tolist())
+                if value is None or value > _INT64_MAX:
+                    overflowed[lane] = True
+                else:
+                    registers[lane, lane_slots[lane]] = value
+            instruction_indices[at_native] += 1
+
+        incremented = lane_opcodes == _Opcode.Increment
+        registers[lanes[incremented], lane_slots[incremented]] += 1
+        decremented = (lane_opcodes == _Opcode.Decrement) & (values > 0)
+        registers[lanes[decremented], lane_slots[decremented]] -= 1
+
+        stepped = lane_opcodes < _Opcode.Halt
+        jumped = (lane_opcodes == _Opcode.Jump) & (values != 0)
+        instruction_indices[stepped] = np.where(jumped[stepped],
+                                                targets[instruction_indices[stepped]],
+                                                instruction_indices[stepped] + 1)
+
+        if (retired := halted | overflowed).any():
+            finished = halted & ~overflowed
+            for lane, output in zip(input_indices[finished], registers[finished, 0]):
+                outputs[lane] = int(output)
+            python_lanes.extend(int(lane) for lane in input_indices[overflowed])
+
+            input_indices = input_indices[~retired]
+            registers = registers[~retired]
+            instruction_indices = instruction_indices[~retired]
+
+    python_interpreter: _Interpreter = _Interpreter(interpreter.program)
+    for lane in python_lanes:
+        outputs[lane] = python_interpreter.run(*rows[lane])
+
+    return np.array(outputs, dtype=np.int64 if max(outputs, default=0) <= _INT64_MAX else object)
+
+
+__all__ = (
+    "run_batch",
+)
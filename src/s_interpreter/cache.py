@@ -0,0 +1,121 @@
+from contextlib import contextmanager as _contextmanager
+from typing import (
+    Any as _Any,
+    Iterator as _Iterator,
+    Optional as _Optional,
+    Sequence as _Sequence
+)
+
+
+class ResultCache:
+    """
+    An on-disk cache of finished runs, keyed by the digest of the program (see `LoweredProgram.digest`)
+    and its input, holding the output, the amount of instructions performed and the final registers.
+
+    The cache is an sqlite database, so that it may be shared by concurrent processes.
+    It keeps at most `max_entries` runs, evicting the least recently used ones.
+    Numbers are stored as hexadecimal text, as S values aren't bounded to 64 bits
+    (and decimal conversions of huge integers are slow, and limited by Python).
+    """
+
+    def __init__(self,
+                 cache_path: str,
+                 max_entries: int = 100000):
+        if max_entries <= 0:
+            raise ValueError("Cache must be able to hold at least one entry!")
+
+        self.__cache_path: str = cache_path
+        self.__max_entries: int = max_entries
+        with self.__connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS results ("
+                               "program TEXT NOT NULL, "
+                               "input TEXT NOT NULL, "
+                               "output TEXT NOT NULL, "
+                               "instructions_performed TEXT NOT NULL, "
+                               "registers TEXT NOT NULL, "
+                               "last_used INTEGER NOT NULL, "
+                               "PRIMARY KEY (program, input))")
+            connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+    @_contextmanager
+    def __connect(self) -> _Iterator[_Any]:
+        # A short-lived connection per operation (committed on success), so the cache is safe to share across forks
+        import sqlite3
+
+        connection: sqlite3.Connection = sqlite3.connect(self.__cache_path, timeout=60.0)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @property
+    def cache_path(self) -> str:
+        return self.__cache_path
+
+    @property
+    def max_entries(self) -> int:
+        return self.__max_entries
+
+    @staticmethod
+    def __encode(values: _Sequence[int]) -> str:
+        return ",".join(format(value, "x") for value in values)
+
+    @staticmethod
+    def __decode(encoded_values: str) -> list[int]:
+        return [int(value, 16) for value in encoded_values.split(",")]
+
+    def get(self,
+            program_digest: str,
+            x: _Sequence[int]) -> _Optional[tuple[int, int, list[int]]]:
+        """
+        Returns the `(output, instructions performed, final registers)` of the cached run, if there is one.
+        """
+        from time import time_ns
+
+        key: tuple[str, str] = (program_digest, ResultCache.__encode(x))
+        with self.__connect() as connection:
+            row: _Optional[tuple[str, str, str]] = connection.execute(
+                "SELECT output, instructions_performed, registers FROM results WHERE program = ? AND input = ?",
+                key
+            ).fetchone()
+            if row is not None:
+                connection.execute("UPDATE results SET last_used = ? WHERE program = ? AND input = ?",
+                                   (time_ns(), *key))
+        if row is None:
+            return None
+        return int(row[0], 16), int(row[1], 16), ResultCache.__decode(row[2])
+
+    def put(self,
+            program_digest: str,
+            x: _Sequence[int],
+            output: int,
+            instructions_performed: int,
+            registers: _Sequence[int]) -> None:
+        from time import time_ns
+
+        with self.__connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                               (program_digest,
+                                ResultCache.__encode(x),
+                                format(output, "x"),
+                                format(instructions_performed, "x"),
+                                ResultCache.__encode(registers),
+                                time_ns()))
+            connection.execute("DELETE FROM results WHERE rowid IN ("
+                               "SELECT rowid FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                               (self.__max_entries,))
+
+    def __len__(self) -> int:
+        with self.__connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self) -> None:
+        with self.__connect() as connection:
+            connection.execute("DELETE FROM results")
+
+
+__all__ = (
+    "ResultCache",
+)
@@ -44,11 +44,10 @@ class EncodedPair:
         if pair_encoding < 0:
             raise ValueError(f"{__class__.__name__} encoding must be non-negative!")
 
-        from sympy.ntheory import factorint
+        # The exponent of 2 is the amount of trailing zero bits, so there's nothing to factor
         pair_encoding += 1
-        factorization: dict[int, int] = factorint(pair_encoding)
-        return EncodedPair(factorization.get(2, 0),
-                           ((pair_encoding // (2 ** factorization.get(2, 0))) - 1) // 2)
+        exponent: int = (pair_encoding & -pair_encoding).bit_length() - 1
+        return EncodedPair(exponent, ((pair_encoding >> exponent) - 1) // 2)
 
 
 class EncodedList:
@@ -356,11 +355,150 @@ class JumpCommand:
         return f"IF {str(self.variable)} != 0 GOTO {str(self.label)}"
 
 
+class NativeOperation(_enum.IntEnum):
+    """
+    The operations a sugar may declare as its native semantic (see `SyntacticSugar`),
+    each computing exactly what the matching sugar of the universal program computes.
+    """
+    Add = 0
+    Monus = 1
+    Multiply = 2
+    Divide = 3
+    Modulo = 4
+    Power = 5
+    Left = 6
+    Right = 7
+    Prime = 8
+    ListIndex = 9
+    Length = 10
+    _ignore_ = ["_keywords"]
+    _keywords: dict[str, "NativeOperation"]
+
+    @staticmethod
+    def compile(keyword: str) -> "NativeOperation":
+        if (operation := NativeOperation._keywords.get(keyword.upper())) is None:
+            raise CompilationError(f"Unknown native operation: '{keyword}'")
+        return operation
+
+    @property
+    def arity(self) -> int:
+        return 1 if self in {NativeOperation.Left,
+                             NativeOperation.Right,
+                             NativeOperation.Prime,
+                             NativeOperation.Length} else 2
+
+    @staticmethod
+    def __prime(index: int) -> int:
+        from sympy.ntheory import prime
+
+        return 2 if index <= 1 else prime(index)
+
+    def evaluate(self,
+                 *operands: int) -> _Optional[int]:
+        """
+        The result of the operation, or None where the sugar it stands for never halts
+        (e.g. dividing by 0, or the length of the list 0).
+        """
+        if self == NativeOperation.Add:
+            return operands[0] + operands[1]
+        if self == NativeOperation.Monus:
+            return max(operands[0] - operands[1], 0)
+        if self == NativeOperation.Multiply:
+            return operands[0] * operands[1]
+        if self == NativeOperation.Divide:
+            return None if operands[1] == 0 else operands[0] // operands[1]
+        if self == NativeOperation.Modulo:
+            return None if operands[1] == 0 else operands[0] % operands[1]
+        if self == NativeOperation.Power:
+            return operands[0] ** operands[1]
+        if self == NativeOperation.Left:
+            return ((operands[0] + 1) & -(operands[0] + 1)).bit_length() - 1
+        if self == NativeOperation.Right:
+            return (((operands[0] + 1) >> NativeOperation.Left.evaluate(operands[0])) - 1) // 2
+        if self == NativeOperation.Prime:
+            return NativeOperation.__prime(operands[0])
+        if self == NativeOperation.ListIndex:
+            if operands[0] == 0:
+                return None
+            list_, prime, exponent = operands[0], NativeOperation.__prime(operands[1]), 0
+            while list_ % prime == 0:
+                list_ //= prime
+                exponent += 1
+            return exponent
+        from sympy import factorint, primepi
+
+        if operands[0] == 0:
+            return None
+        return 0 if operands[0] == 1 else int(primepi(max(factorint(operands[0]))))
+
+    def __str__(self) -> str:
+        return next(keyword for keyword, operation in NativeOperation._keywords.items() if operation == self)
+
+
+NativeOperation._keywords = {
+    "ADD": NativeOperation.Add,
+    "MONUS": NativeOperation.Monus,
+    "MUL": NativeOperation.Multiply,
+    "DIV": NativeOperation.Divide,
+    "MOD": NativeOperation.Modulo,
+    "POW": NativeOperation.Power,
+    "LEFT": NativeOperation.Left,
+    "RIGHT": NativeOperation.Right,
+    "PRIME": NativeOperation.Prime,
+    "INDEX": NativeOperation.ListIndex,
+    "LENGTH": NativeOperation.Length
+}
+
+
+@_dataclass(frozen=True, eq=True)
+class NativeCommand:
+    """
+    An intrinsic: sets the variable to the result of a native operation on its operands (variables or consts)
+    as a single instruction. It is not part of S itself, so programs using it have no encoding.
+    """
+    from typing import Union as _Union
+
+    variable: Variable
+    operation: NativeOperation
+    operands: tuple[_Union[Variable, "Const"], ...]
+
+    _native_pattern: _ClassVar[_re.Pattern[str]] = _re.compile(r"\s*(?P<variable>[XYZ]([1-9][0-9]*)?)\s*<\s*-"
+                                                               r"\s*NATIVE\s+(?P<operation>[A-Z]+)"
+                                                               r"(?P<operands>(\s+([XYZ]([1-9][0-9]*)?|\d+))*)\s*",
+                                                               flags=_re.IGNORECASE)
+
+    def __post_init__(self) -> None:
+        if len(self.operands) != self.operation.arity:
+            raise CompilationError(f"Native operation {self.operation} takes {self.operation.arity} operands, "
+                                   f"got {len(self.operands)}")
+
+    @staticmethod
+    def compile(native_command: str) -> "NativeCommand":
+        if native_match := _re.fullmatch(NativeCommand._native_pattern, native_command):
+            return NativeCommand(Variable.compile(native_match.group("variable")),
+                                 NativeOperation.compile(native_match.group("operation")),
+                                 tuple(Numeric.compile(operand) for operand in native_match.group("operands").split()))
+        raise CompilationError(f"Failed to compile native command: \"{native_command}\"")
+
+    @property
+    def variables(self) -> tuple[Variable, ...]:
+        return (self.variable, *(operand for operand in self.operands if type(operand) is Variable))
+
+    def encode_repr(self) -> tuple[int, int]:
+        raise CompilationError(f"Native commands have no S encoding (compile in strict mode): \"{self}\"")
+
+    def encode(self) -> int:
+        raise CompilationError(f"Native commands have no S encoding (compile in strict mode): \"{self}\"")
+
+    def __str__(self) -> str:
+        return f"{str(self.variable)} <- NATIVE {str(self.operation)} " + " ".join(map(str, self.operands))
+
+
 @_dataclass(frozen=True, eq=True)
 class Sentence:
     from typing import Union as _Union
 
-    command: _Union[JumpCommand, VariableCommand]
+    command: _Union[JumpCommand, VariableCommand, NativeCommand]
 
     @staticmethod
     def compile(sentence: str) -> "Sentence":
@@ -374,6 +512,11 @@ class Sentence:
         except CompilationError:
             pass
 
+        try:
+            return Sentence(NativeCommand.compile(sentence))
+        except CompilationError:
+            pass
+
         raise CompilationError(f"Failed to compile sentence: \"{sentence}\"")
 
     def encode_repr(self) -> tuple[int, int]:
@@ -460,6 +603,70 @@ class Instruction:
 _program_recursion_depth: int = 0
 
 
+@_dataclass(frozen=True, eq=True)
+class SourceFrame:
+    """
+    A line of slang source: the section it is in ("MAIN" or the title of a sugar), its line number and its text.
+    """
+    section: str
+    line: int
+    text: str
+
+    def __str__(self) -> str:
+        return f"'{self.text}' (line {self.line}, {self.section})"
+
+
+class SourceMap:
+    """
+    A compiled program's side-car, mapping every instruction index to the chain of source lines that produced it:
+    the MAIN line first, followed by the line in every nested sugar implementation that was expanded to reach it.
+    """
+
+    def __init__(self,
+                 origins: _Sequence[tuple[SourceFrame, ...]]):
+        self.__origins: list[tuple[SourceFrame, ...]] = list(origins)
+
+    def __len__(self) -> int:
+        return len(self.__origins)
+
+    def __getitem__(self,
+                    instruction_index: int) -> tuple[SourceFrame, ...]:
+        return self.__origins[instruction_index]
+
+    def __eq__(self,
+               other: object) -> bool:
+        return type(other) is SourceMap and self.__origins == other.__origins
+
+    def to_json(self) -> str:
+        import json
+
+        return json.dumps({
+            "instructions": [
+                [[frame.section, frame.line, frame.text] for frame in origin]
+                for origin in self.__origins
+            ]
+        })
+
+    @staticmethod
+    def from_json(source_map_json: str) -> "SourceMap":
+        import json
+
+        return SourceMap([
+            tuple(SourceFrame(section, line, text) for section, line, text in origin)
+            for origin in json.loads(source_map_json)["instructions"]
+        ])
+
+    def save(self,
+             source_map_path: str) -> None:
+        with open(source_map_path, "w") as source_map_file:
+            source_map_file.write(self.to_json())
+
+    @staticmethod
+    def load(source_map_path: str) -> "SourceMap":
+        with open(source_map_path, "r") as source_map_file:
+            return SourceMap.from_json(source_map_file.read())
+
+
 @_dataclass(frozen=True, eq=True)
 class Program:
     instructions: _Sequence[Instruction]
@@ -481,13 +688,17 @@ class Program:
         sugar: "SyntacticSugar"
         sugar_invocation: str
         index_to_inject: int
+        frame: SourceFrame
 
     @staticmethod
     def __update_by_instruction(used_labels: set[Label],
                                 used_variables: set[Variable],
                                 *instructions_: Instruction) -> None:
         for instruction in instructions_:
-            used_variables.add(instruction.sentence.command.variable)
+            if type(instruction.sentence.command) is NativeCommand:
+                used_variables.update(instruction.sentence.command.variables)
+            else:
+                used_variables.add(instruction.sentence.command.variable)
 
             if instruction.label is not None:
                 used_labels.add(instruction.label)
@@ -497,8 +708,10 @@ class Program:
 
     @staticmethod
     def __create_sugar_job(line: str,
+                           frame: SourceFrame,
                            sugars: list["SyntacticSugar"],
                            instructions: list[Instruction],
+                           origins: list[tuple[SourceFrame, ...]],
                            used_variables: set[Variable],
                            used_labels: set[Label]) -> _Optional[_SugarJob]:
         if (sugar := next((sugar for sugar in sugars if sugar.validate(line)), None)) is not None:
@@ -512,30 +725,42 @@ class Program:
                 instructions.append(Instruction(Sentence(VariableCommand(Variable("Y"),
                                                                          VariableCommandType.NoOp)),
                                                 new_label))
-            return Program._SugarJob(sugar, line, len(instructions))
+                origins.append((frame,))
+            return Program._SugarJob(sugar, line, len(instructions), frame)
 
     @_dataclass
     class _ProgramParseResult:
         instructions: list[Instruction]
+        origins: list[tuple[SourceFrame, ...]]
         sugar_jobs: list["Program._SugarJob"]
         used_variables: set[Variable]
         used_labels: set[Label]
 
     @staticmethod
     def _parse(*program: str,
-               sugars: list["SyntacticSugar"]) -> _ProgramParseResult:
-        parse_result: Program._ProgramParseResult = Program._ProgramParseResult([], [], set(), set())
-
-        for line in program:
+               sugars: list["SyntacticSugar"],
+               frames: _Optional[_Sequence[SourceFrame]] = None) -> _ProgramParseResult:
+        parse_result: Program._ProgramParseResult = Program._ProgramParseResult([], [], [], set(), set())
+
+        for line_index, line in enumerate(program):
+            frame: SourceFrame = (
+                SourceFrame("MAIN", line_index + 1, line.strip())
+                if frames is None
+                else
+                frames[line_index]
+            )
             try:
                 parse_result.instructions.append(Instruction.compile(line))
+                parse_result.origins.append((frame,))
                 Program.__update_by_instruction(parse_result.used_labels,
                                                 parse_result.used_variables,
                                                 parse_result.instructions[-1])
             except CompilationError as compilation_failure:
                 sugar_job: _Optional[Program._SugarJob] = Program.__create_sugar_job(line,
+                                                                                     frame,
                                                                                      sugars,
                                                                                      parse_result.instructions,
+                                                                                     parse_result.origins,
                                                                                      parse_result.used_variables,
                                                                                      parse_result.used_labels)
                 if sugar_job is None:
@@ -545,47 +770,89 @@ class Program:
 
     @staticmethod
     def _expand_program(program_parse_result: _ProgramParseResult,
-                        verbose: bool = False) -> None:
+                        verbose: bool = False,
+                        strict: bool = False) -> None:
         for sugar_job_index, sugar_job in enumerate(program_parse_result.sugar_jobs):
             if verbose:
                 print("| " * (_program_recursion_depth - 1) + f"Compiling '{sugar_job.sugar_invocation}' "
                                                               f"('{sugar_job.sugar.title}')")
-            instructions_to_inject: _Sequence[Instruction] = sugar_job.sugar.compile(
+            sugar_program: Program
+            sugar_origins: list[tuple[SourceFrame, ...]]
+            sugar_program, sugar_origins = sugar_job.sugar._compile(
                 sugar_job.sugar_invocation,
                 program_parse_result.used_labels,
                 program_parse_result.used_variables,
-                verbose
-            ).instructions
+                verbose,
+                strict
+            )
+            instructions_to_inject: _Sequence[Instruction] = sugar_program.instructions
             Program.__update_by_instruction(program_parse_result.used_labels,
                                             program_parse_result.used_variables,
                                             *instructions_to_inject)
-            for instruction_index, instruction_to_inject in enumerate(instructions_to_inject):
-                program_parse_result.instructions.insert(sugar_job.index_to_inject + instruction_index,
-                                                         instruction_to_inject)
+            program_parse_result.instructions[sugar_job.index_to_inject:sugar_job.index_to_inject] = (
+                instructions_to_inject
+            )
+            program_parse_result.origins[sugar_job.index_to_inject:sugar_job.index_to_inject] = [
+                (sugar_job.frame, *origin) for origin in sugar_origins
+            ]
             sugar_job_index += 1
             while sugar_job_index < len(program_parse_result.sugar_jobs):
                 program_parse_result.sugar_jobs[sugar_job_index].index_to_inject += len(instructions_to_inject)
                 sugar_job_index += 1
 
     @staticmethod
-    def compile(*program: str,
-                sugars: _Optional[_Sequence["SyntacticSugar"]] = None,
-                verbose: bool = False) -> "Program":
+    def _compile(*program: str,
+                 sugars: _Optional[_Sequence["SyntacticSugar"]] = None,
+                 verbose: bool = False,
+                 frames: _Optional[_Sequence[SourceFrame]] = None,
+                 strict: bool = False) -> tuple["Program", list[tuple[SourceFrame, ...]]]:
         global _program_recursion_depth
         _program_recursion_depth += 1
 
         try:
             program_parse_result: Program._ProgramParseResult = Program._parse(*program,
-                                                                               sugars=[] if sugars is None else sugars)
-            Program._expand_program(program_parse_result, verbose)
+                                                                               sugars=[] if sugars is None else sugars,
+                                                                               frames=frames)
+            Program._expand_program(program_parse_result, verbose, strict)
 
             try:
-                return Program(program_parse_result.instructions)
+                return Program(program_parse_result.instructions), program_parse_result.origins
             except ValueError as exception:
                 raise CompilationError(str(exception))
         finally:
             _program_recursion_depth -= 1
 
+    @staticmethod
+    def compile(*program: str,
+                sugars: _Optional[_Sequence["SyntacticSugar"]] = None,
+                verbose: bool = False,
+                strict: bool = False) -> "Program":
+        """
+        Compiles the program, expanding its sugars.
+        Sugars with a native semantic become a single `NativeCommand`, unless `strict` (see `SyntacticSugar`).
+        """
+        return Program._compile(*program, sugars=sugars, verbose=verbose, strict=strict)[0]
+
+    @staticmethod
+    def compile_with_source_map(*program: str,
+                                sugars: _Optional[_Sequence["SyntacticSugar"]] = None,
+                                verbose: bool = False,
+                                line_numbers: _Optional[_Sequence[int]] = None,
+                                strict: bool = False) -> tuple["Program", SourceMap]:
+        """
+        Compiles the program alongside its `SourceMap`.
+        `line_numbers` are the source line numbers of the given lines (their 1-based indices by default).
+        """
+        program_, origins = Program._compile(*program,
+                                             sugars=sugars,
+                                             verbose=verbose,
+                                             frames=None if line_numbers is None else [
+                                                 SourceFrame("MAIN", line_number, line.strip())
+                                                 for line, line_number in zip(program, line_numbers)
+                                             ],
+                                             strict=strict)
+        return program_, SourceMap(origins)
+
     def encode_repr(self) -> list[tuple[int, tuple[int, int]]]:
         return [
             instruction.encode_repr()
@@ -671,6 +938,13 @@ class Numeric:
 
 
 class SyntacticSugar:
+    """
+    A sugar: a usage pattern with typed arguments, and an S implementation it expands to.
+
+    The implementation may declare the sugar's native semantic with a `{NATIVE OUT <- OPERATION ARG...}` line
+    (see `NativeOperation`), in which case the sugar compiles to a single `NativeCommand` unless compiled strictly.
+    The native semantic must agree with the implementation, for every aliasing of the arguments.
+    """
     from typing import (
         Union as _Union,
         Type as _Type
@@ -745,8 +1019,46 @@ class SyntacticSugar:
 
         self.__invocation_regex: _re.Pattern[str] = _re.compile(usage, flags=_re.IGNORECASE)
 
+    def __set_native(self,
+                     directive_match: _re.Match,
+                     line_number: int,
+                     directive: str) -> None:
+        if self.__native is not None:
+            raise ValueError(f"Sugar '{self.__title}' declares more than one native semantic!")
+
+        output: str = directive_match.group("output").upper()
+        try:
+            operation: NativeOperation = NativeOperation.compile(directive_match.group("operation"))
+        except CompilationError as exception:
+            raise ValueError(str(exception))
+        operands: tuple[str, ...] = tuple(operand.upper() for operand in directive_match.group("operands").split())
+        if self.__argument_name_to_type.get(output) is not Variable:
+            raise ValueError(f"Native output '{output}' isn't a variable argument of the sugar!")
+        for operand in operands:
+            if self.__argument_name_to_type.get(operand) not in {Variable, Const, Numeric}:
+                raise ValueError(f"Native operand '{operand}' isn't a variable/const/numeric argument of the sugar!")
+        if len(operands) != operation.arity:
+            raise ValueError(f"Native operation {operation} takes {operation.arity} operands, got {len(operands)}")
+
+        self.__native = (output, operation, operands, SourceFrame(self.__title, line_number, directive.strip()))
+
     def __set_implementation(self,
                              implementation: tuple[str, ...]) -> None:
+        self.__native: _Optional[tuple[str, NativeOperation, tuple[str, ...], SourceFrame]] = None
+        line_numbers: list[int] = []
+        pure_implementation: list[str] = []
+        for line, line_number in zip(implementation, self.__line_numbers):
+            if (native_match := _re.fullmatch(r"\s*{\s*NATIVE\s+(?P<output>[A-Z]([A-Z]|\d)*)\s*<\s*-"
+                                              r"\s*(?P<operation>[A-Z]+)(?P<operands>(\s+[A-Z]([A-Z]|\d)*)*)\s*}\s*",
+                                              line,
+                                              flags=_re.IGNORECASE)):
+                self.__set_native(native_match, line_number, line)
+            else:
+                pure_implementation.append(line)
+                line_numbers.append(line_number)
+        implementation = tuple(pure_implementation)
+        self.__line_numbers = line_numbers
+
         repeat_counter: int = 0
         for line in implementation:
             if (match := _re.fullmatch(r"\s*{\s*REPEAT\s+(?P<const_name>[A-Z]([A-Z]|\d)*)\s*}\s*",
@@ -771,9 +1083,16 @@ class SyntacticSugar:
     def __init__(self,
                  usage: str,
                  *implementation: str,
-                 sugars: _Optional[_Sequence["SyntacticSugar"]] = None):
+                 sugars: _Optional[_Sequence["SyntacticSugar"]] = None,
+                 line_numbers: _Optional[_Sequence[int]] = None):
         self.__title: str = usage
         self.__sugars: _Sequence[SyntacticSugar] = [] if sugars is None else sugars
+        self.__line_numbers: _Sequence[int] = (
+            range(1, len(implementation) + 1)
+            if line_numbers is None
+            else
+            line_numbers
+        )
 
         usage = _re.sub(SyntacticSugar._special_chars_pattern, r"\\\g<special_char>", usage.strip())
         self.__create_sugar_args_dict(usage)
@@ -874,13 +1193,14 @@ class SyntacticSugar:
                     instruction.sentence.command.label not in self.__fixes_to_perform
                 ):
                     self.__fixes_to_perform[instruction.sentence.command.label] = self.__label_generator.generate()
-                if (
-                    instruction.sentence.command.variable.name.upper() not in {"X", "Y"} and
-                    instruction.sentence.command.variable not in self.__fixes_to_perform
+                for variable in (
+                    instruction.sentence.command.variables
+                    if type(instruction.sentence.command) is NativeCommand
+                    else
+                    (instruction.sentence.command.variable,)
                 ):
-                    self.__fixes_to_perform[instruction.sentence.command.variable] = (
-                        self.__variable_generator.generate()
-                    )
+                    if variable.name.upper() not in {"X", "Y"} and variable not in self.__fixes_to_perform:
+                        self.__fixes_to_perform[variable] = self.__variable_generator.generate()
 
         def parameter_replacement(self,
                                   parameter: str) -> str:
@@ -899,6 +1219,12 @@ class SyntacticSugar:
                                         self.__fix(instruction.sentence.command.label))
                             if type(instruction.sentence.command) is JumpCommand
                             else
+                            NativeCommand(self.__fix(instruction.sentence.command.variable),
+                                          instruction.sentence.command.operation,
+                                          tuple(self.__fix(operand) if type(operand) is Variable else operand
+                                                for operand in instruction.sentence.command.operands))
+                            if type(instruction.sentence.command) is NativeCommand
+                            else
                             VariableCommand(self.__fix(instruction.sentence.command.variable),
                                             instruction.sentence.command.command_type)
                         ),
@@ -918,10 +1244,31 @@ class SyntacticSugar:
     def __str__(self) -> str:
         return self.__title
 
+    @property
+    def arguments(self) -> dict[str, type]:
+        """
+        The types of the sugar's arguments, by their names (upper-cased).
+        """
+        return dict(self.__argument_name_to_type)
+
+    @property
+    def native(self) -> _Optional[NativeOperation]:
+        return None if self.__native is None else self.__native[1]
+
+    def __native_command(self,
+                         invocation_match: _re.Match) -> _Optional[NativeCommand]:
+        if self.__native is None:
+            return None
+        output, operation, operands, _ = self.__native
+        return NativeCommand(Variable.compile(invocation_match.group(output)),
+                             operation,
+                             tuple(Numeric.compile(invocation_match.group(operand)) for operand in operands))
+
     def __generate_instructions(self,
                                 invocation_match: _re.Match,
-                                code_fixer: _ProgramFixer) -> list[str]:
+                                code_fixer: _ProgramFixer) -> tuple[list[str], list[SourceFrame]]:
         sugar_program_instructions: list[str] = []
+        sugar_program_frames: list[SourceFrame] = []
         repeat_counters: list[int] = []
         repeat_start_indices: list[int] = []
         line_index: int = 0
@@ -953,20 +1300,27 @@ class SyntacticSugar:
                                    line,
                                    flags=_re.IGNORECASE)
                 sugar_program_instructions.append(line)
+                sugar_program_frames.append(SourceFrame(self.__title,
+                                                        self.__line_numbers[line_index],
+                                                        self.__implementation[line_index].strip()))
                 line_index += 1
             else:
                 line_index += 1
 
-        return sugar_program_instructions
+        return sugar_program_instructions, sugar_program_frames
 
-    def compile(self,
-                invocation: str,
-                used_labels: _Optional[set[Label]] = None,
-                used_variables: _Optional[set[Variable]] = None,
-                verbose: bool = False) -> Program:
+    def _compile(self,
+                 invocation: str,
+                 used_labels: _Optional[set[Label]] = None,
+                 used_variables: _Optional[set[Variable]] = None,
+                 verbose: bool = False,
+                 strict: bool = False) -> tuple[Program, list[tuple[SourceFrame, ...]]]:
         if (invocation_match := _re.fullmatch(self.__invocation_regex, invocation)) is None:
             raise CompilationError(f"Failed using sugar {self.__title} to compile line: '{invocation}'")
 
+        if not strict and (native_command := self.__native_command(invocation_match)) is not None:
+            return Program([Instruction(Sentence(native_command))]), [(self.__native[3],)]
+
         program_fixer: SyntacticSugar._ProgramFixer = SyntacticSugar._ProgramFixer(
             [
                 parameter for parameter in self.__parameters(invocation_match)
@@ -978,11 +1332,22 @@ class SyntacticSugar:
 
         program_fixer.process_parameter_fixes()
 
-        sugar_program: Program = Program.compile(*self.__generate_instructions(invocation_match, program_fixer),
-                                                 sugars=self.__sugars,
-                                                 verbose=verbose)
+        sugar_lines, sugar_frames = self.__generate_instructions(invocation_match, program_fixer)
+        sugar_program, sugar_origins = Program._compile(*sugar_lines,
+                                                        sugars=self.__sugars,
+                                                        verbose=verbose,
+                                                        frames=sugar_frames,
+                                                        strict=strict)
         program_fixer.process_program_fixes(sugar_program)
-        return program_fixer.fix_program(sugar_program)
+        return program_fixer.fix_program(sugar_program), sugar_origins
+
+    def compile(self,
+                invocation: str,
+                used_labels: _Optional[set[Label]] = None,
+                used_variables: _Optional[set[Variable]] = None,
+                verbose: bool = False,
+                strict: bool = False) -> Program:
+        return self._compile(invocation, used_labels, used_variables, verbose, strict)[0]
 
     def __parameters(self,
                      invocation_match: _re.Match) -> set[_Union[Label, Variable, Const]]:
@@ -998,12 +1363,15 @@ class SyntacticSugar:
         raise CompilationError(f"Failed to determine sugar parameters of: '{invocation}'")
 
 
-def compile_slang_file(slang_file_path: str,
-                       verbose: bool = False) -> Program:
+def _parse_slang_file(slang_file_path: str) -> tuple[list[SyntacticSugar], _Optional[tuple[list[str], list[int]]]]:
+    """
+    Parses the sugars of the slang file, and the lines of its MAIN section with their line numbers (if it has one).
+    """
     with open(slang_file_path, "r") as file_to_compile:
         file_to_compile_content: list[str] = file_to_compile.readlines()
 
     current_section_lines: list[str] = []
+    current_section_line_numbers: list[int] = []
     current_section_title: str = ""
     sugars: list[SyntacticSugar] = []
     is_main: bool = False
@@ -1022,24 +1390,63 @@ def compile_slang_file(slang_file_path: str,
                 try:
                     sugars.append(SyntacticSugar(current_section_title,
                                                  *current_section_lines,
-                                                 sugars=sugars.copy()))
+                                                 sugars=sugars.copy(),
+                                                 line_numbers=current_section_line_numbers))
                 except ValueError as exception:
                     raise CompilationError(str(exception))
             is_main = bool(_re.fullmatch(r"\s*MAIN\s*",
                                          current_section_title := title_match.group("title").split("#")[0].strip(),
                                          _re.IGNORECASE))
             current_section_lines = []
+            current_section_line_numbers = []
         elif line_match := _re.fullmatch(r"\s*(?P<line>.*)\s*", line):
             current_section_lines.append(line_match.group("line").split("#")[0].strip())
+            current_section_line_numbers.append(line_index + 1)
         else:
             raise CompilationError(f"Failed to compile line {line_index}: '{line}'")
 
-    if not is_main:
+    if is_main:
+        return sugars, (current_section_lines, current_section_line_numbers)
+    if not is_before_first_sugar:
+        try:
+            sugars.append(SyntacticSugar(current_section_title,
+                                         *current_section_lines,
+                                         sugars=sugars.copy(),
+                                         line_numbers=current_section_line_numbers))
+        except ValueError as exception:
+            raise CompilationError(str(exception))
+    return sugars, None
+
+
+def load_sugars(slang_file_path: str) -> list[SyntacticSugar]:
+    """
+    Loads the sugars of the slang file, which doesn't need a MAIN section (e.g. a library of sugars).
+    """
+    return _parse_slang_file(slang_file_path)[0]
+
+
+def compile_slang_file_with_source_map(slang_file_path: str,
+                                       verbose: bool = False,
+                                       strict: bool = False) -> tuple[Program, SourceMap]:
+    """
+    Compiles the slang file alongside the `SourceMap` of its instructions back to the file's lines.
+    """
+    sugars, main_section = _parse_slang_file(slang_file_path)
+    if main_section is None:
         raise CompilationError("Nonexistent 'MAIN' section!")
 
-    return Program.compile(*current_section_lines,
-                           sugars=sugars,
-                           verbose=verbose)
+    main_lines, main_line_numbers = main_section
+    return Program.compile_with_source_map(*main_lines,
+                                           sugars=sugars,
+                                           verbose=verbose,
+                                           line_numbers=main_line_numbers,
+                                           strict=strict)
+
+
+def compile_slang_file(slang_file_path: str,
+                       verbose: bool = False,
+                       strict: bool = False) -> Program:
+    return compile_slang_file_with_source_map(slang_file_path, verbose, strict)[0]
 
 
 def main(cli_args: _Optional[_Sequence[str]] = None) -> None:
@@ -1074,19 +1481,34 @@ def main(cli_args: _Optional[_Sequence[str]] = None) -> None:
                                  "--print",
                                  action="store_true",
                                  help="If present, simply print out the compiled output")
+    argument_parser.add_argument("-m",
+                                 "--source_map",
+                                 type=str,
+                                 default=None,
+                                 help="File to save the source map (compiled instruction -> slang lines) to "
+                                      "(only when compiling a file)")
+    argument_parser.add_argument("-s",
+                                 "--strict",
+                                 action="store_true",
+                                 help="If present, expand sugars with a native semantic into pure S as well "
+                                      "(instead of native instructions)")
     argument_parser.add_argument("-v",
                                  "--verbose",
                                  action="store_true",
                                  help="If present, print additional verbose compilation info")
     arguments: Namespace = argument_parser.parse_args(cli_args)
+    if arguments.source_map is not None and arguments.file is None:
+        argument_parser.error("--source_map requires compiling a file")
 
     start_time: float = time()
-    compiled_program: Program = (
-        compile_slang_file(arguments.file, arguments.verbose)
-        if arguments.decode is None
-        else
-        Program.decode(arguments.decode)
-    )
+    source_map: _Optional[SourceMap] = None
+    compiled_program: Program
+    if arguments.decode is None:
+        compiled_program, source_map = compile_slang_file_with_source_map(arguments.file,
+                                                                          arguments.verbose,
+                                                                          arguments.strict)
+    else:
+        compiled_program = Program.decode(arguments.decode)
 
     time_taken_to_compile: float = time() - start_time
 
@@ -1108,6 +1530,10 @@ def main(cli_args: _Optional[_Sequence[str]] = None) -> None:
     elif arguments.encode:
         print(f"It encodes to the value of {compiled_program.encode()}.")
 
+    if arguments.source_map is not None:
+        source_map.save(arguments.source_map)
+        print(f"Saved source map: \"{arguments.source_map}\"")
+
 
 if __name__ == '__main__':
     main()
@@ -1121,10 +1547,17 @@ __all__ = (
     "JumpCommand",
     "VariableCommandType",
     "VariableCommand",
+    "NativeOperation",
+    "NativeCommand",
     "Sentence",
     "Instruction",
+    "SourceFrame",
+    "SourceMap",
     "Program",
+    "Const",
     "SyntacticSugar",
+    "load_sugars",
+    "compile_slang_file_with_source_map",
     "compile_slang_file",
     "main"
 )
@@ -0,0 +1,103 @@
+from s_interpreter.compiler import Program as _Program
+from s_interpreter.interpreter import (
+    Interpreter as _Interpreter,
+    InterpreterError as _InterpreterError
+)
+from typing import (
+    Any as _Any,
+    Iterable as _Iterable,
+    Iterator as _Iterator,
+    Optional as _Optional,
+    Sequence as _Sequence
+)
+
+_worker_records: _Optional[_Any] = None
+
+
+def _initialize_worker(records: _Any) -> None:
+    global _worker_records
+    _worker_records = records
+
+
+def _dovetail_chunk(encodings: _Sequence[int],
+                    x: _Sequence[int],
+                    max_steps: int,
+                    slice_steps: int) -> None:
+    running: list[tuple[int, _Interpreter]] = []
+    for encoding in encodings:
+        interpreter: _Interpreter = _Interpreter(_Program.decode(encoding))
+        interpreter.reset(*x)
+        running.append((encoding, interpreter))
+
+    while running:
+        still_running: list[tuple[int, _Interpreter]] = []
+        for encoding, interpreter in running:
+            output: _Optional[int] = interpreter.step_n(min(slice_steps,
+                                                            max_steps - interpreter.instructions_performed))
+            if output is not None or interpreter.instructions_performed >= max_steps:
+                _worker_records.put((encoding, output, interpreter.instructions_performed))
+            else:
+                still_running.append((encoding, interpreter))
+        running = still_running
+
+
+def dovetail(encodings: _Iterable[int],
+             x: _Sequence[int] = (),
+             max_steps: int = 1 << 20,
+             slice_steps: int = 1 << 12,
+             workers: _Optional[int] = None,
+             chunksize: int = 64) -> _Iterator[tuple[int, _Optional[int], int]]:
+    """
+    Runs the programs of the encodings (see `Program.decode`) on the input, for at most `max_steps` instructions each,
+    and yields an `(encoding, output, steps)` record for every program as soon as it retires:
+    when it halts (with its output), or when it runs out of steps (with an output of None).
+
+    The encodings are split into chunks of `chunksize` programs, run across a `ProcessPoolExecutor` of `workers`
+    processes. A worker decodes its chunk once and interleaves the runs in slices of `slice_steps` instructions
+    (see `Interpreter.step_n`), so diverging programs never hold up the ones that halt soon after them.
+    Records are sent back through a queue the moment a program retires, in no particular order.
+    """
+    from concurrent.futures import Future, ProcessPoolExecutor
+    import multiprocessing
+    import queue
+
+    if max_steps < 0:
+        raise _InterpreterError("Max steps must be non-negative!")
+    if slice_steps <= 0 or chunksize <= 0:
+        raise _InterpreterError("Slice steps and chunk size must be positive!")
+    if any(value < 0 for value in x):
+        raise _InterpreterError("Given negative input values! Only non-negatives in S!")
+
+    encodings = list(encodings)
+    records: _Any = multiprocessing.Queue()
+    executor: ProcessPoolExecutor = ProcessPoolExecutor(max_workers=workers,
+                                                        initializer=_initialize_worker,
+                                                        initargs=(records,))
+    try:
+        futures: list[Future] = [
+            executor.submit(_dovetail_chunk,
+                            encodings[chunk_start:chunk_start + chunksize],
+                            tuple(x),
+                            max_steps,
+                            slice_steps)
+            for chunk_start in range(0, len(encodings), chunksize)
+        ]
+        for _ in encodings:
+            while True:
+                try:
+                    record: tuple[int, _Optional[int], int] = records.get(timeout=0.1)
+                    break
+                except queue.Empty:
+                    # A chunk that failed never sends the rest of its records
+                    for future in futures:
+                        if future.done() and future.exception() is not None:
+                            raise future.exception()
+            yield record
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        records.close()
+
+
+__all__ = (
+    "dovetail",
+)
@@ -0,0 +1,275 @@
+from s_interpreter.compiler import (
+    CompilationError as _CompilationError,
+    Const as _Const,
+    Instruction as _Instruction,
+    NativeCommand as _NativeCommand,
+    Numeric as _Numeric,
+    Program as _Program,
+    Sentence as _Sentence,
+    SyntacticSugar as _SyntacticSugar,
+    Variable as _Variable
+)
+from s_interpreter.interpreter import (
+    LoweredProgram as _LoweredProgram,
+    Opcode as _Opcode
+)
+from dataclasses import dataclass as _dataclass
+from typing import (
+    Iterator as _Iterator,
+    Optional as _Optional,
+    Sequence as _Sequence
+)
+
+
+# Expansions that the library declares no native semantic for, recognized as the native copies they perform
+COPY_IDIOMS: dict[str, str] = {
+    "{Variable V} <- 0": "{V} <- NATIVE ADD 0 0",
+    "{Variable V1} <- {Numeric V2}": "{V1} <- NATIVE ADD {V2} 0"
+}
+
+
+@_dataclass(frozen=True)
+class Idiom:
+    """
+    The strict expansion of a sugar for one instantiation of its arguments, to be recognized in compiled programs.
+    Its variable arguments are the placeholder variables `X1`...`Xk` of the template (one per distinct argument),
+    as the compiler never renames an X (a Z placeholder may be taken for a temporary of the sugars it expands to),
+    and every Z of the template is a temporary of the expansion.
+    """
+    title: str
+    template: _LoweredProgram
+    native: _NativeCommand
+    parameters: frozenset[_Variable]
+
+
+class IdiomRecognizer:
+    """
+    Recognizes the strict expansions of sugars in programs compiled without them (e.g. decoded binaries),
+    and replaces every one of them with its `NativeCommand`:
+    the native the sugar declares, or for the copies of `COPY_IDIOMS`, a native addition of 0.
+    Const (and numeric) arguments are instantiated with every value of `constants`,
+    as the expansion of a sugar depends on the value of a const.
+
+    An expansion is recognized at a region of the program when the region has the opcodes of the template,
+    its jumps target the same relative instructions, and no jump from outside the region enters its interior.
+    The variables of the region must map injectively to the template's: its arguments to any variables,
+    its X/Y to themselves and its temporaries to Z variables that no instruction outside the region touches
+    (no-ops aside, as they touch nothing).
+    The native instruction is performed as a single instruction, so the instruction counts of a recognized program
+    differ from the original's, as for programs compiled with their native sugars.
+    The native doesn't touch the temporaries either, so their final values differ from those of the original's run
+    (which no instruction outside the region reads, but `Interpreter.variables` shows).
+    """
+
+    def __init__(self,
+                 sugars: _Sequence[_SyntacticSugar],
+                 constants: _Sequence[int] = range(4)):
+        self.__idioms: list[Idiom] = []
+        seen_templates: set[tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]] = set()
+        for title, native in [
+            *((sugar.title, None) for sugar in sugars if sugar.native is not None),
+            *COPY_IDIOMS.items()
+        ]:
+            for idiom in IdiomRecognizer.__title_idioms(title, native, sugars, constants):
+                key: tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]] = (
+                    tuple(idiom.template.opcodes),
+                    tuple(idiom.template.slots),
+                    tuple(idiom.template.targets)
+                )
+                if key not in seen_templates:
+                    seen_templates.add(key)
+                    self.__idioms.append(idiom)
+        # Longer templates first, so a sugar is recognized before the sugars it's built of
+        self.__idioms.sort(key=lambda idiom: len(idiom.template.opcodes), reverse=True)
+
+        self.__idioms_by_opcode: dict[int, list[Idiom]] = {}
+        for idiom in self.__idioms:
+            self.__idioms_by_opcode.setdefault(idiom.template.opcodes[0], []).append(idiom)
+
+    @property
+    def idioms(self) -> tuple[Idiom, ...]:
+        return tuple(self.__idioms)
+
+    @staticmethod
+    def __partitions(names: list[str]) -> _Iterator[list[list[str]]]:
+        if not names:
+            yield []
+            return
+        for partition in IdiomRecognizer.__partitions(names[1:]):
+            yield [[names[0]], *partition]
+            for block_index in range(len(partition)):
+                yield [*partition[:block_index], [names[0], *partition[block_index]], *partition[block_index + 1:]]
+
+    @staticmethod
+    def __title_idioms(title: str,
+                       native: _Optional[str],
+                       sugars: _Sequence[_SyntacticSugar],
+                       constants: _Sequence[int]) -> _Iterator[Idiom]:
+        """
+        The idioms of a sugar usage title, for the sugar's own native (when `native` is None),
+        or for the given native pattern (with the arguments in braces).
+        """
+        from itertools import product
+        import re
+
+        arguments: dict[str, type] = _SyntacticSugar(title).arguments
+        if any(argument_type not in {_Variable, _Const, _Numeric} for argument_type in arguments.values()):
+            return
+
+        # Numeric arguments may be variables (None) or consts
+        for values in product(*(
+                constants if argument_type is _Const else [None, *constants] if argument_type is _Numeric else [None]
+                for argument_type in arguments.values()
+        )):
+            consts: dict[str, int] = {name: value for name, value in zip(arguments, values) if value is not None}
+            # The expansion of a sugar may depend on which of its arguments alias, so every aliasing gets its template
+            for partition in IdiomRecognizer.__partitions([name for name in arguments if name not in consts]):
+                placeholders: dict[str, _Variable] = {
+                    name: _Variable("X", block_index + 1)
+                    for block_index, block in enumerate(partition)
+                    for name in block
+                }
+                substitutions: dict[str, str] = {
+                    **{name: str(placeholder) for name, placeholder in placeholders.items()},
+                    **{name: str(value) for name, value in consts.items()}
+                }
+                invocation: str = re.sub(_SyntacticSugar._sugar_arguments_pattern,
+                                         lambda match: substitutions[match.group("variable_name").upper()],
+                                         title)
+                try:
+                    template: _LoweredProgram = _LoweredProgram(_Program.compile(invocation,
+                                                                                 sugars=sugars,
+                                                                                 strict=True))
+                    if native is None:
+                        native_program: _Program = _Program.compile(invocation, sugars=sugars)
+                        if (
+                            len(native_program.instructions) != 1 or
+                            type(native_program.instructions[0].sentence.command) is not _NativeCommand
+                        ):
+                            continue
+                        native_command: _NativeCommand = native_program.instructions[0].sentence.command
+                    else:
+                        native_command = _NativeCommand.compile(
+                            re.sub(r"{\s*(?P<name>[A-Z]([A-Z]|\d)*)\s*}",
+                                   lambda match: substitutions[match.group("name").upper()],
+                                   native,
+                                   flags=re.IGNORECASE)
+                        )
+                except (_CompilationError, ValueError):
+                    continue
+
+                if (
+                    # A single instruction is as fast as the native replacing it
+                    len(template.opcodes) - 1 < 2 or
+                    any(opcode == _Opcode.Native for opcode in template.opcodes) or
+                    # A jump out of the expansion halts the program, which its native can't
+                    any(opcode == _Opcode.Jump and target == len(template.opcodes) - 1
+                        for opcode, target in zip(template.opcodes, template.targets))
+                ):
+                    continue
+                yield Idiom(title, template, native_command, frozenset(placeholders.values()))
+
+    @staticmethod
+    def __slot_references(lowered: _LoweredProgram) -> list[int]:
+        references: list[int] = [0] * len(lowered.variables)
+        for opcode, slot in zip(lowered.opcodes[:-1], lowered.slots):
+            if opcode != _Opcode.NoOp:
+                references[slot] += 1
+        for native in lowered.natives:
+            if native is not None:
+                for operand in native.operands:
+                    if operand >= 0:
+                        references[operand] += 1
+        return references
+
+    def __match(self,
+                idiom: Idiom,
+                lowered: _LoweredProgram,
+                start: int,
+                references: list[int],
+                entrances: list[tuple[int, int]]) -> _Optional[_NativeCommand]:
+        template: _LoweredProgram = idiom.template
+        length: int = len(template.opcodes) - 1
+        end: int = start + length
+        if end > len(lowered.opcodes) - 1 or lowered.opcodes[start:end] != template.opcodes[:-1]:
+            return None
+        # The interior may only be entered by the region's own jumps
+        if any(first_source < start or last_source >= end for first_source, last_source in entrances[start + 1:end]):
+            return None
+
+        mapping: dict[int, int] = {}
+        region_references: dict[int, int] = {}
+        for offset in range(length):
+            opcode: int = template.opcodes[offset]
+            if opcode == _Opcode.NoOp:
+                continue
+            if opcode == _Opcode.Jump and lowered.targets[start + offset] != start + template.targets[offset]:
+                return None
+            template_slot: int = template.slots[offset]
+            slot: int = lowered.slots[start + offset]
+            if mapping.setdefault(template_slot, slot) != slot:
+                return None
+            region_references[slot] = region_references.get(slot, 0) + 1
+        if len(set(mapping.values())) != len(mapping):
+            return None
+
+        for template_slot, slot in mapping.items():
+            template_variable: _Variable = template.variables[template_slot]
+            variable: _Variable = lowered.variables[slot]
+            if template_variable in idiom.parameters:
+                continue
+            if template_variable.name.upper() in {"X", "Y"}:
+                if template_variable != variable:
+                    return None
+            elif variable.name.upper() != "Z" or references[slot] != region_references[slot]:
+                return None
+
+        variables: dict[_Variable, _Variable] = {
+            template.variables[template_slot]: lowered.variables[slot]
+            for template_slot, slot in mapping.items()
+        }
+        if any(variable not in variables for variable in idiom.native.variables):
+            return None
+        return _NativeCommand(variables[idiom.native.variable],
+                              idiom.native.operation,
+                              tuple(variables[operand] if type(operand) is _Variable else operand
+                                    for operand in idiom.native.operands))
+
+    def recognize(self,
+                  program: _Program) -> _Program:
+        """
+        Returns the program with every recognized expansion replaced by its native instruction
+        (scanning from the start, and preferring the longest template at every instruction).
+        """
+        lowered: _LoweredProgram = _LoweredProgram(program)
+        references: list[int] = IdiomRecognizer.__slot_references(lowered)
+        # The first and last jumps to every instruction
+        entrances: list[tuple[int, int]] = [(len(lowered.opcodes), -1)] * len(lowered.opcodes)
+        for source, (opcode, target) in enumerate(zip(lowered.opcodes, lowered.targets)):
+            if opcode == _Opcode.Jump:
+                entrances[target] = (min(entrances[target][0], source), source)
+
+        instructions: list[_Instruction] = []
+        instruction_index: int = 0
+        while instruction_index < len(program.instructions):
+            for idiom in self.__idioms_by_opcode.get(lowered.opcodes[instruction_index], []):
+                if (native_command := self.__match(idiom,
+                                                   lowered,
+                                                   instruction_index,
+                                                   references,
+                                                   entrances)) is not None:
+                    instructions.append(_Instruction(_Sentence(native_command),
+                                                     program.instructions[instruction_index].label))
+                    instruction_index += len(idiom.template.opcodes) - 1
+                    break
+            else:
+                instructions.append(program.instructions[instruction_index])
+                instruction_index += 1
+        return _Program(instructions)
+
+
+__all__ = (
+    "COPY_IDIOMS",
+    "Idiom",
+    "IdiomRecognizer"
+)
@@ -1,7 +1,22 @@
-from s_interpreter.compiler import Program as _Program
+from s_interpreter.cache import ResultCache as _ResultCache
+from s_interpreter.compiler import (
+    NativeOperation as _NativeOperation,
+    Program as _Program
+)
+from s_interpreter.lazy import EncodedProgram as _EncodedProgram
+from s_interpreter.profiler import Profile as _Profile
+from s_interpreter.trace import TraceWriter as _TraceWriter
+from collections.abc import Mapping as _Mapping
+from dataclasses import dataclass as _dataclass
+import enum as _enum
 from typing import (
+    Any as _Any,
+    ClassVar as _ClassVar,
+    Container as _Container,
+    Iterator as _Iterator,
     Sequence as _Sequence,
-    Optional as _Optional
+    Optional as _Optional,
+    Union as _Union
 )
 
 
@@ -9,120 +24,2248 @@ class InterpreterError(RuntimeError):
     pass
 
 
+class ExecutionInterrupted(InterpreterError):
+    """
+    Raised when a run stops before the program halts.
+    Holds the state the interpreter stopped in, which is also left in the interpreter itself
+    (so that the run may be continued with `Interpreter.resume`).
+    """
+
+    def __init__(self,
+                 message: str,
+                 instructions_performed: int,
+                 instruction_index: int,
+                 variables: dict[str, int]):
+        super().__init__(message)
+        self.instructions_performed: int = instructions_performed
+        self.instruction_index: int = instruction_index
+        self.variables: dict[str, int] = variables
+        self.profile: _Optional[_Profile] = None
+
+
+class FuelExhausted(ExecutionInterrupted):
+    pass
+
+
+class DeadlineExceeded(ExecutionInterrupted):
+    pass
+
+
+class NativeDivergence(ExecutionInterrupted):
+    """
+    Raised when a native instruction is reached with operands its sugar never halts on (e.g. dividing by 0).
+    The run is left standing on that instruction.
+    """
+    pass
+
+
+class CycleDetected(ExecutionInterrupted):
+    """
+    Raised when a run with cycle detection gets back to an exact state (instruction index and variables) it was in,
+    which proves that the program never halts on its input.
+    `period` is the amount of instructions performed between the two visits of the state.
+    """
+
+    def __init__(self,
+                 message: str,
+                 instructions_performed: int,
+                 instruction_index: int,
+                 variables: dict[str, int],
+                 period: int = 0):
+        super().__init__(message, instructions_performed, instruction_index, variables)
+        self.period: int = period
+
+
+class BreakpointHit(ExecutionInterrupted):
+    """
+    Raised when a run reaches a breakpoint (see `Interpreter.set_breakpoint`), before performing its instruction.
+    Resuming the run continues past it.
+    """
+    pass
+
+
+class WatchpointHit(ExecutionInterrupted):
+    """
+    Raised right after an instruction triggers a watchpoint (see `Interpreter.set_watchpoint`).
+    `variable` is the watched variable, and `previous_value` its value before the instruction.
+    """
+
+    def __init__(self,
+                 message: str,
+                 instructions_performed: int,
+                 instruction_index: int,
+                 variables: dict[str, int],
+                 variable: str = "",
+                 previous_value: int = 0):
+        super().__init__(message, instructions_performed, instruction_index, variables)
+        self.variable: str = variable
+        self.previous_value: int = previous_value
+
+
+class Opcode(_enum.IntEnum):
+    NoOp = 0
+    Increment = 1
+    Decrement = 2
+    Jump = 3
+    Halt = 4
+    Loop = 5
+    Native = 6
+    Goto = 7
+    Clear = 8
+    Skip = 9
+    Block = 10
+    Decode = 11
+
+
+@_dataclass(frozen=True)
+class Superinstruction:
+    """
+    A fixed idiom of the expanded code, performed with a single dispatch:
+    - `Goto`: the `GOTO L` sugar, `Z <- Z + 1; IF Z != 0 GOTO L`, which always jumps.
+    - `Skip`: a run of `Y <- Y` no-ops (e.g. the placeholders of labelled sugars).
+    It performs `length` instructions (including the no-ops a `Goto` lands on), and continues at `next_index`.
+    """
+    opcode: Opcode
+    next_index: int
+    length: int
+
+
+@_dataclass(frozen=True)
+class BasicBlock:
+    """
+    A straight-line run of increments, decrements and no-ops from a block leader (the start of the program,
+    a jump target or the instruction after a jump), along with the jump that ends it (if any).
+
+    The net effect of the run on every variable it touches is `v -> max(v + shift, floor)`
+    (the saturating decrements of S compose into the floor), so the whole block is applied at once:
+    `shifts` holds the variables whose floor never applies, and `effects` the `(slot, shift, floor)` of the rest.
+    """
+    start: int
+    end: int
+    shifts: tuple[tuple[int, int], ...]
+    effects: tuple[tuple[int, int, int], ...]
+    jump_slot: int
+    target: int
+
+    MIN_LENGTH: _ClassVar[int] = 3
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start
+
+    def apply(self,
+              registers: list[int]) -> int:
+        """
+        Applies the block to the registers, and returns the index of the instruction to continue at.
+        """
+        for slot, shift in self.shifts:
+            registers[slot] += shift
+        for slot, shift, floor in self.effects:
+            registers[slot] = max(registers[slot] + shift, floor)
+        return self.target if self.jump_slot >= 0 and registers[self.jump_slot] else self.end
+
+    @staticmethod
+    def detect(opcodes: _Sequence[int],
+               slots: _Sequence[int],
+               targets: _Sequence[int],
+               leaders: _Container[int],
+               start: int) -> _Optional["BasicBlock"]:
+        effects: dict[int, tuple[int, int]] = {}
+        end: int = start
+        while opcodes[end] in {Opcode.NoOp, Opcode.Increment, Opcode.Decrement} and (end == start or end not in leaders):
+            if opcodes[end] != Opcode.NoOp:
+                # Composing `v -> max(v + shift, floor)` with `v -> max(v +- 1, 0)`
+                shift, floor = effects.get(slots[end], (0, 0))
+                step: int = 1 if opcodes[end] == Opcode.Increment else -1
+                effects[slots[end]] = (shift + step, max(floor + step, 0))
+            end += 1
+
+        if end - start < BasicBlock.MIN_LENGTH:
+            return None
+
+        jump_slot: int = -1
+        target: int = 0
+        if opcodes[end] == Opcode.Jump and end not in leaders:
+            jump_slot, target = slots[end], targets[end]
+            end += 1
+
+        return BasicBlock(start,
+                          end,
+                          tuple((slot, shift) for slot, (shift, floor) in effects.items() if shift >= floor),
+                          tuple((slot, shift, floor) for slot, (shift, floor) in effects.items() if shift < floor),
+                          jump_slot,
+                          target)
+
+
+@_dataclass(frozen=True)
+class NativeCall:
+    """
+    The operation of a native instruction, and its operands: the slot of a variable operand,
+    or `-(value + 1)` for a const operand.
+    """
+    operation: _NativeOperation
+    operands: tuple[int, ...]
+
+    def evaluate(self,
+                 registers: list[int]) -> _Optional[int]:
+        return self.operation.evaluate(*(
+            registers[operand] if operand >= 0 else -operand - 1
+            for operand in self.operands
+        ))
+
+
+@_dataclass(frozen=True)
+class LoopSummary:
+    """
+    A loop whose body only increments/decrements variables and that jumps back to its head on a single counter,
+    e.g. the transfer loop `[A] X <- X - 1; Y <- Y + 1; IF X != 0 GOTO A`.
+
+    The counter is decremented (and never incremented) on every iteration, so the number of iterations
+    is known on entry and the effect of the whole loop can be applied at once.
+    Every other variable is either only incremented or only decremented in the body,
+    which keeps the saturating decrement of S exact (a decremented variable simply floors at 0).
+    """
+    head: int
+    tail: int
+    counter: int
+    counter_decrements: int
+    increments: tuple[tuple[int, int], ...]
+    decrements: tuple[tuple[int, int], ...]
+
+    @property
+    def length(self) -> int:
+        return self.tail - self.head + 1
+
+    def iterations(self,
+                   registers: list[int]) -> int:
+        return max(1, -(-registers[self.counter] // self.counter_decrements))
+
+    def apply(self,
+              registers: list[int],
+              iterations: int) -> None:
+        registers[self.counter] = 0
+        for slot, amount in self.increments:
+            registers[slot] += amount * iterations
+        for slot, amount in self.decrements:
+            registers[slot] = max(registers[slot] - amount * iterations, 0)
+
+    @staticmethod
+    def detect(opcodes: _Sequence[int],
+               slots: _Sequence[int],
+               targets: _Sequence[int],
+               tail: int) -> _Optional["LoopSummary"]:
+        head: int = targets[tail]
+        if opcodes[tail] != Opcode.Jump or head > tail:
+            return None
+
+        increments: dict[int, int] = {}
+        decrements: dict[int, int] = {}
+        for instruction_index in range(head, tail):
+            if opcodes[instruction_index] in {Opcode.Jump, Opcode.Native}:
+                return None
+            if opcodes[instruction_index] == Opcode.Increment:
+                increments[slots[instruction_index]] = increments.get(slots[instruction_index], 0) + 1
+            elif opcodes[instruction_index] == Opcode.Decrement:
+                decrements[slots[instruction_index]] = decrements.get(slots[instruction_index], 0) + 1
+
+        counter: int = slots[tail]
+        if counter in increments or counter not in decrements or increments.keys() & decrements.keys():
+            return None
+
+        return LoopSummary(head,
+                           tail,
+                           counter,
+                           decrements.pop(counter),
+                           tuple(increments.items()),
+                           tuple(decrements.items()))
+
+
+class LoweredProgram:
+    """
+    A program lowered once into flat integer arrays, to be executed without touching the dataclass tree.
+
+    Every instruction is described by its opcode, the slot of its variable in the register file and the index
+    of the instruction to jump to (only meaningful for jumps).
+    Native instructions write their result to the slot of their variable, and are described by a `NativeCall`.
+    Jumps to nonexistent labels target the end of the program, where a single trailing `Halt` is placed,
+    so that the arrays are one element longer than the program itself.
+
+    An `EncodedProgram` is lowered lazily instead: its instructions are `Decode` until `decode` is called on them
+    (which the interpreter does the first time a run reaches one), and its variables get their slots as they're met.
+    The arrays then cover the instructions decoded so far and the ones right after them,
+    and the trailing `Halt` is only placed once the end of the program is found.
+    Nothing is summarized, so a lazily lowered program runs on the plain execution alone.
+    """
+    from s_interpreter.compiler import (
+        Label as _Label,
+        Variable as _Variable
+    )
+
+    def __init__(self,
+                 program: _Union[_Program, _EncodedProgram]):
+        from s_interpreter.compiler import Variable, JumpCommand, NativeCommand
+
+        self.__encoded: _Optional[_EncodedProgram] = None
+        if type(program) is _EncodedProgram:
+            self.__lower_lazily(program)
+            return
+
+        slot_map: dict[Variable, int] = {Variable("Y", 1): 0}
+        for instruction in program.instructions:
+            for variable in (
+                instruction.sentence.command.variables
+                if type(instruction.sentence.command) is NativeCommand
+                else
+                (instruction.sentence.command.variable,)
+            ):
+                slot_map.setdefault(variable, len(slot_map))
+        self.__variables: tuple[Variable, ...] = tuple(slot_map)
+
+        self.__opcodes: list[int] = []
+        self.__slots: list[int] = []
+        self.__labels: list[int] = []
+        self.__jump_labels: list[int] = []
+        self.__native_calls: list[list[int]] = []
+        for instruction_index, instruction in enumerate(program.instructions):
+            command = instruction.sentence.command
+            self.__slots.append(slot_map[command.variable])
+            self.__labels.append(0 if instruction.label is None else instruction.label.encode())
+            if type(command) is JumpCommand:
+                self.__opcodes.append(Opcode.Jump.value)
+                self.__jump_labels.append(command.label.encode())
+            elif type(command) is NativeCommand:
+                self.__opcodes.append(Opcode.Native.value)
+                self.__jump_labels.append(0)
+                self.__native_calls.append([
+                    instruction_index,
+                    command.operation.value,
+                    *(slot_map[operand] if type(operand) is Variable else -operand.value - 1
+                      for operand in command.operands)
+                ])
+            else:
+                self.__opcodes.append(command.command_type.value)
+                self.__jump_labels.append(0)
+
+        self.__derive()
+
+    def __derive(self) -> None:
+        from s_interpreter.compiler import Label
+
+        program_length: int = len(self.__labels)
+        label_indices: dict[int, int] = {}
+        for instruction_index, label in enumerate(self.__labels):
+            if label != 0:
+                label_indices.setdefault(label, instruction_index)
+        self.__label_map: dict[LoweredProgram._Label, int] = {
+            Label.decode(label): instruction_index
+            for label, instruction_index in label_indices.items()
+        }
+
+        self.__input_slots: dict[int, int] = {
+            variable.index: slot
+            for slot, variable in enumerate(self.__variables)
+            if variable.name.upper() == "X"
+        }
+        self.__variable_names: tuple[str, ...] = tuple(str(variable) for variable in self.__variables)
+        self.__variable_slots: dict[str, int] = {
+            variable_name: slot
+            for slot, variable_name in enumerate(self.__variable_names)
+        }
+
+        self.__targets: list[int] = [
+            label_indices.get(jump_label, program_length) if opcode == Opcode.Jump else 0
+            for opcode, jump_label in zip(self.__opcodes, self.__jump_labels)
+        ]
+
+        self.__opcodes.append(Opcode.Halt.value)
+        self.__slots.append(0)
+        self.__targets.append(0)
+
+        self.__natives: list[_Optional[NativeCall]] = [None] * len(self.__opcodes)
+        for instruction_index, operation, *operands in self.__native_calls:
+            self.__natives[instruction_index] = NativeCall(_NativeOperation(operation), tuple(operands))
+
+        self.__loops: dict[int, LoopSummary] = {}
+        for instruction_index in range(program_length):
+            if (loop := LoopSummary.detect(self.__opcodes,
+                                           self.__slots,
+                                           self.__targets,
+                                           instruction_index)) is not None:
+                self.__loops.setdefault(loop.head, loop)
+
+        no_op_runs: list[int] = [0] * len(self.__opcodes)
+        for instruction_index in reversed(range(program_length)):
+            if self.__opcodes[instruction_index] == Opcode.NoOp:
+                no_op_runs[instruction_index] = no_op_runs[instruction_index + 1] + 1
+
+        self.__superinstructions: dict[int, Superinstruction] = {}
+        for instruction_index in range(program_length):
+            if no_op_runs[instruction_index] > 1:
+                self.__superinstructions[instruction_index] = Superinstruction(
+                    Opcode.Skip,
+                    instruction_index + no_op_runs[instruction_index],
+                    no_op_runs[instruction_index]
+                )
+            elif (
+                self.__opcodes[instruction_index] == Opcode.Increment and
+                self.__opcodes[instruction_index + 1] == Opcode.Jump and
+                self.__slots[instruction_index] == self.__slots[instruction_index + 1]
+            ):
+                target: int = self.__targets[instruction_index + 1]
+                self.__superinstructions[instruction_index] = Superinstruction(Opcode.Goto,
+                                                                               target + no_op_runs[target],
+                                                                               2 + no_op_runs[target])
+
+        leaders: set[int] = {0}
+        for instruction_index in range(program_length):
+            if self.__opcodes[instruction_index] in {Opcode.Jump, Opcode.Native}:
+                leaders.update((self.__targets[instruction_index], instruction_index + 1))
+        leaders.update(index for index, native in enumerate(self.__natives) if native is not None)
+        self.__blocks: dict[int, BasicBlock] = {}
+        for leader in sorted(leaders):
+            if leader < program_length and (block := BasicBlock.detect(self.__opcodes,
+                                                                        self.__slots,
+                                                                        self.__targets,
+                                                                        leaders,
+                                                                        leader)) is not None:
+                self.__blocks[leader] = block
+
+        self.__digest: _Optional[str] = None
+
+    def __lower_lazily(self,
+                       program: _EncodedProgram) -> None:
+        from s_interpreter.compiler import Variable
+
+        self.__encoded = program
+        self.__ended: bool = False
+        # Lists rather than tuples, so that views of the variables see the ones met later
+        self.__variables: list[Variable] = [Variable("Y", 1)]
+        self.__variable_names: list[str] = ["Y"]
+        self.__variable_slots: dict[str, int] = {"Y": 0}
+        self.__input_slots: dict[int, int] = {}
+        self.__label_map: dict[LoweredProgram._Label, int] = {}
+
+        self.__opcodes: list[int] = []
+        self.__slots: list[int] = []
+        self.__targets: list[int] = []
+        self.__labels: list[int] = []
+        self.__jump_labels: list[int] = []
+        self.__native_calls: list[list[int]] = []
+        self.__natives: list[_Optional[NativeCall]] = []
+        self.__cover(0)
+        self.__end()
+
+        self.__loops: dict[int, LoopSummary] = {}
+        self.__superinstructions: dict[int, Superinstruction] = {}
+        self.__blocks: dict[int, BasicBlock] = {}
+        self.__digest: _Optional[str] = None
+
+    def __cover(self,
+                instruction_index: int) -> None:
+        # The arrays are only ever extended in place, as the interpreter runs on the opcodes list itself
+        missing: int = instruction_index + 1 - len(self.__opcodes)
+        if missing > 0:
+            self.__opcodes.extend([Opcode.Decode.value] * missing)
+            self.__slots.extend([0] * missing)
+            self.__targets.extend([0] * missing)
+            self.__labels.extend([0] * missing)
+            self.__jump_labels.extend([0] * missing)
+            self.__natives.extend([None] * missing)
+
+    def __end(self) -> None:
+        if not self.__ended and (program_length := self.__encoded.length) is not None:
+            self.__cover(program_length)
+            self.__opcodes[program_length] = Opcode.Halt.value
+            self.__ended = True
+
+    @property
+    def encoded(self) -> _Optional[_EncodedProgram]:
+        """
+        The encoded program, if lowered lazily.
+        """
+        return self.__encoded
+
+    def slot(self,
+             variable: _Variable) -> int:
+        """
+        Returns the register slot of the variable, giving it the next one if it's new to a lazily lowered program.
+        """
+        variable_name: str = str(variable)
+        if (slot := self.__variable_slots.get(variable_name)) is None:
+            if self.__encoded is None:
+                raise InterpreterError(f"The program has no variable {variable_name}!")
+            slot = self.__variable_slots[variable_name] = len(self.__variables)
+            self.__variables.append(variable)
+            self.__variable_names.append(variable_name)
+            if variable.name.upper() == "X":
+                self.__input_slots[variable.index] = slot
+        return slot
+
+    def decode(self,
+               instruction_index: int) -> None:
+        """
+        Lowers the instruction at the index of a lazily lowered program, unless it already was
+        (or the program was fully lowered), resolving its jump target and finding the end of the program if it's there.
+        """
+        from s_interpreter.compiler import JumpCommand
+
+        if self.__encoded is None or (
+            instruction_index < len(self.__opcodes) and self.__opcodes[instruction_index] != Opcode.Decode
+        ):
+            return
+
+        instruction = self.__encoded.instruction(instruction_index)
+        if instruction is not None:
+            # A run continues to the next instruction, so it must be in the arrays (if only as `Decode`)
+            self.__cover(instruction_index + 1)
+            command = instruction.sentence.command
+            self.__slots[instruction_index] = self.slot(command.variable)
+            if instruction.label is not None:
+                self.__labels[instruction_index] = instruction.label.encode()
+                self.__label_map.setdefault(instruction.label, self.__encoded.label_index(instruction.label))
+            if type(command) is JumpCommand:
+                target: int = self.__encoded.label_index(command.label)
+                self.__cover(target)
+                self.__targets[instruction_index] = target
+                self.__jump_labels[instruction_index] = command.label.encode()
+                self.__opcodes[instruction_index] = Opcode.Jump.value
+            else:
+                self.__opcodes[instruction_index] = command.command_type.value
+        self.__end()
+
+    def __getstate__(self) -> dict[str, list]:
+        if self.__encoded is not None:
+            raise InterpreterError("A lazily lowered program can't be pickled (lower its decoded program instead)!")
+
+        # Only the flat arrays are pickled, everything else is derived from them again when unpickled
+        state: dict[str, list] = {
+            "variables": [variable.encode() for variable in self.__variables],
+            "opcodes": self.__opcodes[:-1],
+            "slots": self.__slots[:-1],
+            "labels": self.__labels,
+            "jump_labels": self.__jump_labels
+        }
+        if self.__native_calls:
+            state["natives"] = self.__native_calls
+        return state
+
+    def __setstate__(self,
+                     state: dict[str, list[int]]) -> None:
+        from s_interpreter.compiler import Variable
+
+        self.__encoded = None
+        self.__variables = tuple(Variable.decode(variable) for variable in state["variables"])
+        self.__opcodes = list(state["opcodes"])
+        self.__slots = list(state["slots"])
+        self.__labels = list(state["labels"])
+        self.__jump_labels = list(state["jump_labels"])
+        self.__native_calls = [list(native_call) for native_call in state.get("natives", [])]
+        self.__derive()
+
+    def digest(self) -> str:
+        """
+        A structural hash of the lowered program (including the register slot of every variable).
+        """
+        from hashlib import sha256
+
+        if self.__digest is None:
+            self.__digest = sha256(
+                # A lazily lowered program is only known by its encoding
+                format(self.__encoded.encoding, "x").encode()
+                if self.__encoded is not None
+                else
+                repr(self.__getstate__()).encode()
+            ).hexdigest()
+        return self.__digest
+
+    def to_program(self) -> _Program:
+        from s_interpreter.compiler import (
+            Const,
+            Instruction,
+            JumpCommand,
+            Label,
+            NativeCommand,
+            Sentence,
+            VariableCommand,
+            VariableCommandType
+        )
+
+        if self.__encoded is not None:
+            return self.__encoded.to_program()
+        return _Program([
+            Instruction(
+                Sentence(
+                    JumpCommand(self.__variables[slot], Label.decode(jump_label))
+                    if opcode == Opcode.Jump
+                    else
+                    NativeCommand(self.__variables[slot],
+                                  native.operation,
+                                  tuple(self.__variables[operand] if operand >= 0 else Const(-operand - 1)
+                                        for operand in native.operands))
+                    if opcode == Opcode.Native
+                    else
+                    VariableCommand(self.__variables[slot], VariableCommandType(opcode))
+                ),
+                None if label == 0 else Label.decode(label)
+            )
+            for opcode, slot, label, jump_label, native in zip(self.__opcodes,
+                                                               self.__slots,
+                                                               self.__labels,
+                                                               self.__jump_labels,
+                                                               self.__natives)
+        ])
+
+    @property
+    def variables(self) -> _Sequence[_Variable]:
+        return self.__variables
+
+    @property
+    def variable_names(self) -> _Sequence[str]:
+        return self.__variable_names
+
+    @property
+    def variable_slots(self) -> dict[str, int]:
+        return self.__variable_slots
+
+    @property
+    def input_slots(self) -> dict[int, int]:
+        return self.__input_slots
+
+    @property
+    def label_map(self) -> dict[_Label, int]:
+        return self.__label_map
+
+    @property
+    def labels(self) -> list[int]:
+        return self.__labels
+
+    @property
+    def jump_labels(self) -> list[int]:
+        return self.__jump_labels
+
+    @property
+    def opcodes(self) -> list[int]:
+        return self.__opcodes
+
+    @property
+    def slots(self) -> list[int]:
+        return self.__slots
+
+    @property
+    def targets(self) -> list[int]:
+        return self.__targets
+
+    @property
+    def loops(self) -> dict[int, LoopSummary]:
+        return self.__loops
+
+    @property
+    def natives(self) -> list[_Optional[NativeCall]]:
+        return self.__natives
+
+    @property
+    def superinstructions(self) -> dict[int, Superinstruction]:
+        return self.__superinstructions
+
+    @property
+    def blocks(self) -> dict[int, BasicBlock]:
+        return self.__blocks
+
+    def __len__(self) -> int:
+        if self.__encoded is not None and not self.__ended:
+            # Past every instruction lowered so far, so that no run halts before finding the end
+            return len(self.__opcodes)
+        return len(self.__opcodes) - 1
+
+
+class VariablesView(_Mapping):
+    """
+    A read-only mapping of the variable names to their values, reading the live register file of an interpreter,
+    so accessing it copies nothing and always sees the current values.
+    `deltas` yields only the variables that changed between observation points.
+    """
+
+    def __init__(self,
+                 variable_names: _Sequence[str],
+                 variable_slots: dict[str, int],
+                 registers: list[int]):
+        self.__variable_names: _Sequence[str] = variable_names
+        self.__variable_slots: dict[str, int] = variable_slots
+        self.__registers: list[int] = registers
+        self.__observed: list[int] = list(registers)
+
+    def __getitem__(self,
+                    variable_name: str) -> int:
+        return self.__registers[self.__variable_slots[variable_name]]
+
+    def __contains__(self,
+                     variable_name: _Any) -> bool:
+        return variable_name in self.__variable_slots
+
+    def __iter__(self) -> _Iterator[str]:
+        return iter(self.__variable_names)
+
+    def __len__(self) -> int:
+        return len(self.__variable_names)
+
+    def deltas(self) -> _Iterator[tuple[str, int]]:
+        """
+        Returns an iterator over the `(variable, value)` of every variable whose value changed since the previous call
+        (or since the view was created), and makes the current values the ones the next call compares to.
+        Variables a lazily lowered program (see `LoweredProgram`) met since count as changed.
+        """
+        from itertools import chain, compress, repeat
+        from operator import ne
+
+        # Compared and selected by C iterators, as the register file may hold thousands of variables
+        deltas: list[tuple[str, int]] = list(compress(zip(self.__variable_names, self.__registers),
+                                                      map(ne, self.__registers, chain(self.__observed, repeat(None)))))
+        self.__observed[:] = self.__registers
+        return iter(deltas)
+
+
+class _CycleDetector:
+    """
+    Brent's cycle detection over the states a run is sampled in, between windows of execution.
+    A window is a function of the state it starts in, so the sampled states eventually cycle when the run does,
+    and then the state saved at the last power of 2 comes up again.
+    The states are compared by hash first, and exactly only when the hashes match.
+    """
+
+    def __init__(self):
+        self.__state: _Optional[tuple[int, ...]] = None
+        self.__state_hash: int = 0
+        self.__instructions_performed: int = 0
+        self.__power: int = 1
+        self.__length: int = 0
+
+    def sample(self,
+               instruction_index: int,
+               registers: list[int],
+               instructions_performed: int) -> _Optional[int]:
+        """
+        Returns the amount of instructions since the state was last saved if the run is back in it, and None otherwise.
+        """
+        state: tuple[int, ...] = (instruction_index, *registers)
+        state_hash: int = hash(state)
+        if self.__state is not None and state_hash == self.__state_hash and state == self.__state:
+            return instructions_performed - self.__instructions_performed
+
+        self.__length += 1
+        if self.__state is None or self.__length == self.__power:
+            self.__state, self.__state_hash, self.__instructions_performed = state, state_hash, instructions_performed
+            self.__power *= 2
+            self.__length = 0
+        return None
+
+
+class _RunHistory:
+    """
+    Snapshots `(instructions performed, instruction index, registers)` of a run, at least `interval` instructions apart,
+    sorted by the amount of instructions performed. Any earlier state of the run is recomputed from the nearest
+    snapshot before it, as the execution is deterministic.
+    Beyond `max_snapshots`, every other snapshot is evicted and the interval doubles,
+    so the snapshots keep covering the whole run in bounded memory.
+    """
+
+    def __init__(self,
+                 interval: int,
+                 max_snapshots: int):
+        self.__interval: int = interval
+        self.__max_snapshots: int = max_snapshots
+        self.__counts: list[int] = []
+        self.__snapshots: list[tuple[int, int, tuple[int, ...]]] = []
+
+    @property
+    def interval(self) -> int:
+        return self.__interval
+
+    @property
+    def start(self) -> int:
+        return self.__counts[0]
+
+    def restart(self,
+                instruction_index: int,
+                registers: list[int],
+                instructions_performed: int) -> None:
+        """
+        Drops every snapshot, and starts a new history from the state.
+        """
+        self.__counts = [instructions_performed]
+        self.__snapshots = [(instructions_performed, instruction_index, tuple(registers))]
+
+    def next_snapshot(self,
+                      instructions_performed: int) -> int:
+        """
+        Returns the amount of instructions performed at which the next snapshot is due.
+        """
+        from bisect import bisect_right
+
+        return self.__counts[bisect_right(self.__counts, instructions_performed) - 1] + self.__interval
+
+    def record(self,
+               instruction_index: int,
+               registers: list[int],
+               instructions_performed: int) -> None:
+        from bisect import bisect_left
+
+        position: int = bisect_left(self.__counts, instructions_performed)
+        if position < len(self.__counts) and self.__counts[position] == instructions_performed:
+            # Already recorded, before going back
+            return
+        self.__counts.insert(position, instructions_performed)
+        self.__snapshots.insert(position, (instructions_performed, instruction_index, tuple(registers)))
+
+        if len(self.__snapshots) > self.__max_snapshots:
+            self.__counts = self.__counts[::2]
+            self.__snapshots = self.__snapshots[::2]
+            self.__interval *= 2
+
+    def before(self,
+               instructions_performed: int) -> list[tuple[int, int, tuple[int, ...]]]:
+        """
+        Returns the snapshots taken before the amount of instructions performed, the latest first.
+        """
+        from bisect import bisect_left
+
+        position: int = bisect_left(self.__counts, instructions_performed)
+        return self.__snapshots[position - 1::-1] if position > 0 else []
+
+
 class Interpreter:
-    from typing import Optional as _Optional
+    from s_interpreter.compiler import Label as _Label
+    from typing import (
+        Callable as _Callable,
+        Iterable as _Iterable,
+        Iterator as _Iterator,
+        Union as _Union
+    )
+
+    CHECK_INTERVAL: int = 1 << 16
+    UNLIMITED_INTERVAL: int = 1 << 64
+    CYCLE_SAMPLE_INTERVAL: int = 1 << 14
 
     def __init__(self,
-                 program: _Program):
-        from s_interpreter.compiler import Label, Variable, JumpCommand
-        self.__program: _Program = program
+                 program: _Union[_Program, LoweredProgram, _EncodedProgram],
+                 jit: bool = False,
+                 cache: _Optional[_ResultCache] = None,
+                 memoize: bool = False,
+                 history_interval: _Optional[int] = None,
+                 max_snapshots: int = 1 << 10):
+        if history_interval is not None and (history_interval <= 0 or max_snapshots < 2):
+            raise InterpreterError("History interval must be positive, with at least 2 snapshots!")
+
+        self.__program: _Optional[_Program] = program if type(program) is _Program else None
+        self.__lowered: LoweredProgram = program if type(program) is LoweredProgram else LoweredProgram(program)
+        if self.__lowered.encoded is not None and (
+            jit or
+            memoize or
+            cache is not None or
+            history_interval is not None
+        ):
+            raise InterpreterError("A lazily lowered program only runs on the plain execution, "
+                                   "without a JIT, memoization, a cache or a history!")
         self.__instruction_index: int = 0
         self.__instructions_performed: int = 0
-        self.__label_map: dict[Label, int] = {}
-        for instruction_index, instruction in enumerate(self.__program.instructions):
-            if instruction.label is not None and instruction.label not in self.__label_map:
-                self.__label_map[instruction.label] = instruction_index
-
-        self.__variables: dict[Variable: int] = {Variable("Y", 1): 0}
-        for instruction in self.__program.instructions:
-            if (
-                type(instruction.sentence.command) is JumpCommand and
-                instruction.sentence.command.label not in self.__label_map
-            ):
-                self.__label_map[instruction.sentence.command.label] = len(self.__program.instructions)
-            self.__variables[instruction.sentence.command.variable] = 0
+        self.__inputs: tuple[int, ...] = ()
+        self.__registers: list[int] = [0] * len(self.__lowered.variables)
+        self.__checkpoint_requested: bool = False
+
+        # Summarized loops replace their heads in both the profiled/traced and the plain execution,
+        # while superinstructions (and clearing loops, a special case of summarized loops) only in the plain one.
+        # A lazily lowered program has neither, so it runs on its own opcodes, which its decoding writes to
+        self.__loop_opcodes: list[int] = (
+            list(self.__lowered.opcodes)
+            if self.__lowered.encoded is None
+            else
+            self.__lowered.opcodes
+        )
+        self.__execution_loops: list[_Optional[LoopSummary]] = [None] * len(self.__loop_opcodes)
+        for head, loop in self.__lowered.loops.items():
+            self.__loop_opcodes[head] = Opcode.Loop.value
+            self.__execution_loops[head] = loop
+
+        self.__execution_opcodes: list[int] = (
+            list(self.__loop_opcodes)
+            if self.__lowered.encoded is None
+            else
+            self.__loop_opcodes
+        )
+        self.__execution_next_indices: list[int] = [0] * len(self.__execution_opcodes)
+        self.__execution_lengths: list[int] = [0] * len(self.__execution_opcodes)
+        self.__execution_blocks: list[_Optional[BasicBlock]] = [None] * len(self.__execution_opcodes)
+        for head, superinstruction in self.__lowered.superinstructions.items():
+            if self.__execution_loops[head] is None:
+                self.__execution_opcodes[head] = superinstruction.opcode.value
+                self.__execution_next_indices[head] = superinstruction.next_index
+                self.__execution_lengths[head] = superinstruction.length
+        for leader, block in self.__lowered.blocks.items():
+            if self.__execution_loops[leader] is None:
+                self.__execution_opcodes[leader] = Opcode.Block.value
+                self.__execution_blocks[leader] = block
+        for head, loop in self.__lowered.loops.items():
+            if loop.length == 2 and loop.counter_decrements == 1 and not loop.increments and not loop.decrements:
+                self.__execution_opcodes[head] = Opcode.Clear.value
+
+        self.__jit = None
+        if jit:
+            from s_interpreter.jit import jit_compile
+            self.__jit = jit_compile(self.__lowered)
+
+        self.__regions = None
+        if memoize:
+            from s_interpreter.memo import RegionMemo
+            self.__regions = RegionMemo(self.__lowered)
+
+        self.__history: _Optional[_RunHistory] = None
+        if history_interval is not None:
+            self.__history = _RunHistory(history_interval, max_snapshots)
+            self.__history.restart(self.__instruction_index, self.__registers, self.__instructions_performed)
+
+        self.__profile: _Optional[_Profile] = None
+        self.__trace: _Optional[_TraceWriter] = None
+        self.__cache: _Optional[_ResultCache] = cache
+
+        # The hooked opcodes only exist while a breakpoint or a watchpoint is set
+        self.__breakpoints: set[int] = set()
+        self.__watchpoints: dict[str, _Optional[int]] = {}
+        self.__watched_slots: dict[int, _Optional[int]] = {}
+        self.__hooked_opcodes: _Optional[list[int]] = None
+        self.__breakpoint_hit: _Optional[int] = None
 
     @property
     def program(self) -> _Program:
+        if self.__program is None:
+            self.__program = self.__lowered.to_program()
         return self.__program
 
+    @property
+    def lowered(self) -> LoweredProgram:
+        return self.__lowered
+
     @property
     def variables(self) -> dict[str, int]:
-        return {str(key): value for key, value in self.__variables.items()}
+        return dict(zip(self.__lowered.variable_names, self.__registers))
+
+    def view_variables(self) -> "VariablesView":
+        """
+        Returns a live, read-only view of the variables over the registers (see `VariablesView`).
+        Every view tracks its own deltas.
+        """
+        return VariablesView(self.__lowered.variable_names, self.__lowered.variable_slots, self.__registers)
 
     @property
     def instructions_performed(self) -> int:
         return self.__instructions_performed
 
+    @property
+    def instruction_index(self) -> int:
+        return self.__instruction_index
+
+    @property
+    def history_interval(self) -> _Optional[int]:
+        """
+        The minimal amount of instructions between the snapshots of the run (which doubles on every eviction),
+        or None if no history is recorded.
+        """
+        return None if self.__history is None else self.__history.interval
+
     def step(self) -> _Optional[int]:
-        from s_interpreter.compiler import Instruction, JumpCommand, VariableCommandType, Variable
-        if self.__instruction_index < len(self.__program.instructions):
-            current_instruction: Instruction = self.__program.instructions[self.__instruction_index]
+        self.__sync()
+        if self.__lowered.opcodes[self.__instruction_index] == Opcode.Decode:
+            self.__decode(self.__instruction_index)
+        instruction_index: int = self.__instruction_index
+        opcode: int = self.__lowered.opcodes[instruction_index]
 
-            if type(current_instruction.sentence.command) is JumpCommand:
+        if opcode != Opcode.Halt:
+            slot: int = self.__lowered.slots[instruction_index]
+            if opcode == Opcode.Jump:
                 self.__instruction_index = (
-                    self.__label_map[current_instruction.sentence.command.label]
-                    if self.__variables[current_instruction.sentence.command.variable] != 0
+                    self.__lowered.targets[instruction_index]
+                    if self.__registers[slot] != 0
                     else
-                    self.__instruction_index + 1
+                    instruction_index + 1
                 )
+            elif opcode == Opcode.Native:
+                if (value := self.__lowered.natives[instruction_index].evaluate(self.__registers)) is None:
+                    raise self.__native_divergence()
+                self.__registers[slot] = value
+                self.__instruction_index += 1
             else:
                 self.__instruction_index += 1
 
-                if current_instruction.sentence.command.command_type == VariableCommandType.Increment:
-                    self.__variables[current_instruction.sentence.command.variable] += 1
-                elif (current_instruction.sentence.command.command_type == VariableCommandType.Decrement and
-                      self.__variables[current_instruction.sentence.command.variable] > 0):
-                    self.__variables[current_instruction.sentence.command.variable] -= 1
+                if opcode == Opcode.Increment:
+                    self.__registers[slot] += 1
+                elif opcode == Opcode.Decrement and self.__registers[slot] > 0:
+                    self.__registers[slot] -= 1
 
             self.__instructions_performed += 1
 
-        if self.__instruction_index == len(self.__program.instructions):
-            return self.__variables[Variable("Y", 1)]
+        # The end of a lazily lowered program is only found by decoding past it
+        if self.__lowered.opcodes[self.__instruction_index] == Opcode.Decode:
+            self.__decode(self.__instruction_index)
+        if self.__instruction_index == len(self.__lowered):
+            return self.__registers[0]
+
+    def step_n(self,
+               n: int) -> _Optional[int]:
+        """
+        Performs `n` instructions (or fewer, if the program halts first) at the speed of `resume`, see `step`.
+        """
+        if n < 0:
+            raise InterpreterError("Amount of steps must be non-negative!")
+
+        if self.__instruction_index < len(self.__lowered):
+            self.__execute(self.__instructions_performed + n, self.__instructions_performed + n)
+        if self.__instruction_index == len(self.__lowered):
+            return self.__registers[0]
+
+    def run_until(self,
+                  predicate: _Optional[_Callable[["Interpreter"], bool]] = None,
+                  pc: _Optional[int] = None,
+                  label: _Optional[_Union[str, _Label]] = None,
+                  check_every: int = 1,
+                  fuel: _Optional[int] = None) -> _Optional[int]:
+        """
+        Continues running until the instruction index reaches `pc` (or an instruction labelled `label`),
+        or until `predicate(interpreter)` holds, checking it every `check_every` instructions.
+        At least one instruction is performed, and the output is returned if the program halts first.
+
+        Stopping at instructions keeps every fused instruction that would skip over them from running,
+        so that the rest of the program still runs at the speed of `resume`.
+        At most `fuel` more instructions are performed, after which `FuelExhausted` is raised.
+        """
+        if predicate is None and pc is None and label is None:
+            raise InterpreterError("Nothing to run until!")
+        if check_every <= 0:
+            raise InterpreterError("Check interval must be positive!")
+        if fuel is not None and fuel < 0:
+            raise InterpreterError("Fuel must be non-negative!")
+
+        stops: set[int] = set()
+        if pc is not None:
+            if pc >= 0:
+                self.__decode(pc)
+            if not 0 <= pc <= len(self.__lowered):
+                raise InterpreterError(f"Instruction index {pc} is out of the program!")
+            stops.add(pc)
+        if label is not None:
+            stops.update(self.__label_indices(label))
+        opcodes: _Optional[list[int]] = None
+        if stops:
+            # The hooked execution also needs to stop at its own hooks
+            opcodes = self.__stopping_opcodes(frozenset(
+                stops if self.__hooked_opcodes is None else stops | self.__hook_stops()
+            ))
+
+        hard_limit: _Optional[int] = None if fuel is None else self.__instructions_performed + fuel
+        start: int = self.__instructions_performed
+        while self.__instruction_index < len(self.__lowered):
+            if self.__instructions_performed > start and (
+                self.__instruction_index in stops or
+                (predicate is not None and predicate(self))
+            ):
+                return None
+            if (interruption := self.__limit_interruption(hard_limit, None)) is not None:
+                raise interruption
+
+            soft_limit: int = self.__instructions_performed + (
+                Interpreter.CHECK_INTERVAL
+                if predicate is None
+                else
+                check_every
+            )
+            if hard_limit is not None:
+                soft_limit = min(soft_limit, hard_limit)
+
+            if self.__instruction_index in stops and self.__hooked_opcodes is None:
+                self.step()
+            else:
+                self.__execute(soft_limit, soft_limit, opcodes)
+
+        return self.__registers[0]
+
+    def step_back(self,
+                  n: int = 1) -> None:
+        """
+        Goes back `n` instructions in the run (see `history_interval` in `__init__`),
+        by restoring the nearest snapshot before that point and performing the instructions since.
+        """
+        history: _RunHistory = self.__recorded_history()
+        if n < 0:
+            raise InterpreterError("Amount of steps must be non-negative!")
+        target: int = self.__instructions_performed - n
+        if target < history.start:
+            raise InterpreterError(f"Can't step back before the start of the history "
+                                   f"(after {history.start} instructions)!")
+
+        # Replayed by the plain execution, which neither records the history again nor stops at hooks
+        self.__restore(history.before(target + 1)[0])
+        self.__execute_lowered(target, target)
+
+    def run_back_to(self,
+                    pc: int) -> None:
+        """
+        Goes back to the last state of the run (before the current one) at the instruction index `pc`,
+        searching the spans between the snapshots from the latest one backwards.
+        The state is left as it is if the run was never at `pc` since the start of the history.
+        """
+        history: _RunHistory = self.__recorded_history()
+        if not 0 <= pc < len(self.__lowered):
+            raise InterpreterError(f"Instruction index {pc} is out of the program!")
+
+        current: tuple[int, int, tuple[int, ...]] = (self.__instructions_performed,
+                                                      self.__instruction_index,
+                                                      tuple(self.__registers))
+        opcodes: list[int] = self.__stopping_opcodes(frozenset({pc}))
+        end: int = self.__instructions_performed
+        for snapshot in history.before(end):
+            self.__restore(snapshot)
+            last_visit: _Optional[int] = None
+            while self.__instructions_performed < end:
+                if self.__instruction_index == pc:
+                    last_visit = self.__instructions_performed
+                    self.step()
+                else:
+                    self.__execute_lowered(end, end, opcodes)
+
+            if last_visit is not None:
+                self.__restore(snapshot)
+                self.__execute_lowered(last_visit, last_visit)
+                return
+            end = snapshot[0]
+
+        self.__restore(current)
+        raise InterpreterError(f"The run was never at instruction {pc} since the start of the history "
+                               f"(after {history.start} instructions)!")
+
+    def __recorded_history(self) -> _RunHistory:
+        if self.__history is None:
+            raise InterpreterError("No history is recorded! Create the interpreter with a history interval")
+        return self.__history
+
+    def __restore(self,
+                  snapshot: tuple[int, int, tuple[int, ...]]) -> None:
+        self.__instructions_performed, self.__instruction_index, registers = snapshot
+        self.__registers[:] = registers
+
+    @property
+    def breakpoints(self) -> frozenset[int]:
+        return frozenset(self.__breakpoints)
+
+    @property
+    def watchpoints(self) -> dict[str, _Optional[int]]:
+        return dict(self.__watchpoints)
+
+    def set_breakpoint(self,
+                       pc: _Optional[int] = None,
+                       label: _Optional[_Union[str, _Label]] = None) -> None:
+        """
+        Sets a breakpoint at the instruction index `pc` (or at every instruction labelled `label`):
+        runs raise `BreakpointHit` when they reach it, before performing its instruction.
+
+        While any breakpoint or watchpoint is set, runs go through an instrumented execution (except for profiled
+        and traced runs, which ignore them), which only leaves the plain one at the hooked instructions.
+        Without any, runs are exactly as fast as before, and `step` never checks them.
+        """
+        if pc is None and label is None:
+            raise InterpreterError("Nothing to break at!")
+        if pc is not None:
+            if pc >= 0:
+                self.__decode(pc)
+            if not 0 <= pc < len(self.__lowered):
+                raise InterpreterError(f"Instruction index {pc} is out of the program!")
+            self.__breakpoints.add(pc)
+        if label is not None:
+            self.__breakpoints.update(self.__label_indices(label))
+        self.__update_hooks()
+
+    def set_watchpoint(self,
+                       variable: str,
+                       value: _Optional[int] = None) -> None:
+        """
+        Sets a watchpoint on the variable: runs raise `WatchpointHit` right after an instruction changes it,
+        or, given a `value`, only after an instruction changes it to that value.
+        """
+        from s_interpreter.compiler import CompilationError, Variable
+
+        try:
+            watched_variable: Variable = Variable.compile(variable)
+        except CompilationError as exception:
+            raise InterpreterError(str(exception))
+        variable_name: str = str(watched_variable)
+        if self.__lowered.encoded is not None:
+            # A lazily lowered program may only meet the variable later on
+            self.__lowered.slot(watched_variable)
+            self.__sync()
+        elif variable_name not in self.__lowered.variable_slots:
+            raise InterpreterError(f"The program has no variable {variable_name}!")
+        self.__watchpoints[variable_name] = value
+        self.__update_hooks()
+
+    def clear_breakpoints(self) -> None:
+        self.__breakpoints.clear()
+        self.__update_hooks()
+
+    def clear_watchpoints(self) -> None:
+        self.__watchpoints.clear()
+        self.__update_hooks()
+
+    def __label_indices(self,
+                        label: _Union[str, _Label]) -> set[int]:
+        from s_interpreter.compiler import Label
+
+        if type(label) is str:
+            label = Label.compile(label)
+        if self.__lowered.encoded is not None:
+            # The labels of the instructions that weren't decoded yet are searched in the encoding
+            label_indices: list[int] = self.__lowered.encoded.label_indices(label)
+            for instruction_index in label_indices:
+                self.__decode(instruction_index)
+            return set(label_indices)
+
+        encoded_label: int = label.encode()
+        return {
+            instruction_index
+            for instruction_index, instruction_label in enumerate(self.__lowered.labels)
+            if instruction_label == encoded_label
+        }
+
+    def __hook_stops(self) -> set[int]:
+        # The breakpoints, and every instruction writing a watched variable
+        writes: set[int] = {Opcode.Increment.value, Opcode.Decrement.value, Opcode.Native.value}
+        return self.__breakpoints | {
+            instruction_index
+            for instruction_index, (opcode, slot) in enumerate(zip(self.__lowered.opcodes, self.__lowered.slots))
+            if opcode in writes and slot in self.__watched_slots
+        }
+
+    def __update_hooks(self) -> None:
+        self.__watched_slots = {
+            self.__lowered.variable_slots[variable_name]: value
+            for variable_name, value in self.__watchpoints.items()
+        }
+        self.__hooked_opcodes = (
+            None
+            if not self.__breakpoints and not self.__watchpoints
+            else
+            self.__stopping_opcodes(frozenset(self.__hook_stops()))
+        )
+
+    def __stopping_opcodes(self,
+                           stops: frozenset[int]) -> list[int]:
+        # The execution opcodes, halting on the stops, without the fused instructions that pass through a stop
+        # (a summarized loop also passes through its own head on every iteration)
+        raw_opcodes: list[int] = self.__lowered.opcodes
+        targets: list[int] = self.__lowered.targets
+        opcodes: list[int] = list(self.__execution_opcodes)
+        for instruction_index, opcode in enumerate(opcodes):
+            passed: _Sequence[int] = ()
+            if opcode == Opcode.Block:
+                passed = range(instruction_index + 1, self.__execution_blocks[instruction_index].end)
+            elif opcode == Opcode.Skip:
+                passed = range(instruction_index + 1, self.__execution_next_indices[instruction_index])
+            elif opcode == Opcode.Goto:
+                passed = (instruction_index + 1,
+                          *range(targets[instruction_index + 1], self.__execution_next_indices[instruction_index]))
+            elif opcode == Opcode.Loop:
+                passed = range(instruction_index, self.__execution_loops[instruction_index].tail + 1)
+            elif opcode == Opcode.Clear:
+                passed = (instruction_index, instruction_index + 1)
+            if any(passed_index in stops for passed_index in passed):
+                opcodes[instruction_index] = raw_opcodes[instruction_index]
+        for stop in stops:
+            opcodes[stop] = Opcode.Halt.value
+        return opcodes
+
+    def __execute_jit(self,
+                      soft_limit: int,
+                      hard_limit: float) -> None:
+        while (
+            self.__instruction_index < len(self.__lowered) and
+            not self.__jit.is_entry_point(self.__instruction_index) and
+            self.__instructions_performed < soft_limit
+        ):
+            self.step()
+
+        if self.__jit.is_entry_point(self.__instruction_index):
+            self.__instruction_index, self.__instructions_performed = self.__jit(self.__registers,
+                                                                                 self.__instruction_index,
+                                                                                 self.__instructions_performed,
+                                                                                 soft_limit,
+                                                                                 hard_limit)
+
+        # The JIT only stops short of the soft limit when the next block doesn't fit in the budget
+        if self.__instruction_index < len(self.__lowered) and self.__instructions_performed < soft_limit:
+            self.__execute_lowered(soft_limit, hard_limit)
+
+    def __execute_memoized(self,
+                           soft_limit: int,
+                           hard_limit: float) -> None:
+        regions = self.__regions
+        registers: list[int] = self.__registers
+        program_length: int = len(self.__lowered)
+        while self.__instructions_performed < soft_limit and self.__instruction_index < program_length:
+            transition = regions.transition(self.__instruction_index, registers)
+            if transition is not None and self.__instructions_performed + transition.length <= hard_limit:
+                self.__instruction_index = transition.apply(registers)
+                self.__instructions_performed += transition.length
+                continue
+
+            # Region boundaries (and regions that don't fit in the budget) take a single step of the plain execution
+            instructions_performed: int = self.__instructions_performed
+            self.__execute_lowered(instructions_performed + 1, hard_limit)
+            if self.__instructions_performed == instructions_performed:
+                # A diverging native instruction
+                break
+
+    def __execute_lowered(self,
+                          soft_limit: int,
+                          hard_limit: float,
+                          execution_opcodes: _Optional[list[int]] = None) -> None:
+        opcodes: list[int] = self.__execution_opcodes if execution_opcodes is None else execution_opcodes
+        raw_opcodes: list[int] = self.__lowered.opcodes
+        slots: list[int] = self.__lowered.slots
+        targets: list[int] = self.__lowered.targets
+        loops: list[_Optional[LoopSummary]] = self.__execution_loops
+        natives: list[_Optional[NativeCall]] = self.__lowered.natives
+        next_indices: list[int] = self.__execution_next_indices
+        lengths: list[int] = self.__execution_lengths
+        blocks: list[_Optional[BasicBlock]] = self.__execution_blocks
+        registers: list[int] = self.__registers
+        jump: int = Opcode.Jump.value
+        increment: int = Opcode.Increment.value
+        decrement: int = Opcode.Decrement.value
+        loop: int = Opcode.Loop.value
+        no_op: int = Opcode.NoOp.value
+        native: int = Opcode.Native.value
+        goto: int = Opcode.Goto.value
+        clear: int = Opcode.Clear.value
+        skip: int = Opcode.Skip.value
+        block: int = Opcode.Block.value
+
+        instruction_index: int = self.__instruction_index
+        instructions_performed: int = self.__instructions_performed
+        while instructions_performed < soft_limit:
+            opcode: int = opcodes[instruction_index]
+            if opcode == jump:
+                instruction_index = (
+                    targets[instruction_index]
+                    if registers[slots[instruction_index]]
+                    else
+                    instruction_index + 1
+                )
+            elif opcode == increment:
+                registers[slots[instruction_index]] += 1
+                instruction_index += 1
+            elif opcode == decrement:
+                slot: int = slots[instruction_index]
+                if registers[slot]:
+                    registers[slot] -= 1
+                instruction_index += 1
+            elif opcode == block:
+                basic_block: BasicBlock = blocks[instruction_index]
+                if instructions_performed + basic_block.end - instruction_index <= hard_limit:
+                    instructions_performed += basic_block.end - instruction_index
+                    instruction_index = basic_block.apply(registers)
+                    continue
+
+                # The whole block doesn't fit in the budget, so only its first instruction is performed
+                slot: int = slots[instruction_index]
+                if raw_opcodes[instruction_index] == increment:
+                    registers[slot] += 1
+                elif raw_opcodes[instruction_index] == decrement and registers[slot]:
+                    registers[slot] -= 1
+                instruction_index += 1
+            elif opcode == goto:
+                registers[slots[instruction_index]] += 1
+                if instructions_performed + lengths[instruction_index] <= hard_limit:
+                    instructions_performed += lengths[instruction_index]
+                    instruction_index = next_indices[instruction_index]
+                    continue
+                instruction_index += 1
+            elif opcode == loop:
+                loop_summary: LoopSummary = loops[instruction_index]
+                iterations: int = loop_summary.iterations(registers)
+                if instructions_performed + iterations * loop_summary.length <= hard_limit:
+                    loop_summary.apply(registers, iterations)
+                    instructions_performed += iterations * loop_summary.length
+                    instruction_index = loop_summary.tail + 1
+                    continue
+
+                # The whole loop doesn't fit in the budget, so only its head is performed
+                slot: int = slots[instruction_index]
+                if raw_opcodes[instruction_index] == increment:
+                    registers[slot] += 1
+                elif raw_opcodes[instruction_index] == decrement and registers[slot]:
+                    registers[slot] -= 1
+                instruction_index += 1
+            elif opcode == clear:
+                slot: int = slots[instruction_index]
+                if instructions_performed + 2 * (registers[slot] or 1) <= hard_limit:
+                    instructions_performed += 2 * (registers[slot] or 1)
+                    registers[slot] = 0
+                    instruction_index += 2
+                    continue
+                if registers[slot]:
+                    registers[slot] -= 1
+                instruction_index += 1
+            elif opcode == no_op:
+                instruction_index += 1
+            elif opcode == skip:
+                if instructions_performed + lengths[instruction_index] <= hard_limit:
+                    instructions_performed += lengths[instruction_index]
+                    instruction_index = next_indices[instruction_index]
+                    continue
+                instruction_index += 1
+            elif opcode == native:
+                if (value := natives[instruction_index].evaluate(registers)) is None:
+                    break
+                registers[slots[instruction_index]] = value
+                instruction_index += 1
+            else:
+                break
+            instructions_performed += 1
+
+        self.__instruction_index = instruction_index
+        self.__instructions_performed = instructions_performed
+
+    def __execute_profiled(self,
+                           soft_limit: int,
+                           hard_limit: float) -> None:
+        # The lowered loop, counting the hits of every instruction and the times every jump was taken
+        opcodes: list[int] = self.__loop_opcodes
+        raw_opcodes: list[int] = self.__lowered.opcodes
+        slots: list[int] = self.__lowered.slots
+        targets: list[int] = self.__lowered.targets
+        loops: list[_Optional[LoopSummary]] = self.__execution_loops
+        natives: list[_Optional[NativeCall]] = self.__lowered.natives
+        registers: list[int] = self.__registers
+        hits: list[int] = self.__profile.hits
+        taken: list[int] = self.__profile.taken
+
+        instruction_index: int = self.__instruction_index
+        instructions_performed: int = self.__instructions_performed
+        while instructions_performed < soft_limit:
+            opcode: int = opcodes[instruction_index]
+            if opcode == Opcode.Halt:
+                break
+
+            if opcode == Opcode.Loop:
+                loop_summary: LoopSummary = loops[instruction_index]
+                iterations: int = loop_summary.iterations(registers)
+                if instructions_performed + iterations * loop_summary.length <= hard_limit:
+                    loop_summary.apply(registers, iterations)
+                    for loop_index in range(loop_summary.head, loop_summary.tail + 1):
+                        hits[loop_index] += iterations
+                    taken[loop_summary.tail] += iterations - 1
+                    instructions_performed += iterations * loop_summary.length
+                    instruction_index = loop_summary.tail + 1
+                    continue
+                opcode = raw_opcodes[instruction_index]
+
+            if opcode == Opcode.Native and (value := natives[instruction_index].evaluate(registers)) is None:
+                break
+
+            hits[instruction_index] += 1
+            slot: int = slots[instruction_index]
+            if opcode == Opcode.Jump:
+                if registers[slot]:
+                    taken[instruction_index] += 1
+                    instruction_index = targets[instruction_index]
+                else:
+                    instruction_index += 1
+            elif opcode == Opcode.Native:
+                registers[slot] = value
+                instruction_index += 1
+            else:
+                if opcode == Opcode.Increment:
+                    registers[slot] += 1
+                elif opcode == Opcode.Decrement and registers[slot]:
+                    registers[slot] -= 1
+                instruction_index += 1
+            instructions_performed += 1
+
+        self.__instruction_index = instruction_index
+        self.__instructions_performed = instructions_performed
+
+    def __execute_traced(self,
+                         soft_limit: int,
+                         hard_limit: float) -> None:
+        # The lowered loop, logging every register write into the trace's ring buffer
+        from s_interpreter.trace import SATURATED_VALUE
+
+        opcodes: list[int] = self.__loop_opcodes
+        raw_opcodes: list[int] = self.__lowered.opcodes
+        slots: list[int] = self.__lowered.slots
+        targets: list[int] = self.__lowered.targets
+        loops: list[_Optional[LoopSummary]] = self.__execution_loops
+        natives: list[_Optional[NativeCall]] = self.__lowered.natives
+        registers: list[int] = self.__registers
+        trace: _TraceWriter = self.__trace
+        buffer = trace.buffer
+        capacity: int = len(buffer)
+
+        position: int = trace.position
+        instruction_index: int = self.__instruction_index
+        instructions_performed: int = self.__instructions_performed
+        while instructions_performed < soft_limit:
+            opcode: int = opcodes[instruction_index]
+            if opcode == Opcode.Jump:
+                instruction_index = (
+                    targets[instruction_index]
+                    if registers[slots[instruction_index]]
+                    else
+                    instruction_index + 1
+                )
+                instructions_performed += 1
+                continue
+            if opcode == Opcode.Halt:
+                break
+
+            if opcode == Opcode.Loop:
+                loop_summary: LoopSummary = loops[instruction_index]
+                iterations: int = loop_summary.iterations(registers)
+                if instructions_performed + iterations * loop_summary.length <= hard_limit:
+                    # A summarized loop is logged as the final values of the registers it wrote
+                    loop_summary.apply(registers, iterations)
+                    instructions_performed += iterations * loop_summary.length
+                    trace.position = position
+                    trace.record(instructions_performed, instruction_index, loop_summary.counter, 0)
+                    for slot, _ in loop_summary.increments + loop_summary.decrements:
+                        trace.record(instructions_performed, instruction_index, slot, registers[slot])
+                    position = trace.position
+                    instruction_index = loop_summary.tail + 1
+                    continue
+                opcode = raw_opcodes[instruction_index]
+
+            if opcode == Opcode.NoOp:
+                instructions_performed += 1
+                instruction_index += 1
+                continue
+
+            slot: int = slots[instruction_index]
+            if opcode == Opcode.Native:
+                if (value := natives[instruction_index].evaluate(registers)) is None:
+                    break
+                registers[slot] = value
+            elif opcode == Opcode.Increment:
+                registers[slot] += 1
+            elif registers[slot]:
+                registers[slot] -= 1
+            instructions_performed += 1
+
+            if position == capacity:
+                trace.position = position
+                trace.flush()
+                position = 0
+            buffer[position] = instructions_performed
+            buffer[position + 1] = instruction_index
+            buffer[position + 2] = slot
+            try:
+                buffer[position + 3] = registers[slot]
+            except OverflowError:
+                buffer[position + 3] = SATURATED_VALUE
+            position += 4
+            instruction_index += 1
+
+        trace.position = position
+        self.__instruction_index = instruction_index
+        self.__instructions_performed = instructions_performed
+
+    def __execute(self,
+                  soft_limit: int,
+                  hard_limit: float,
+                  execution_opcodes: _Optional[list[int]] = None) -> None:
+        """
+        Runs until the program halts or `soft_limit` instructions were performed in total.
+        The soft limit may be overshot by a summarized loop, but never beyond `hard_limit`.
+        Given `execution_opcodes` (see `__stopping_opcodes`), the plain execution runs them instead.
+        """
+        self.__sync()
+        while True:
+            if self.__history is not None:
+                self.__execute_recorded(soft_limit, hard_limit, execution_opcodes)
+            else:
+                self.__execute_unrecorded(soft_limit, hard_limit, execution_opcodes)
+
+            # The executors stop at the instructions of a lazily lowered program that weren't decoded yet,
+            # which are decoded and run on (even at the soft limit, so that the end of the program is found)
+            stopped_opcodes: list[int] = (
+                execution_opcodes
+                if execution_opcodes is not None
+                else
+                self.__hooked_opcodes
+                if self.__hooked_opcodes is not None and self.__profile is None and self.__trace is None
+                else
+                self.__lowered.opcodes
+            )
+            if stopped_opcodes[self.__instruction_index] != Opcode.Decode:
+                break
+            self.__decode(self.__instruction_index, execution_opcodes)
+            if self.__instructions_performed >= soft_limit:
+                break
+
+        # Every executor stops short of the soft limit on a diverging native instruction
+        opcodes: list[int] = self.__lowered.opcodes if execution_opcodes is None else execution_opcodes
+        if self.__instructions_performed < soft_limit and opcodes[self.__instruction_index] == Opcode.Native:
+            raise self.__native_divergence()
+
+    def __execute_unrecorded(self,
+                             soft_limit: int,
+                             hard_limit: float,
+                             execution_opcodes: _Optional[list[int]]) -> None:
+        if self.__hooked_opcodes is not None and self.__profile is None and self.__trace is None:
+            self.__execute_hooked(soft_limit, hard_limit, execution_opcodes)
+        elif execution_opcodes is not None:
+            self.__execute_lowered(soft_limit, hard_limit, execution_opcodes)
+        elif self.__profile is not None:
+            self.__execute_profiled(soft_limit, hard_limit)
+        elif self.__trace is not None:
+            self.__execute_traced(soft_limit, hard_limit)
+        elif self.__regions is not None:
+            self.__execute_memoized(soft_limit, hard_limit)
+        elif self.__jit is not None:
+            self.__execute_jit(soft_limit, hard_limit)
+        else:
+            self.__execute_lowered(soft_limit, hard_limit)
+
+    def __execute_hooked(self,
+                         soft_limit: int,
+                         hard_limit: float,
+                         execution_opcodes: _Optional[list[int]]) -> None:
+        # The plain execution halts at every hooked instruction (see `__update_hooks`), which is then stepped here.
+        # Given `execution_opcodes`, they also halt at the caller's stops, so it returns to the caller at every halt
+        opcodes: list[int] = self.__hooked_opcodes if execution_opcodes is None else execution_opcodes
+        raw_opcodes: list[int] = self.__lowered.opcodes
+        slots: list[int] = self.__lowered.slots
+        registers: list[int] = self.__registers
+        watched_slots: dict[int, _Optional[int]] = self.__watched_slots
+        jump: int = Opcode.Jump.value
+        halt: int = Opcode.Halt.value
+        program_length: int = len(self.__lowered)
+
+        start: int = self.__instructions_performed
+        while self.__instructions_performed < soft_limit and self.__instruction_index < program_length:
+            instruction_index: int = self.__instruction_index
+            instructions_performed: int = self.__instructions_performed
+            if instruction_index in self.__breakpoints and instructions_performed != self.__breakpoint_hit:
+                # Resuming from the breakpoint goes on past it
+                self.__breakpoint_hit = instructions_performed
+                raise self.__interrupt(BreakpointHit,
+                                       f"Reached the breakpoint at instruction {instruction_index} "
+                                       f"after {instructions_performed} instructions")
+
+            if opcodes[instruction_index] != halt:
+                self.__execute_lowered(soft_limit, hard_limit, opcodes)
+                if self.__instructions_performed == instructions_performed:
+                    # A diverging native instruction
+                    break
+                continue
+            if execution_opcodes is not None and instructions_performed > start:
+                break
+
+            slot: int = slots[instruction_index]
+            watched: bool = raw_opcodes[instruction_index] != jump and slot in watched_slots
+            previous_value: int = registers[slot]
+            self.step()
+            if watched and registers[slot] != previous_value and (
+                watched_slots[slot] is None or
+                registers[slot] == watched_slots[slot]
+            ):
+                variable: str = self.__lowered.variable_names[slot]
+                raise WatchpointHit(f"Instruction {instruction_index} changed {variable} from {previous_value} "
+                                    f"to {registers[slot]} after {self.__instructions_performed} instructions",
+                                    self.__instructions_performed,
+                                    self.__instruction_index,
+                                    self.variables,
+                                    variable,
+                                    previous_value)
+
+    def __execute_recorded(self,
+                           soft_limit: int,
+                           hard_limit: float,
+                           execution_opcodes: _Optional[list[int]]) -> None:
+        # Snapshots are due at soft limits, which summarized loops may overshoot,
+        # so that recording the history never breaks them up
+        history: _RunHistory = self.__history
+        program_length: int = len(self.__lowered)
+        while self.__instructions_performed < soft_limit and self.__instruction_index < program_length:
+            next_snapshot: int = history.next_snapshot(self.__instructions_performed)
+            window_limit: int = min(soft_limit, next_snapshot)
+            self.__execute_unrecorded(window_limit, hard_limit, execution_opcodes)
+            if self.__instructions_performed >= next_snapshot:
+                history.record(self.__instruction_index, self.__registers, self.__instructions_performed)
+            elif self.__instructions_performed < window_limit:
+                # Halted, or stopped at a diverging native instruction
+                break
+
+    def __require_whole_program(self,
+                                feature: str) -> None:
+        if self.__lowered.encoded is not None:
+            raise InterpreterError(f"{feature} requires the whole program, which a lazily lowered program doesn't have "
+                                   f"(run its decoded program instead, see EncodedProgram.to_program)!")
+
+    def __initial_value(self,
+                        variable: LoweredProgram._Variable) -> int:
+        if variable.name.upper() == "X" and variable.index <= len(self.__inputs):
+            return self.__inputs[variable.index - 1]
+        return 0
+
+    def __sync(self) -> None:
+        # A lazily lowered program gets new variables and instructions as it's decoded (maybe by another interpreter)
+        if len(self.__registers) < len(self.__lowered.variables):
+            self.__registers.extend(self.__initial_value(variable)
+                                    for variable in self.__lowered.variables[len(self.__registers):])
+        if self.__hooked_opcodes is not None and len(self.__hooked_opcodes) < len(self.__lowered.opcodes):
+            self.__update_hooks()
+
+    def __decode(self,
+                 instruction_index: int,
+                 execution_opcodes: _Optional[list[int]] = None) -> None:
+        """
+        Decodes the instruction of a lazily lowered program (see `LoweredProgram.decode`),
+        and brings the registers and the opcodes runs stop on up to date with it.
+        """
+        if self.__lowered.encoded is None:
+            return
+        self.__lowered.decode(instruction_index)
+        if self.__hooked_opcodes is not None:
+            self.__update_hooks()
+        self.__sync()
+        if execution_opcodes is not None:
+            opcodes: list[int] = self.__lowered.opcodes if self.__hooked_opcodes is None else self.__hooked_opcodes
+            execution_opcodes.extend(opcodes[len(execution_opcodes):])
+            for decoded_index in (instruction_index, len(self.__lowered)):
+                if decoded_index < len(execution_opcodes) and execution_opcodes[decoded_index] == Opcode.Decode:
+                    execution_opcodes[decoded_index] = opcodes[decoded_index]
+
+    def __native_divergence(self) -> "NativeDivergence":
+        native: NativeCall = self.__lowered.natives[self.__instruction_index]
+        return self.__interrupt(NativeDivergence,
+                                f"Native {native.operation} diverges on its operands (instruction "
+                                f"{self.__instruction_index}, after {self.__instructions_performed} instructions)")
+
+    def __interrupt(self,
+                    exception_type: type,
+                    message: str) -> ExecutionInterrupted:
+        return exception_type(message, self.__instructions_performed, self.__instruction_index, self.variables)
+
+    def __execute_window(self,
+                         window: int,
+                         hard_limit: _Optional[int]) -> None:
+        soft_limit: int = self.__instructions_performed + window
+        if hard_limit is not None:
+            soft_limit = min(soft_limit, hard_limit)
+        self.__execute(soft_limit, float("inf") if hard_limit is None else hard_limit)
+
+    def __limit_interruption(self,
+                             hard_limit: _Optional[int],
+                             deadline: _Optional[float]) -> _Optional[ExecutionInterrupted]:
+        from time import monotonic
+
+        if hard_limit is not None and self.__instructions_performed >= hard_limit:
+            return self.__interrupt(FuelExhausted,
+                                    f"Ran out of fuel after {self.__instructions_performed} instructions")
+        if deadline is not None and monotonic() >= deadline:
+            return self.__interrupt(DeadlineExceeded,
+                                    f"Timed out after {self.__instructions_performed} instructions")
+        return None
+
+    def __cycle_interruption(self,
+                             cycle_detector: _CycleDetector) -> _Optional[CycleDetected]:
+        period: _Optional[int] = cycle_detector.sample(self.__instruction_index,
+                                                       self.__registers,
+                                                       self.__instructions_performed)
+        if period is None:
+            return None
+        return CycleDetected(f"Diverges: the state after {self.__instructions_performed} instructions "
+                             f"was already reached {period} instructions before",
+                             self.__instructions_performed,
+                             self.__instruction_index,
+                             self.variables,
+                             period)
+
+    def resume(self,
+               fuel: _Optional[int] = None,
+               timeout: _Optional[float] = None,
+               checkpoint_path: _Optional[str] = None,
+               checkpoint_interval: float = 600.0,
+               detect_cycles: bool = False) -> int:
+        """
+        Continues running from the current state (see `reset`) until the program halts, and returns its output.
+
+        At most `fuel` more instructions are performed, and the run stops after roughly `timeout` seconds.
+        Both are only checked every `CHECK_INTERVAL` instructions, so they add no per-instruction cost.
+        When one of them is hit, `FuelExhausted`/`DeadlineExceeded` is raised with the state the run stopped in.
+
+        Given a `checkpoint_path`, the state is saved there (see `save_checkpoint`) every `checkpoint_interval`
+        seconds, whenever `request_checkpoint` was called, and when the run is interrupted by a limit.
+
+        With `detect_cycles`, the state is sampled every `CYCLE_SAMPLE_INTERVAL` instructions,
+        and `CycleDetected` is raised as soon as a sampled state repeats (the program provably never halts).
+        Runs that diverge without ever repeating a state (e.g. counting up forever) still go on until a limit.
+        """
+        from time import monotonic
+
+        if fuel is not None and fuel < 0:
+            raise InterpreterError("Fuel must be non-negative!")
+
+        hard_limit: _Optional[int] = None if fuel is None else self.__instructions_performed + fuel
+        deadline: _Optional[float] = None if timeout is None else monotonic() + timeout
+        last_checkpoint: float = monotonic()
+        window: int = (
+            Interpreter.CHECK_INTERVAL
+            if deadline is not None or checkpoint_path is not None
+            else
+            Interpreter.UNLIMITED_INTERVAL
+        )
+        cycle_detector: _Optional[_CycleDetector] = None
+        if detect_cycles:
+            window = min(window, Interpreter.CYCLE_SAMPLE_INTERVAL)
+            cycle_detector = _CycleDetector()
+        while True:
+            self.__execute_window(window, hard_limit)
+
+            if self.__instruction_index == len(self.__lowered):
+                return self.__registers[0]
+
+            interruption: _Optional[ExecutionInterrupted] = (
+                None
+                if cycle_detector is None
+                else
+                self.__cycle_interruption(cycle_detector)
+            ) or self.__limit_interruption(hard_limit, deadline)
+            if checkpoint_path is not None and (
+                interruption is not None or
+                self.__checkpoint_requested or
+                monotonic() - last_checkpoint >= checkpoint_interval
+            ):
+                self.save_checkpoint(checkpoint_path)
+                self.__checkpoint_requested = False
+                last_checkpoint = monotonic()
+
+            if interruption is not None:
+                raise interruption
+
+    async def resume_async(self,
+                           fuel: _Optional[int] = None,
+                           timeout: _Optional[float] = None,
+                           slice_steps: int = CHECK_INTERVAL) -> int:
+        """
+        Like `resume`, but yields to the asyncio event loop after every `slice_steps` instructions,
+        so that many runs (and other tasks) can share one event loop.
+        """
+        import asyncio
+        from time import monotonic
+
+        if fuel is not None and fuel < 0:
+            raise InterpreterError("Fuel must be non-negative!")
+        if slice_steps <= 0:
+            raise InterpreterError("Slice steps must be positive!")
+
+        hard_limit: _Optional[int] = None if fuel is None else self.__instructions_performed + fuel
+        deadline: _Optional[float] = None if timeout is None else monotonic() + timeout
+        while True:
+            self.__execute_window(slice_steps, hard_limit)
+            if self.__instruction_index == len(self.__lowered):
+                return self.__registers[0]
+            if (interruption := self.__limit_interruption(hard_limit, deadline)) is not None:
+                raise interruption
+            await asyncio.sleep(0)
+
+    def request_checkpoint(self) -> None:
+        """
+        Asks a running `resume` to save a checkpoint the next time it checks its limits.
+        Safe to call from a signal handler.
+        """
+        self.__checkpoint_requested = True
+
+    def save_checkpoint(self,
+                        checkpoint_path: str) -> None:
+        """
+        Saves the state of the run (the program's digest, the instruction index, the amount of instructions
+        performed and the registers) to a compact JSON file, replacing it atomically.
+        Registers are saved as hexadecimal strings rather than JSON numbers, since a long run's registers may
+        exceed the digits Python converts to decimal.
+        The registers of a lazily lowered program are in the order the run met its variables, so the variables
+        are saved along with them, and so is the input (of the variables the run is yet to meet).
+        """
+        import json
+        import os
+
+        checkpoint: dict = {
+            "program": self.__lowered.digest(),
+            "instruction_index": self.__instruction_index,
+            "instructions_performed": self.__instructions_performed,
+            "registers": [format(register, "x") for register in self.__registers]
+        }
+        if self.__lowered.encoded is not None:
+            checkpoint["variables"] = [variable.encode() for variable in self.__lowered.variables]
+            checkpoint["inputs"] = [format(value, "x") for value in self.__inputs]
+
+        temporary_path: str = checkpoint_path + ".tmp"
+        try:
+            with open(temporary_path, "w") as checkpoint_file:
+                json.dump(checkpoint, checkpoint_file, separators=(",", ":"))
+            os.replace(temporary_path, checkpoint_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def load_checkpoint(self,
+                        checkpoint_path: str) -> None:
+        """
+        Restores the state saved by `save_checkpoint`, so that `resume` continues the saved run.
+        The checkpoint must have been saved while running the same program.
+        """
+        import json
+
+        with open(checkpoint_path, "r") as checkpoint_file:
+            checkpoint: dict = json.load(checkpoint_file)
+
+        if checkpoint.get("program") != self.__lowered.digest():
+            raise InterpreterError(f"Checkpoint '{checkpoint_path}' was saved while running a different program!")
+        registers: list[int] = [int(register, 16) for register in checkpoint["registers"]]
+        slots: list[int] = list(range(len(self.__registers)))
+        if self.__lowered.encoded is not None:
+            from s_interpreter.compiler import Variable
+
+            self.__inputs = tuple(int(value, 16) for value in checkpoint.get("inputs", []))
+            slots = [self.__lowered.slot(Variable.decode(variable)) for variable in checkpoint.get("variables", [])]
+            self.__lowered.decode(checkpoint["instruction_index"])
+        if (
+            len(registers) != len(slots) or
+            not 0 <= checkpoint["instruction_index"] <= len(self.__lowered)
+        ):
+            raise InterpreterError(f"Checkpoint '{checkpoint_path}' is corrupted!")
+
+        self.__registers[:] = [self.__initial_value(variable) for variable in self.__lowered.variables]
+        for slot, register in zip(slots, registers):
+            self.__registers[slot] = register
+        self.__instruction_index = checkpoint["instruction_index"]
+        self.__instructions_performed = checkpoint["instructions_performed"]
+        self.__breakpoint_hit = None
+        if self.__history is not None:
+            self.__history.restart(self.__instruction_index, self.__registers, self.__instructions_performed)
 
     def reset(self,
               *x: int) -> None:
-        from s_interpreter.compiler import Variable
         if any(value < 0 for value in x):
             raise InterpreterError("Given negative input values! Only non-negatives in S!")
 
-        for key in self.__variables:
-            self.__variables[key] = 0
-        self.__variables.update({
-            variable: value
-            for index, value in enumerate(x)
-            if (variable := Variable("X", index + 1)) in self.__variables
-        })
+        # Kept for the input variables a lazily lowered program meets later
+        self.__inputs = x
+        self.__registers[:] = [0] * len(self.__lowered.variables)
+        for index, value in enumerate(x):
+            if (slot := self.__lowered.input_slots.get(index + 1)) is not None:
+                self.__registers[slot] = value
 
-        self.__variables[Variable("Y", 1)] = 0
         self.__instruction_index = 0
         self.__instructions_performed = 0
+        self.__breakpoint_hit = None
+        if self.__history is not None:
+            self.__history.restart(self.__instruction_index, self.__registers, self.__instructions_performed)
 
     def run(self,
-            *x: int) -> int:
+            *x: int,
+            fuel: _Optional[int] = None,
+            timeout: _Optional[float] = None,
+            checkpoint_path: _Optional[str] = None,
+            checkpoint_interval: float = 600.0,
+            detect_cycles: bool = False) -> int:
+        """
+        Runs the program on the input from the start, see `resume`.
+        Given a `ResultCache` (see `__init__`), a cached run of the same program on the same input is reused
+        (unless it needs more than `fuel` instructions), and finished runs are added to the cache.
+        """
+        self.reset(*x)
+        if self.__cache is None or self.__profile is not None or self.__trace is not None:
+            return self.resume(fuel, timeout, checkpoint_path, checkpoint_interval, detect_cycles)
+
+        # Only the inputs the program reads take part in the key
+        cache_input: list[int] = [self.__registers[slot] for _, slot in sorted(self.__lowered.input_slots.items())]
+        if (cached := self.__cache.get(self.__lowered.digest(), cache_input)) is not None:
+            output, instructions_performed, registers = cached
+            if (fuel is None or instructions_performed <= fuel) and len(registers) == len(self.__registers):
+                self.__registers[:] = registers
+                self.__instruction_index = len(self.__lowered)
+                self.__instructions_performed = instructions_performed
+                return output
+
+        output: int = self.resume(fuel, timeout, checkpoint_path, checkpoint_interval, detect_cycles)
+        self.__cache.put(self.__lowered.digest(),
+                         cache_input,
+                         output,
+                         self.__instructions_performed,
+                         self.__registers)
+        return output
+
+    async def run_async(self,
+                        *x: int,
+                        fuel: _Optional[int] = None,
+                        timeout: _Optional[float] = None,
+                        slice_steps: int = CHECK_INTERVAL) -> int:
         self.reset(*x)
-        while (result := self.step()) is None:
-            pass
+        return await self.resume_async(fuel, timeout, slice_steps)
 
-        return result
+    def profile(self,
+                *x: int,
+                fuel: _Optional[int] = None,
+                timeout: _Optional[float] = None) -> _Profile:
+        """
+        Runs the program like `run`, counting how many times every instruction was performed
+        and how many times every jump was taken, and returns the `s_interpreter.profiler.Profile`.
+        When a limit is hit, the profile of the partial run is attached to the raised exception as `profile`.
+        """
+        self.__require_whole_program("Profiling")
+        profile: _Profile = _Profile(self.program)
+        self.__profile = profile
+        try:
+            profile.output = self.run(*x, fuel=fuel, timeout=timeout)
+        except ExecutionInterrupted as interruption:
+            interruption.profile = profile
+            raise
+        finally:
+            self.__profile = None
+            profile.instructions_performed = self.__instructions_performed
+        return profile
+
+    def trace(self,
+              *x: int,
+              trace_path: str,
+              fuel: _Optional[int] = None,
+              timeout: _Optional[float] = None,
+              capacity: int = 1 << 16) -> int:
+        """
+        Runs the program like `run`, logging a `(step, pc, slot, value)` record of every register write
+        to the binary file at `trace_path` (see `s_interpreter.trace.TraceWriter`, and `read_trace` to load it).
+        Records are buffered `capacity` at a time; the trace of a run interrupted by a limit is kept.
+        """
+        self.__require_whole_program("Tracing")
+        with _TraceWriter(trace_path, [str(variable) for variable in self.__lowered.variables], capacity) as trace:
+            self.__trace = trace
+            try:
+                return self.run(*x, fuel=fuel, timeout=timeout)
+            finally:
+                self.__trace = None
+
+    def run_batch(self,
+                  inputs: _Any) -> _Any:
+        """
+        Runs the program on every row of `inputs` at once (requires NumPy), see `s_interpreter.batch.run_batch`.
+        The interpreter's own state is left untouched.
+        """
+        from s_interpreter.batch import run_batch
+
+        self.__require_whole_program("Running in batches")
+        return run_batch(self, inputs)
+
+    @staticmethod
+    def run_many(program: _Union[_Program, LoweredProgram],
+                 inputs: _Iterable[_Sequence[int]],
+                 workers: _Optional[int] = None,
+                 chunksize: int = 1,
+                 ordered: bool = True,
+                 jit: bool = False) -> _Iterator:
+        """
+        Runs the program on every input tuple across a pool of worker processes,
+        see `s_interpreter.parallel.run_many`.
+        """
+        from s_interpreter.parallel import run_many
+        return run_many(program, inputs, workers, chunksize, ordered, jit)
 
 
 def main(args: _Optional[_Sequence[str]] = None) -> None:
     from argparse import ArgumentParser, Namespace
+    import signal
 
     argument_parser: ArgumentParser = ArgumentParser(description="S Compiler")
     argument_parser.add_argument("x",
                                  type=int,
                                  nargs="*",
                                  help="The program's input")
-    argument_parser.add_argument("-b",
-                                 "--binary",
-                                 required=True,
+    program_group = argument_parser.add_mutually_exclusive_group(required=True)
+    program_group.add_argument("-b",
+                               "--binary",
+                               type=str,
+                               help="Binary file to run")
+    program_group.add_argument("-d",
+                               "--decode",
+                               type=str,
+                               help="File holding the encoding of the program to run (in decimal, or in "
+                                    "hexadecimal with a 0x prefix), whose instructions are decoded as the run "
+                                    "reaches them")
+    argument_parser.add_argument("--checkpoint",
+                                 type=str,
+                                 default=None,
+                                 help="File to periodically save the state of the run to (and on SIGUSR1)")
+    argument_parser.add_argument("--checkpoint_interval",
+                                 type=float,
+                                 default=600.0,
+                                 help="The amount of seconds between checkpoints")
+    argument_parser.add_argument("--resume",
                                  type=str,
-                                 help="Binary file to run")
+                                 default=None,
+                                 help="Checkpoint file to resume a run from (the input is then ignored)")
     argument_parser.add_argument("--run_info",
                                  action="store_true",
                                  help="Pass this flag to print additional info in the end of the program")
+    argument_parser.add_argument("--jit",
+                                 action="store_true",
+                                 help="Pass this flag to translate the program into a specialized Python function "
+                                      "before running it")
+    argument_parser.add_argument("--memoize",
+                                 action="store_true",
+                                 help="Pass this flag to memoize the effects of the regions of the program, "
+                                      "skipping repeated passes through them")
+    argument_parser.add_argument("--idioms",
+                                 type=str,
+                                 default=None,
+                                 help="A slang file of sugars, whose native sugars' expansions are recognized "
+                                      "in the binary and run as native instructions (see IdiomRecognizer)")
+    argument_parser.add_argument("--detect_cycles",
+                                 action="store_true",
+                                 help="Pass this flag to stop the run as soon as it gets back to a state it was in "
+                                      "(so it never halts)")
+    argument_parser.add_argument("--profile",
+                                 action="store_true",
+                                 help="Pass this flag to print a report of the hottest instructions and loops")
+    argument_parser.add_argument("--profile_output",
+                                 type=str,
+                                 default=None,
+                                 help="File to save the full profile to (CSV if it ends with '.csv', JSON otherwise)")
+    argument_parser.add_argument("--source_map",
+                                 type=str,
+                                 default=None,
+                                 help="The binary's source map (see the compiler's --source_map), "
+                                      "to roll the profile up to the slang lines")
+    argument_parser.add_argument("--trace",
+                                 type=str,
+                                 default=None,
+                                 help="Binary file to log every register write of the run to "
+                                      "(see s_interpreter.trace.read_trace)")
+    argument_parser.add_argument("--cache",
+                                 type=str,
+                                 default=None,
+                                 help="An sqlite file caching the results of finished runs, "
+                                      "to reuse when the binary is run on the same input again")
+    argument_parser.add_argument("--cache_size",
+                                 type=int,
+                                 default=100000,
+                                 help="The maximal amount of runs to keep in the cache")
+    argument_parser.add_argument("--fuel",
+                                 type=int,
+                                 default=None,
+                                 help="The maximal amount of instructions to perform")
+    argument_parser.add_argument("--timeout",
+                                 type=float,
+                                 default=None,
+                                 help="The maximal amount of seconds to run")
     arguments: Namespace = argument_parser.parse_args(args)
+    if arguments.trace is not None and arguments.resume is not None:
+        argument_parser.error("--trace can't be used when resuming a run")
+    if (
+        (arguments.profile or arguments.profile_output is not None or arguments.source_map is not None) and
+        arguments.resume is not None
+    ):
+        argument_parser.error("--profile, --profile_output and --source_map can't be used when resuming a run")
+    if arguments.idioms is not None and arguments.source_map is not None:
+        argument_parser.error("--source_map can't be used with --idioms, which replaces the binary's instructions")
+
+    if arguments.decode is not None and (
+        arguments.jit or
+        arguments.memoize or
+        arguments.idioms is not None or
+        arguments.profile or
+        arguments.profile_output is not None or
+        arguments.source_map is not None or
+        arguments.trace is not None or
+        arguments.cache is not None
+    ):
+        argument_parser.error("--decode can't be used with --jit, --memoize, --idioms, --profile, --profile_output, "
+                              "--source_map, --trace or --cache, which need the whole program")
+
+    program: _Union[_Program, _EncodedProgram]
+    if arguments.decode is not None:
+        program = _EncodedProgram.load(arguments.decode)
+    else:
+        with open(arguments.binary, "r") as binary_file:
+            binary_file_content: list[str] = binary_file.readlines()
+
+        program = _Program.compile(*binary_file_content)
+        if arguments.idioms is not None:
+            from s_interpreter.compiler import load_sugars
+            from s_interpreter.idioms import IdiomRecognizer
+
+            program = IdiomRecognizer(load_sugars(arguments.idioms)).recognize(program)
 
-    with open(arguments.binary, "r") as binary_file:
-        binary_file_content: list[str] = binary_file.readlines()
+    interpreter: Interpreter = Interpreter(program,
+                                           jit=arguments.jit,
+                                           memoize=arguments.memoize,
+                                           cache=(
+                                               None
+                                               if arguments.cache is None
+                                               else
+                                               _ResultCache(arguments.cache, arguments.cache_size)
+                                           ))
+    if arguments.checkpoint is not None and hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda *_: interpreter.request_checkpoint())
 
-    interpreter: Interpreter = Interpreter(_Program.compile(*binary_file_content))
-    print(f"Output: {interpreter.run(*arguments.x)}")
+    if arguments.resume is not None:
+        interpreter.load_checkpoint(arguments.resume)
+    else:
+        interpreter.reset(*arguments.x)
+
+    if arguments.profile or arguments.profile_output is not None or arguments.source_map is not None:
+        try:
+            profile = interpreter.profile(*arguments.x, fuel=arguments.fuel, timeout=arguments.timeout)
+        except ExecutionInterrupted as interruption:
+            print(f"{interruption} (stopped at instruction index {interruption.instruction_index}).")
+            profile = interruption.profile
+        print(profile.report())
+        if arguments.source_map is not None:
+            from s_interpreter.compiler import SourceMap
+
+            print()
+            print(profile.source_report(SourceMap.load(arguments.source_map)))
+        if arguments.profile_output is not None:
+            profile.save(arguments.profile_output)
+        return
+
+    try:
+        output: int
+        if arguments.trace is not None:
+            output = interpreter.trace(*arguments.x,
+                                       trace_path=arguments.trace,
+                                       fuel=arguments.fuel,
+                                       timeout=arguments.timeout)
+        elif arguments.resume is not None:
+            output = interpreter.resume(arguments.fuel,
+                                        arguments.timeout,
+                                        arguments.checkpoint,
+                                        arguments.checkpoint_interval,
+                                        arguments.detect_cycles)
+        else:
+            output = interpreter.run(*arguments.x,
+                                     fuel=arguments.fuel,
+                                     timeout=arguments.timeout,
+                                     checkpoint_path=arguments.checkpoint,
+                                     checkpoint_interval=arguments.checkpoint_interval,
+                                     detect_cycles=arguments.detect_cycles)
+        print(f"Output: {output}")
+    except ExecutionInterrupted as interruption:
+        print(f"{interruption} (stopped at instruction index {interruption.instruction_index}).")
+        print("The variable values:\n" +
+              "\n".join(f"\t{variable_name} = {variable_value}"
+                        for variable_name, variable_value in interruption.variables.items()))
+        raise SystemExit(1)
 
     if arguments.run_info:
         print(f"The interpreter ran {interpreter.instructions_performed} instructions.")
+        if arguments.decode is not None:
+            print(f"It decoded {interpreter.lowered.encoded.decoded_count} instructions.")
         print("The variable values:\n" +
               "\n".join(f"\t{variable_name} = {variable_value}"
                         for variable_name, variable_value in interpreter.variables.items()))
@@ -134,6 +2277,20 @@ if __name__ == '__main__':
 
 __all__ = (
     "InterpreterError",
+    "ExecutionInterrupted",
+    "FuelExhausted",
+    "DeadlineExceeded",
+    "NativeDivergence",
+    "CycleDetected",
+    "BreakpointHit",
+    "WatchpointHit",
+    "Opcode",
+    "NativeCall",
+    "Superinstruction",
+    "BasicBlock",
+    "LoopSummary",
+    "LoweredProgram",
+    "VariablesView",
     "Interpreter",
     "main"
 )
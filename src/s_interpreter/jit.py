@@ -0,0 +1,232 @@
+from s_interpreter.interpreter import (
+    LoopSummary as _LoopSummary,
+    LoweredProgram as _LoweredProgram,
+    NativeCall as _NativeCall,
+    Opcode as _Opcode
+)
+from typing import (
+    Callable as _Callable,
+    Optional as _Optional,
+    Sequence as _Sequence
+)
+
+from functools import lru_cache as _lru_cache
+
+
+class JitProgram:
+    """
+    A lowered program translated into a specialized Python function.
+
+    The program is split into basic blocks (starting at every jump target and after every jump).
+    Registers become local variables of the generated function, every block becomes straight-line arithmetic,
+    and the blocks are dispatched with a binary tree of `if` statements over the instruction index.
+    A block that jumps back to its own start is emitted in closed form when it is a summarizable counting loop
+    (see `LoopSummary`), and as a `while` loop otherwise, skipping the dispatch altogether.
+    Native instructions are blocks of their own, calling the evaluation of their operation,
+    and stop the function (on the native instruction) where it diverges.
+    Every block checks that it fits in the instruction budget before running, so that the budget is exact.
+    """
+
+    def __init__(self,
+                 opcodes: _Sequence[int],
+                 slots: _Sequence[int],
+                 targets: _Sequence[int],
+                 register_count: int,
+                 natives: _Sequence[_Optional[_NativeCall]] = ()):
+        self.__leaders: list[int] = JitProgram.__find_leaders(opcodes, targets)
+        self.__entry_points: frozenset[int] = frozenset(self.__leaders)
+        self.__natives: _Sequence[_Optional[_NativeCall]] = natives
+        self.__source: str = self.__generate(opcodes, slots, targets, register_count)
+
+        namespace: dict[str, _Callable] = {
+            f"native{instruction_index}": native.operation.evaluate
+            for instruction_index, native in enumerate(natives)
+            if native is not None
+        }
+        exec(compile(self.__source, "<s_interpreter.jit>", "exec"), namespace)
+        self.__function: _Callable[[list[int], int, int, int, float], tuple[int, int]] = namespace["run"]
+
+    @staticmethod
+    def __find_leaders(opcodes: _Sequence[int],
+                       targets: _Sequence[int]) -> list[int]:
+        program_length: int = len(opcodes) - 1
+        leaders: set[int] = {0}
+        for instruction_index, opcode in enumerate(opcodes[:program_length]):
+            if opcode == _Opcode.Jump:
+                leaders.add(targets[instruction_index])
+                leaders.add(instruction_index + 1)
+            elif opcode == _Opcode.Native:
+                leaders.add(instruction_index)
+                leaders.add(instruction_index + 1)
+        return sorted(leader for leader in leaders if leader < program_length)
+
+    @staticmethod
+    def __generate_native(native: _NativeCall,
+                          slot: int,
+                          start: int,
+                          indentation: str) -> list[str]:
+        arguments: str = ", ".join(f"r{operand}" if operand >= 0 else str(-operand - 1) for operand in native.operands)
+        return [indentation + line for line in ("if performed >= soft_limit:",
+                                                "    break",
+                                                f"value = native{start}({arguments})",
+                                                "if value is None:",
+                                                "    break",
+                                                f"r{slot} = value",
+                                                "performed += 1",
+                                                f"index = {start + 1}")]
+
+    def __generate_block(self,
+                         opcodes: _Sequence[int],
+                         slots: _Sequence[int],
+                         targets: _Sequence[int],
+                         start: int,
+                         end: int,
+                         indentation: str) -> list[str]:
+        if opcodes[start] == _Opcode.Native:
+            return JitProgram.__generate_native(self.__natives[start], slots[start], start, indentation)
+
+        body: list[str] = []
+        for instruction_index in range(start, end):
+            register: str = f"r{slots[instruction_index]}"
+            if opcodes[instruction_index] == _Opcode.Increment:
+                body.append(f"{register} += 1")
+            elif opcodes[instruction_index] == _Opcode.Decrement:
+                body.append(f"if {register}: {register} -= 1")
+
+        block_length: int = end - start
+        last_index: int = end - 1
+        if opcodes[last_index] != _Opcode.Jump:
+            return [indentation + line for line in (f"if performed + {block_length} > soft_limit:",
+                                                    "    break",
+                                                    *body,
+                                                    f"performed += {block_length}",
+                                                    f"index = {end}")]
+
+        register: str = f"r{slots[last_index]}"
+        if (loop := _LoopSummary.detect(opcodes, slots, targets, last_index)) is not None and loop.head == start:
+            return [indentation + line for line in (
+                f"iterations = max(1, -(-{register} // {loop.counter_decrements}))",
+                f"if performed + {block_length} * iterations > hard_limit:",
+                "    break",
+                f"{register} = 0",
+                *(f"r{slot} += {amount} * iterations" for slot, amount in loop.increments),
+                *(f"r{slot} = max(r{slot} - {amount} * iterations, 0)" for slot, amount in loop.decrements),
+                f"performed += {block_length} * iterations",
+                f"index = {end}"
+            )]
+
+        if targets[last_index] == start:
+            return [indentation + line for line in (
+                "while True:",
+                f"    if performed + {block_length} > soft_limit:",
+                "        break",
+                *("    " + line for line in body),
+                f"    performed += {block_length}",
+                f"    if not {register}:",
+                f"        index = {end}",
+                "        break",
+                f"if index == {start}:",
+                "    break"
+            )]
+
+        return [indentation + line for line in (f"if performed + {block_length} > soft_limit:",
+                                                "    break",
+                                                *body,
+                                                f"performed += {block_length}",
+                                                f"index = {targets[last_index]} if {register} else {end}")]
+
+    def __generate_dispatch(self,
+                            opcodes: _Sequence[int],
+                            slots: _Sequence[int],
+                            targets: _Sequence[int],
+                            leaders: list[int],
+                            ends: dict[int, int],
+                            indentation: str) -> list[str]:
+        if len(leaders) == 1:
+            return self.__generate_block(opcodes, slots, targets, leaders[0], ends[leaders[0]], indentation)
+
+        middle: int = len(leaders) // 2
+        return [
+            indentation + f"if index < {leaders[middle]}:",
+            *self.__generate_dispatch(opcodes, slots, targets, leaders[:middle], ends, indentation + "    "),
+            indentation + "else:",
+            *self.__generate_dispatch(opcodes, slots, targets, leaders[middle:], ends, indentation + "    ")
+        ]
+
+    def __generate(self,
+                   opcodes: _Sequence[int],
+                   slots: _Sequence[int],
+                   targets: _Sequence[int],
+                   register_count: int) -> str:
+        program_length: int = len(opcodes) - 1
+        registers: str = ", ".join(f"r{slot}" for slot in range(register_count)) + ","
+        ends: dict[int, int] = {}
+        for leader_index, leader in enumerate(self.__leaders):
+            end: int = (self.__leaders[leader_index + 1]
+                        if leader_index + 1 < len(self.__leaders)
+                        else
+                        program_length)
+            ends[leader] = next((instruction_index + 1
+                                 for instruction_index in range(leader, end)
+                                 if opcodes[instruction_index] == _Opcode.Jump),
+                                end)
+
+        lines: list[str] = [
+            "def run(registers, index, performed, soft_limit, hard_limit):",
+            f"    {registers} = registers",
+            f"    while index < {program_length}:",
+            *(self.__generate_dispatch(opcodes, slots, targets, self.__leaders, ends, " " * 8)
+              if len(self.__leaders) > 0
+              else
+              ["        break"]),
+            f"    registers[:] = {registers}",
+            "    return index, performed"
+        ]
+        return "\n".join(lines) + "\n"
+
+    @property
+    def source(self) -> str:
+        return self.__source
+
+    @property
+    def leaders(self) -> list[int]:
+        return self.__leaders
+
+    def is_entry_point(self,
+                       instruction_index: int) -> bool:
+        return instruction_index in self.__entry_points
+
+    def __call__(self,
+                 registers: list[int],
+                 instruction_index: int,
+                 instructions_performed: int,
+                 soft_limit: int,
+                 hard_limit: float) -> tuple[int, int]:
+        """
+        Runs from a block leader until the program halts or the next block doesn't fit in the budget:
+        blocks must end by `soft_limit` instructions in total, and summarized loops by `hard_limit`.
+        """
+        return self.__function(registers, instruction_index, instructions_performed, soft_limit, hard_limit)
+
+
+@_lru_cache(maxsize=64)
+def _compile_cached(opcodes: tuple[int, ...],
+                     slots: tuple[int, ...],
+                     targets: tuple[int, ...],
+                     register_count: int,
+                     natives: tuple[_Optional[_NativeCall], ...]) -> JitProgram:
+    return JitProgram(opcodes, slots, targets, register_count, natives)
+
+
+def jit_compile(lowered: _LoweredProgram) -> JitProgram:
+    return _compile_cached(tuple(lowered.opcodes),
+                            tuple(lowered.slots),
+                            tuple(lowered.targets),
+                            len(lowered.variables),
+                            tuple(lowered.natives))
+
+
+__all__ = (
+    "JitProgram",
+    "jit_compile"
+)
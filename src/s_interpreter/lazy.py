@@ -0,0 +1,166 @@
+from s_interpreter.compiler import (
+    Instruction as _Instruction,
+    Label as _Label,
+    Program as _Program
+)
+from typing import Optional as _Optional
+
+
+class EncodedProgram:
+    """
+    A program given by its encoding (see `Program.decode`), whose instructions are decoded lazily.
+
+    The code of instruction `i` is the exponent of the `(i + 1)`-th prime in `encoding + 1`,
+    so it is extracted by dividing by that prime alone (instead of factoring the whole encoding), and cached.
+    An instruction whose code is 0 (`Y <- Y`) only exists if a larger prime divides the encoding,
+    which is found out by dividing out the primes of the prefix before it, once.
+    Jump targets are found by searching the codes from the start up to the first one with the label.
+    An `Interpreter` runs it through a lazily lowered program (see `LoweredProgram`),
+    which decodes every instruction the first time the run reaches it.
+    """
+
+    def __init__(self,
+                 encoding: int):
+        if encoding < 0:
+            raise ValueError(f"{__class__.__name__} encoding must be non-negative!")
+
+        self.__number: int = encoding + 1
+        self.__codes: dict[int, int] = {}
+        self.__instructions: dict[int, _Optional[_Instruction]] = {}
+        self.__label_indices: dict[_Label, int] = {}
+
+        # The encoding without the primes of its first `__prefix_length` instructions
+        self.__cofactor: int = self.__number
+        self.__prefix_length: int = 0
+        self.__length: _Optional[int] = 0 if self.__number == 1 else None
+
+    @staticmethod
+    def load(encoding_path: str) -> "EncodedProgram":
+        """
+        Loads the encoding from a file holding it in decimal, or in hexadecimal with a `0x` prefix.
+        Decimal encodings are read past the digits Python converts to integers by default.
+        """
+        import sys
+
+        with open(encoding_path, "r") as encoding_file:
+            encoding_text: str = encoding_file.read().strip()
+        if encoding_text.lower().startswith("0x"):
+            return EncodedProgram(int(encoding_text, 16))
+
+        if not hasattr(sys, "get_int_max_str_digits"):
+            return EncodedProgram(int(encoding_text))
+        max_str_digits: int = sys.get_int_max_str_digits()
+        sys.set_int_max_str_digits(0)
+        try:
+            return EncodedProgram(int(encoding_text))
+        finally:
+            sys.set_int_max_str_digits(max_str_digits)
+
+    @property
+    def encoding(self) -> int:
+        return self.__number - 1
+
+    @property
+    def decoded_count(self) -> int:
+        """
+        The amount of instructions decoded so far.
+        """
+        return sum(instruction is not None for instruction in self.__instructions.values())
+
+    @property
+    def length(self) -> _Optional[int]:
+        """
+        The amount of instructions in the program, if already known.
+        """
+        return self.__length
+
+    @staticmethod
+    def __prime(index: int) -> int:
+        from sympy import prime
+
+        return prime(index + 1)
+
+    def __code(self,
+               index: int) -> int:
+        if (code := self.__codes.get(index)) is None:
+            prime: int = EncodedProgram.__prime(index)
+            number: int = self.__number
+            code = 0
+            while number % prime == 0:
+                number //= prime
+                code += 1
+            self.__codes[index] = code
+        return code
+
+    def __exists(self,
+                 index: int) -> bool:
+        if self.__length is not None:
+            return index < self.__length
+        if self.__code(index) > 0:
+            return True
+
+        while self.__prefix_length <= index and self.__cofactor > 1:
+            self.__cofactor //= EncodedProgram.__prime(self.__prefix_length) ** self.__code(self.__prefix_length)
+            self.__prefix_length += 1
+        if self.__cofactor == 1:
+            # Every prime factor was divided out, so the last instruction is the last one with a nonzero code
+            self.__length = max((prefix_index + 1
+                                 for prefix_index in range(self.__prefix_length)
+                                 if self.__codes[prefix_index] > 0),
+                                default=0)
+            return index < self.__length
+        return True
+
+    def instruction(self,
+                    index: int) -> _Optional[_Instruction]:
+        """
+        Returns the instruction at the index, or None if the program ends before it.
+        """
+        if index not in self.__instructions:
+            self.__instructions[index] = _Instruction.decode(self.__code(index)) if self.__exists(index) else None
+        return self.__instructions[index]
+
+    def label_index(self,
+                    label: _Label) -> int:
+        """
+        Returns the index of the first instruction with the label, or the end of the program if there is none.
+        """
+        if (label_index := self.__label_indices.get(label)) is None:
+            # The label of an instruction is the exponent of 2 in its code + 1, so the codes are searched undecoded
+            label_encoding: int = label.encode()
+            label_index = 0
+            while (
+                self.__exists(label_index) and
+                ((self.__code(label_index) + 1) & -(self.__code(label_index) + 1)).bit_length() - 1 != label_encoding
+            ):
+                label_index += 1
+            self.__label_indices[label] = label_index
+        return label_index
+
+    def label_indices(self,
+                      label: _Label) -> list[int]:
+        """
+        Returns the indices of every instruction with the label, searching the codes up to the end of the program.
+        """
+        label_encoding: int = label.encode()
+        label_indices: list[int] = []
+        index: int = 0
+        while self.__exists(index):
+            if ((self.__code(index) + 1) & -(self.__code(index) + 1)).bit_length() - 1 == label_encoding:
+                label_indices.append(index)
+            index += 1
+        return label_indices
+
+    def to_program(self) -> _Program:
+        """
+        Decodes the whole program.
+        """
+        instructions: list[_Instruction] = []
+        while (instruction := self.instruction(len(instructions))) is not None:
+            instructions.append(instruction)
+        return _Program(instructions)
+
+
+__all__ = (
+    "EncodedProgram",
+)
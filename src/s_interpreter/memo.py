@@ -0,0 +1,201 @@
+from s_interpreter.interpreter import (
+    LoweredProgram as _LoweredProgram,
+    Opcode as _Opcode
+)
+from dataclasses import dataclass as _dataclass
+from typing import (
+    Any as _Any,
+    Optional as _Optional
+)
+
+
+@_dataclass(frozen=True)
+class RegionTransition:
+    """
+    The effect of one pass through a region in one class of states:
+    the amount of instructions performed, the index of the instruction it exits at,
+    and the net `v -> max(v + shift, floor)` of every variable it touches (split as in `BasicBlock`).
+    """
+    length: int
+    exit_index: int
+    shifts: tuple[tuple[int, int], ...]
+    effects: tuple[tuple[int, int, int], ...]
+
+    def apply(self,
+              registers: list[int]) -> int:
+        """
+        Applies the transition to the registers, and returns the index of the instruction to continue at.
+        """
+        for slot, shift in self.shifts:
+            registers[slot] += shift
+        for slot, shift, floor in self.effects:
+            registers[slot] = max(registers[slot] + shift, floor)
+        return self.exit_index
+
+
+class RegionMemo:
+    """
+    Memoized transitions of the regions of a lowered program, so repeated passes through a region skip stepping.
+
+    A region starts at any instruction, and runs until it reaches a native instruction, a summarized loop
+    or the end of the program, or until `max_tests` jump tests or `max_length` instructions
+    (so the iterations of an unsummarized loop are unrolled into its regions).
+    The increments and decrements in a region are composed symbolically from the entry values,
+    so a jump reading a variable after a net `shift` (with a floor of 0) is taken iff the variable was above `-shift`
+    on entry, and the path through the region is decided by comparisons of entry values to constants.
+    Those comparisons form a decision tree per region start, whose leaves are the recorded transitions:
+    a state class is walked once, and looked up on every later pass.
+    The trees are dropped altogether when they grow beyond `max_nodes` comparisons.
+    """
+
+    def __init__(self,
+                 lowered: _LoweredProgram,
+                 max_tests: int = 64,
+                 max_length: int = 1 << 12,
+                 max_nodes: int = 1 << 20):
+        if max_tests <= 0 or max_length <= 0 or max_nodes <= 0:
+            raise ValueError("Region limits must be positive!")
+
+        self.__lowered: _LoweredProgram = lowered
+        self.__max_tests: int = max_tests
+        self.__max_length: int = max_length
+        self.__max_nodes: int = max_nodes
+        self.__boundaries: list[bool] = [
+            opcode in {_Opcode.Native, _Opcode.Halt}
+            for opcode in lowered.opcodes
+        ]
+        for head in lowered.loops:
+            self.__boundaries[head] = True
+
+        # A tree node is `[slot, threshold, node if above, node otherwise]`, and a leaf is a `RegionTransition`
+        self.__roots: list[_Any] = [None] * len(self.__boundaries)
+        self.__node_count: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    @property
+    def lowered(self) -> _LoweredProgram:
+        return self.__lowered
+
+    @property
+    def max_tests(self) -> int:
+        return self.__max_tests
+
+    @property
+    def max_length(self) -> int:
+        return self.__max_length
+
+    @property
+    def max_nodes(self) -> int:
+        return self.__max_nodes
+
+    @property
+    def node_count(self) -> int:
+        return self.__node_count
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def transition(self,
+                   start: int,
+                   registers: list[int]) -> _Optional[RegionTransition]:
+        """
+        Returns the transition of the region starting at the instruction in the state of the registers
+        (recording it the first time), or None if no region starts there.
+        """
+        if self.__boundaries[start]:
+            return None
+
+        node: _Any = self.__roots[start]
+        while type(node) is list:
+            node = node[2] if registers[node[0]] > node[1] else node[3]
+        if node is not None:
+            self.__hits += 1
+            return node
+
+        self.__misses += 1
+        return self.__record(start, registers)
+
+    def __record(self,
+                 start: int,
+                 registers: list[int]) -> RegionTransition:
+        opcodes: list[int] = self.__lowered.opcodes
+        slots: list[int] = self.__lowered.slots
+        targets: list[int] = self.__lowered.targets
+        effects: dict[int, tuple[int, int]] = {}
+        tests: list[tuple[int, int, bool]] = []
+
+        instruction_index: int = start
+        length: int = 0
+        while (
+            length < self.__max_length and
+            len(tests) < self.__max_tests and
+            (length == 0 or not self.__boundaries[instruction_index])
+        ):
+            opcode: int = opcodes[instruction_index]
+            slot: int = slots[instruction_index]
+            if opcode == _Opcode.Jump:
+                shift, floor = effects.get(slot, (0, 0))
+                if shift > 0 or floor > 0:
+                    taken: bool = True
+                else:
+                    taken = registers[slot] > -shift
+                    tests.append((slot, -shift, taken))
+                instruction_index = targets[instruction_index] if taken else instruction_index + 1
+            else:
+                if opcode != _Opcode.NoOp:
+                    # Composing `v -> max(v + shift, floor)` with `v -> max(v +- 1, 0)`
+                    shift, floor = effects.get(slot, (0, 0))
+                    step: int = 1 if opcode == _Opcode.Increment else -1
+                    effects[slot] = (shift + step, max(floor + step, 0))
+                instruction_index += 1
+            length += 1
+
+        transition: RegionTransition = RegionTransition(
+            length,
+            instruction_index,
+            tuple((slot, shift) for slot, (shift, floor) in effects.items() if shift >= floor),
+            tuple((slot, shift, floor) for slot, (shift, floor) in effects.items() if shift < floor)
+        )
+        self.__insert(start, tests, transition)
+        return transition
+
+    def __insert(self,
+                 start: int,
+                 tests: list[tuple[int, int, bool]],
+                 transition: RegionTransition) -> None:
+        if self.__node_count + len(tests) > self.__max_nodes:
+            self.clear()
+        if not tests:
+            self.__roots[start] = transition
+            return
+
+        if self.__roots[start] is None:
+            self.__roots[start] = [tests[0][0], tests[0][1], None, None]
+            self.__node_count += 1
+        # The path through a region is deterministic, so the tests match the existing nodes up to the new branch
+        node: list = self.__roots[start]
+        for test_index, (_, _, taken) in enumerate(tests):
+            branch: int = 2 if taken else 3
+            if test_index == len(tests) - 1:
+                node[branch] = transition
+            else:
+                if node[branch] is None:
+                    node[branch] = [tests[test_index + 1][0], tests[test_index + 1][1], None, None]
+                    self.__node_count += 1
+                node = node[branch]
+
+    def clear(self) -> None:
+        self.__roots = [None] * len(self.__boundaries)
+        self.__node_count = 0
+
+
+__all__ = (
+    "RegionTransition",
+    "RegionMemo"
+)
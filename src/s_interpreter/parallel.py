@@ -0,0 +1,67 @@
+from s_interpreter.compiler import Program as _Program
+from s_interpreter.interpreter import (
+    Interpreter as _Interpreter,
+    LoweredProgram as _LoweredProgram
+)
+from typing import (
+    Iterable as _Iterable,
+    Iterator as _Iterator,
+    Optional as _Optional,
+    Sequence as _Sequence,
+    Union as _Union
+)
+
+_worker_interpreter: _Optional[_Interpreter] = None
+
+
+def _initialize_worker(lowered: _LoweredProgram,
+                       jit: bool) -> None:
+    global _worker_interpreter
+    _worker_interpreter = _Interpreter(lowered, jit=jit)
+
+
+def _run_inputs(x: _Sequence[int]) -> int:
+    return _worker_interpreter.run(*x)
+
+
+def _run_chunk(chunk: list[tuple[int, _Sequence[int]]]) -> list[tuple[int, int]]:
+    return [(index, _worker_interpreter.run(*x)) for index, x in chunk]
+
+
+def run_many(program: _Union[_Program, _LoweredProgram],
+             inputs: _Iterable[_Sequence[int]],
+             workers: _Optional[int] = None,
+             chunksize: int = 1,
+             ordered: bool = True,
+             jit: bool = False) -> _Iterator:
+    """
+    Runs the program on every input tuple across a `ProcessPoolExecutor` of `workers` processes.
+
+    The program is lowered once and sent to every worker once (as flat integer lists) when the worker starts,
+    so that tasks only carry their inputs, `chunksize` of them at a time.
+    When `ordered`, the outputs are yielded in the order of the inputs.
+    Otherwise `(input index, output)` pairs are yielded as soon as their chunk finishes.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    lowered: _LoweredProgram = program if type(program) is _LoweredProgram else _LoweredProgram(program)
+    executor: ProcessPoolExecutor = ProcessPoolExecutor(max_workers=workers,
+                                                        initializer=_initialize_worker,
+                                                        initargs=(lowered, jit))
+    try:
+        if ordered:
+            yield from executor.map(_run_inputs, inputs, chunksize=chunksize)
+        else:
+            indexed_inputs: list[tuple[int, _Sequence[int]]] = list(enumerate(inputs))
+            for future in as_completed([
+                executor.submit(_run_chunk, indexed_inputs[chunk_start:chunk_start + chunksize])
+                for chunk_start in range(0, len(indexed_inputs), chunksize)
+            ]):
+                yield from future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+__all__ = (
+    "run_many",
+)
@@ -0,0 +1,188 @@
+from s_interpreter.compiler import (
+    Program as _Program,
+    SourceFrame as _SourceFrame,
+    SourceMap as _SourceMap
+)
+from typing import Optional as _Optional
+
+
+class Profile:
+    """
+    Per-instruction execution counts of a run: how many times every instruction was performed,
+    and how many times every jump was taken (the rest of its hits it wasn't).
+    A jump to an earlier (or the same) instruction is a back-edge, i.e. the closing jump of a loop.
+    """
+
+    def __init__(self,
+                 program: _Program):
+        self.__program: _Program = program
+        self.hits: list[int] = [0] * len(program.instructions)
+        self.taken: list[int] = [0] * len(program.instructions)
+        self.output: _Optional[int] = None
+        self.instructions_performed: int = 0
+        self.__targets: _Optional[list[int]] = None
+
+    @property
+    def program(self) -> _Program:
+        return self.__program
+
+    def __is_jump(self,
+                  instruction_index: int) -> bool:
+        from s_interpreter.compiler import JumpCommand
+        return type(self.__program.instructions[instruction_index].sentence.command) is JumpCommand
+
+    def not_taken(self,
+                  instruction_index: int) -> int:
+        return self.hits[instruction_index] - self.taken[instruction_index]
+
+    def hottest_instructions(self,
+                             count: _Optional[int] = None) -> list[tuple[int, int]]:
+        """
+        The `(instruction index, hits)` pairs of the most performed instructions, hottest first.
+        """
+        return sorted(
+            ((instruction_index, hits) for instruction_index, hits in enumerate(self.hits) if hits > 0),
+            key=lambda pair: (-pair[1], pair[0])
+        )[:count]
+
+    def back_edges(self,
+                   count: _Optional[int] = None) -> list[tuple[int, int, int]]:
+        """
+        The `(jump index, target index, times taken)` of the most taken back-edges (loops), hottest first.
+        """
+        if self.__targets is None:
+            from s_interpreter.interpreter import LoweredProgram
+            self.__targets = LoweredProgram(self.__program).targets
+
+        targets: list[int] = self.__targets
+        return sorted(
+            (
+                (instruction_index, targets[instruction_index], self.taken[instruction_index])
+                for instruction_index in range(len(self.hits))
+                if self.__is_jump(instruction_index) and
+                targets[instruction_index] <= instruction_index and
+                self.taken[instruction_index] > 0
+            ),
+            key=lambda edge: (-edge[2], edge[0])
+        )[:count]
+
+    def report(self,
+               count: int = 20) -> str:
+        total: int = max(self.instructions_performed, 1)
+        lines: list[str] = [
+            f"Output: {self.output}",
+            f"Instructions performed: {self.instructions_performed}",
+            "",
+            "Hottest instructions:",
+            *(
+                f"\t#{instruction_index:<6} {hits:>14} ({100 * hits / total:6.2f}%)  "
+                f"{self.__program.instructions[instruction_index]}" +
+                (f"  [taken {self.taken[instruction_index]}, not taken {self.not_taken(instruction_index)}]"
+                 if self.__is_jump(instruction_index)
+                 else
+                 "")
+                for instruction_index, hits in self.hottest_instructions(count)
+            ),
+            "",
+            "Hottest loops (back-edges):",
+            *(
+                f"\t#{jump_index:<6} -> #{target_index:<6} taken {taken} times  "
+                f"{self.__program.instructions[jump_index]}"
+                for jump_index, target_index, taken in self.back_edges(count)
+            )
+        ]
+        return "\n".join(lines)
+
+    def by_source(self,
+                  source_map: _SourceMap) -> dict[tuple[_SourceFrame, ...], int]:
+        """
+        Rolls the hits up the source map: maps every chain of source lines (a MAIN line, the line of the sugar
+        it invoked, and so on) to the amount of instructions performed on its behalf.
+        """
+        if len(source_map) != len(self.hits):
+            raise ValueError(f"The source map describes {len(source_map)} instructions "
+                             f"but the program has {len(self.hits)}")
+
+        source_hits: dict[tuple[_SourceFrame, ...], int] = {}
+        for instruction_index, hits in enumerate(self.hits):
+            if hits > 0:
+                origin: tuple[_SourceFrame, ...] = source_map[instruction_index]
+                for depth in range(1, len(origin) + 1):
+                    source_hits[origin[:depth]] = source_hits.get(origin[:depth], 0) + hits
+        return source_hits
+
+    def source_report(self,
+                      source_map: _SourceMap,
+                      count: int = 10,
+                      depth: _Optional[int] = 3) -> str:
+        """
+        The costliest source lines, each followed by its costliest lines in the sugars it invoked
+        (the `count` costliest per level, down to `depth` levels of nesting).
+        """
+        source_hits: dict[tuple[_SourceFrame, ...], int] = self.by_source(source_map)
+        children: dict[tuple[_SourceFrame, ...], list[tuple[_SourceFrame, ...]]] = {}
+        for origin in source_hits:
+            children.setdefault(origin[:-1], []).append(origin)
+
+        total: int = max(self.instructions_performed, 1)
+        lines: list[str] = ["Costliest source lines:"]
+        to_report: list[tuple[_SourceFrame, ...]] = sorted(children.get((), []),
+                                                           key=lambda origin: -source_hits[origin])[count - 1::-1]
+        while len(to_report) > 0:
+            origin: tuple[_SourceFrame, ...] = to_report.pop()
+            lines.append(f"\t{source_hits[origin]:>14} ({100 * source_hits[origin] / total:6.2f}%)  " +
+                         "  " * (len(origin) - 1) + str(origin[-1]))
+            if depth is None or len(origin) < depth:
+                to_report.extend(sorted(children.get(origin, []),
+                                        key=lambda child: -source_hits[child])[count - 1::-1])
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        import json
+
+        return json.dumps({
+            "output": self.output,
+            "instructions_performed": self.instructions_performed,
+            "instructions": [
+                {
+                    "index": instruction_index,
+                    "instruction": str(instruction),
+                    "hits": self.hits[instruction_index],
+                    "taken": self.taken[instruction_index] if self.__is_jump(instruction_index) else None
+                }
+                for instruction_index, instruction in enumerate(self.__program.instructions)
+            ],
+            "back_edges": [
+                {"jump": jump_index, "target": target_index, "taken": taken}
+                for jump_index, target_index, taken in self.back_edges()
+            ]
+        })
+
+    def to_csv(self) -> str:
+        import csv
+        import io
+
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerow(("index", "instruction", "hits", "taken", "not_taken"))
+        for instruction_index, instruction in enumerate(self.__program.instructions):
+            is_jump: bool = self.__is_jump(instruction_index)
+            writer.writerow((instruction_index,
+                             str(instruction).strip(),
+                             self.hits[instruction_index],
+                             self.taken[instruction_index] if is_jump else "",
+                             self.not_taken(instruction_index) if is_jump else ""))
+        return output.getvalue()
+
+    def save(self,
+             output_path: str) -> None:
+        """
+        Saves the profile as CSV if the path ends with '.csv', and as JSON otherwise.
+        """
+        with open(output_path, "w") as output_file:
+            output_file.write(self.to_csv() if output_path.lower().endswith(".csv") else self.to_json())
+
+
+__all__ = (
+    "Profile",
+)
@@ -0,0 +1,281 @@
+from s_interpreter.compiler import Program as _Program
+from s_interpreter.interpreter import (
+    Interpreter as _Interpreter,
+    LoweredProgram as _LoweredProgram
+)
+from typing import (
+    Any as _Any,
+    Iterable as _Iterable,
+    Optional as _Optional,
+    Sequence as _Sequence,
+    Union as _Union
+)
+
+# Programs and outputs are sent as single JSON lines, which may get far longer than asyncio's default line limit
+_LINE_LIMIT: int = 1 << 30
+
+
+class _OversizedNumber(str):
+    """
+    A JSON number with more digits than Python converts, kept undecoded so its request is still answered (by id).
+    """
+
+
+def _parse_int(digits: str) -> _Union[int, _OversizedNumber]:
+    try:
+        return int(digits)
+    except ValueError:
+        return _OversizedNumber(digits)
+
+
+class JobServer:
+    """
+    A local execution service on a Unix socket, time-slicing many runs on one asyncio event loop.
+
+    Clients send newline-delimited JSON requests over a connection, and get a JSON line back for each:
+    - `{"op": "register", "program": "<binary>"}` registers a program, answering `{"program": "<digest>"}`.
+    - `{"op": "run", "program": "<digest>", "inputs": [...], "fuel": ...}` answers
+      `{"output": ..., "instructions_performed": ...}`, or `{"error": ..., "type": ...}` when the run fails.
+    JSON numbers are limited to the digits Python converts to decimal, so inputs may also be given as hexadecimal
+    strings (e.g. `"0x1f"`), and a run request with `"hex": true` gets its numbers back as ones.
+    Any `"id"` of a request is echoed back in its response, as a connection's runs may finish out of order.
+
+    Every run is a task that yields to the event loop after every `slice_steps` instructions,
+    so a few long runs don't hold up the short ones submitted after them.
+    """
+
+    def __init__(self,
+                 socket_path: str,
+                 programs: _Iterable[_Union[_Program, _LoweredProgram]] = (),
+                 slice_steps: int = _Interpreter.CHECK_INTERVAL):
+        self.__socket_path: str = socket_path
+        self.__slice_steps: int = slice_steps
+        self.__programs: dict[str, _LoweredProgram] = {}
+        self.__server: _Any = None
+        # The requests being answered on every open connection, by the connection's task
+        self.__clients: dict[_Any, set[_Any]] = {}
+        for program in programs:
+            self.register(program)
+
+    @property
+    def socket_path(self) -> str:
+        return self.__socket_path
+
+    @property
+    def programs(self) -> dict[str, _LoweredProgram]:
+        return dict(self.__programs)
+
+    @property
+    def pending_requests(self) -> int:
+        return sum(len(requests) for requests in self.__clients.values())
+
+    def register(self,
+                 program: _Union[_Program, _LoweredProgram]) -> str:
+        """
+        Makes the program available to run requests, and returns its digest (see `LoweredProgram.digest`).
+        """
+        lowered: _LoweredProgram = program if type(program) is _LoweredProgram else _LoweredProgram(program)
+        self.__programs.setdefault(digest := lowered.digest(), lowered)
+        return digest
+
+    async def run(self,
+                  program_digest: str,
+                  inputs: _Sequence[int],
+                  fuel: _Optional[int] = None) -> tuple[int, int]:
+        """
+        Runs a registered program on the event loop, returning its output and the amount of instructions performed.
+        """
+        if program_digest not in self.__programs:
+            raise KeyError(f"Unknown program: '{program_digest}'")
+
+        interpreter: _Interpreter = _Interpreter(self.__programs[program_digest])
+        output: int = await interpreter.run_async(*inputs, fuel=fuel, slice_steps=self.__slice_steps)
+        return output, interpreter.instructions_performed
+
+    async def __handle_request(self,
+                               request: dict) -> dict:
+        from s_interpreter.compiler import CompilationError
+        from s_interpreter.interpreter import ExecutionInterrupted, InterpreterError
+
+        response: dict = {} if "id" not in request else {"id": request["id"]}
+        try:
+            if request.get("op") == "register":
+                response["program"] = self.register(_Program.compile(*request["program"].splitlines()))
+            elif request.get("op") == "run":
+                if any(type(value) is _OversizedNumber for value in (*request.get("inputs", []), request.get("fuel"))):
+                    raise ValueError("Numbers this large must be given as hexadecimal strings (e.g. \"0x1f\")")
+                inputs: list[int] = [
+                    int(value, 16) if type(value) is str else value
+                    for value in request.get("inputs", [])
+                ]
+                response["output"], response["instructions_performed"] = await self.run(request["program"],
+                                                                                        inputs,
+                                                                                        request.get("fuel"))
+            else:
+                raise ValueError(f"Unknown operation: '{request.get('op')}'")
+        except ExecutionInterrupted as interruption:
+            response.update(error=str(interruption),
+                            type=type(interruption).__name__,
+                            instructions_performed=interruption.instructions_performed)
+        except (InterpreterError, CompilationError, KeyError, ValueError, TypeError) as exception:
+            response.update(error=str(exception), type=type(exception).__name__)
+
+        if request.get("hex"):
+            for key in ("output", "instructions_performed"):
+                if key in response:
+                    response[key] = format(response[key], "#x")
+        return response
+
+    async def __respond(self,
+                        request_line: bytes,
+                        writer: _Any) -> None:
+        import json
+
+        try:
+            request: _Any = json.loads(request_line, parse_int=_parse_int)
+            response: dict = (
+                await self.__handle_request(request)
+                if type(request) is dict
+                else
+                {"error": "Requests must be JSON objects", "type": "ValueError"}
+            )
+        except ValueError as exception:
+            response = {"error": str(exception), "type": "ValueError"}
+        try:
+            response_line: str = json.dumps(response)
+        except ValueError as exception:
+            # An output beyond the digits Python converts to decimal
+            response_line = json.dumps({
+                **({} if "id" not in response else {"id": response["id"]}),
+                "error": f"{exception} (request a hexadecimal output with \"hex\": true)",
+                "type": "ValueError"
+            })
+        writer.write(response_line.encode() + b"\n")
+        await writer.drain()
+
+    async def __handle_client(self,
+                              reader: _Any,
+                              writer: _Any) -> None:
+        import asyncio
+
+        requests: set[asyncio.Task] = set()
+        self.__clients[client := asyncio.current_task()] = requests
+        try:
+            while request_line := await reader.readline():
+                request: asyncio.Task = asyncio.create_task(self.__respond(request_line, writer))
+                requests.add(request)
+                # Answered requests are dropped right away, as a connection may stay open indefinitely
+                request.add_done_callback(requests.discard)
+            await asyncio.gather(*requests)
+        except (ConnectionError, asyncio.CancelledError):
+            # The client went away, or the server is closing
+            pass
+        finally:
+            for request in list(requests):
+                request.cancel()
+            writer.close()
+            self.__clients.pop(client, None)
+
+    async def start(self) -> None:
+        import asyncio
+
+        self.__server = await asyncio.start_unix_server(self.__handle_client,
+                                                         path=self.__socket_path,
+                                                         limit=_LINE_LIMIT)
+
+    async def serve_forever(self) -> None:
+        if self.__server is None:
+            await self.start()
+        await self.__server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Stops accepting connections, and drops the open ones along with their unfinished runs.
+        """
+        import asyncio
+
+        if self.__server is not None:
+            self.__server.close()
+            for client in self.__clients:
+                client.cancel()
+            await asyncio.gather(*self.__clients, return_exceptions=True)
+            await self.__server.wait_closed()
+            self.__server = None
+
+    async def __aenter__(self) -> "JobServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self,
+                        *_: _Any) -> None:
+        await self.close()
+
+
+async def submit(socket_path: str,
+                 *requests: dict) -> list[dict]:
+    """
+    Sends the requests to the `JobServer` listening on the socket over one connection,
+    and returns the responses in the order of the requests.
+    """
+    import asyncio
+    import json
+
+    reader, writer = await asyncio.open_unix_connection(socket_path, limit=_LINE_LIMIT)
+    try:
+        for request_index, request in enumerate(requests):
+            writer.write(json.dumps({**request, "id": request_index}).encode() + b"\n")
+        await writer.drain()
+
+        responses: list[_Optional[dict]] = [None] * len(requests)
+        for _ in requests:
+            response: dict = json.loads(await reader.readline())
+            responses[response.pop("id")] = response
+        return responses
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def main(args: _Optional[_Sequence[str]] = None) -> None:
+    from argparse import ArgumentParser, Namespace
+    import asyncio
+
+    argument_parser: ArgumentParser = ArgumentParser(description="S Job Server")
+    argument_parser.add_argument("-s",
+                                 "--socket",
+                                 required=True,
+                                 type=str,
+                                 help="The Unix socket to listen on")
+    argument_parser.add_argument("-b",
+                                 "--binary",
+                                 type=str,
+                                 nargs="*",
+                                 default=[],
+                                 help="Binary files to register on startup")
+    argument_parser.add_argument("--slice_steps",
+                                 type=int,
+                                 default=_Interpreter.CHECK_INTERVAL,
+                                 help="The amount of instructions a run performs before letting other runs continue")
+    arguments: Namespace = argument_parser.parse_args(args)
+
+    server: JobServer = JobServer(arguments.socket, slice_steps=arguments.slice_steps)
+    for binary_path in arguments.binary:
+        with open(binary_path, "r") as binary_file:
+            print(f"{binary_path}: {server.register(_Program.compile(*binary_file.readlines()))}")
+
+    print(f"Serving on '{arguments.socket}'")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
+
+
+__all__ = (
+    "JobServer",
+    "submit",
+    "main"
+)
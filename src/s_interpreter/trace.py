@@ -0,0 +1,119 @@
+from array import array as _array
+from typing import (
+    Any as _Any,
+    BinaryIO as _BinaryIO,
+    Sequence as _Sequence
+)
+
+TRACE_MAGIC: bytes = b"STRACE\x00\x01"
+TRACE_FIELDS: tuple[str, ...] = ("step", "pc", "slot", "value")
+SATURATED_VALUE: int = 2 ** 64 - 1
+
+
+class TraceWriter:
+    """
+    Logs `(step, pc, slot, value)` records of register writes into a preallocated ring buffer of unsigned 64-bit
+    integers, and appends the buffer to a binary file in chunks whenever it fills up.
+
+    The file starts with `TRACE_MAGIC`, followed by a 4-byte little-endian length and a JSON header
+    (the variable names of the slots and the byte order of the records), followed by the records themselves.
+    A value that doesn't fit in 64 bits is logged as `SATURATED_VALUE`.
+    """
+
+    def __init__(self,
+                 trace_path: str,
+                 variables: _Sequence[str],
+                 capacity: int = 1 << 16):
+        import json
+        import sys
+
+        if capacity <= 0:
+            raise ValueError("Trace buffer capacity must be positive!")
+
+        header: bytes = json.dumps({
+            "fields": TRACE_FIELDS,
+            "variables": list(variables),
+            "byteorder": sys.byteorder
+        }).encode()
+
+        self.__file: _BinaryIO = open(trace_path, "wb")
+        self.__file.write(TRACE_MAGIC + len(header).to_bytes(4, "little") + header)
+        self.buffer: _array = _array("Q", bytes(8 * len(TRACE_FIELDS) * capacity))
+        self.position: int = 0
+        self.records_written: int = 0
+
+    def record(self,
+               step: int,
+               pc: int,
+               slot: int,
+               value: int) -> None:
+        if self.position == len(self.buffer):
+            self.flush()
+        self.buffer[self.position] = step
+        self.buffer[self.position + 1] = pc
+        self.buffer[self.position + 2] = slot
+        self.buffer[self.position + 3] = value if value < SATURATED_VALUE else SATURATED_VALUE
+        self.position += 4
+
+    def flush(self) -> None:
+        """
+        Appends the records in the buffer to the file and empties the buffer.
+        """
+        self.__file.write(memoryview(self.buffer)[:self.position])
+        self.records_written += self.position // len(TRACE_FIELDS)
+        self.position = 0
+
+    def close(self) -> None:
+        if not self.__file.closed:
+            self.flush()
+            self.__file.close()
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self,
+                 *_: _Any) -> None:
+        self.close()
+
+
+def read_trace_header(trace_path: str) -> tuple[dict, int]:
+    """
+    Returns the JSON header of the trace file and the offset its records start at.
+    """
+    import json
+
+    with open(trace_path, "rb") as trace_file:
+        if trace_file.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+            raise ValueError(f"'{trace_path}' is not a trace file!")
+        header_length: int = int.from_bytes(trace_file.read(4), "little")
+        header: dict = json.loads(trace_file.read(header_length))
+    return header, len(TRACE_MAGIC) + 4 + header_length
+
+
+def read_trace(trace_path: str) -> tuple[_Any, list[str]]:
+    """
+    Loads the records of the trace file as a (memory-mapped) NumPy structured array
+    with the uint64 fields `step`, `pc`, `slot` and `value`, alongside the variable names of the slots.
+    Requires NumPy.
+    """
+    import numpy as np
+    import os
+
+    header, offset = read_trace_header(trace_path)
+    dtype = np.dtype([
+        (field, ("<" if header["byteorder"] == "little" else ">") + "u8")
+        for field in header["fields"]
+    ])
+    if offset == os.path.getsize(trace_path):
+        return np.zeros(0, dtype=dtype), header["variables"]
+    return np.memmap(trace_path, dtype=dtype, mode="r", offset=offset), header["variables"]
+
+
+__all__ = (
+    "TRACE_MAGIC",
+    "TRACE_FIELDS",
+    "SATURATED_VALUE",
+    "TraceWriter",
+    "read_trace_header",
+    "read_trace"
+)
@@ -13,6 +13,7 @@ def pytest_collection_modifyitems(items: list[_Function]):
         "test_instruction",
         "test_program",
         "test_sugar",
+        "test_source_map",
         "test_encode"
     ]
 
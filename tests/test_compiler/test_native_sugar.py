@@ -0,0 +1,115 @@
+import pytest
+
+from s_interpreter.compiler import *
+from conftest import *
+
+
+@pytest.fixture(scope="module")
+def sugars() -> list[SyntacticSugar]:
+    add: SyntacticSugar = SyntacticSugar("{Variable V1} += {Variable V2}",
+                                         "{NATIVE V1 <- ADD V1 V2}",
+                                         "IF {V2} != 0 GOTO A",
+                                         "Z <- Z + 1",
+                                         "IF Z != 0 GOTO E",
+                                         "[A] {V2} <- {V2} - 1",
+                                         "Z <- Z + 1",
+                                         "IF {V2} != 0 GOTO A",
+                                         "[B] Z <- Z - 1",
+                                         "{V2} <- {V2} + 1",
+                                         "{V1} <- {V1} + 1",
+                                         "IF Z != 0 GOTO B",
+                                         "[E] Y <- Y",
+                                         line_numbers=range(10, 22))
+    return [
+        add,
+        SyntacticSugar("{Variable V} <- {Variable V} + {Variable V2}",
+                       "{V} += {V2}",
+                       sugars=[add])
+    ]
+
+
+@pytest.mark.parametrize(("native_command", "compiled_native_command"),
+                         [
+                             ("Y <- NATIVE ADD X Z2", NativeCommand(Variable("Y"),
+                                                                    NativeOperation.Add,
+                                                                    (Variable("X"), Variable("Z", 2)))),
+                             ("  z3<- native  mod X2 7 ", NativeCommand(Variable("Z", 3),
+                                                                       NativeOperation.Modulo,
+                                                                       (Variable("X", 2), Const(7)))),
+                             ("Y <- NATIVE LENGTH X", NativeCommand(Variable("Y"),
+                                                                    NativeOperation.Length,
+                                                                    (Variable("X"),))),
+                         ])
+def test_native_command_compile(native_command: str,
+                                compiled_native_command: NativeCommand) -> None:
+    assert Sentence.compile(native_command).command == compiled_native_command
+    assert NativeCommand.compile(str(compiled_native_command)) == compiled_native_command
+
+
+@pytest.mark.parametrize("native_command",
+                         [
+                             "Y <- NATIVE ADD X",
+                             "Y <- NATIVE LEFT X X",
+                             "Y <- NATIVE SQRT X",
+                             "Y <- NATIVE ADD X L",
+                         ])
+def test_native_command_compile_failure(native_command: str) -> None:
+    with pytest.raises(CompilationError):
+        Sentence.compile(native_command)
+
+
+@pytest.mark.parametrize(("operation", "operands", "result"),
+                         [
+                             (NativeOperation.Add, (3, 4), 7),
+                             (NativeOperation.Monus, (3, 4), 0),
+                             (NativeOperation.Multiply, (3, 4), 12),
+                             (NativeOperation.Divide, (14, 4), 3),
+                             (NativeOperation.Divide, (14, 0), None),
+                             (NativeOperation.Modulo, (14, 4), 2),
+                             (NativeOperation.Modulo, (14, 0), None),
+                             (NativeOperation.Power, (0, 0), 1),
+                             (NativeOperation.Left, (11, ), 2),
+                             (NativeOperation.Right, (11, ), 1),
+                             (NativeOperation.Prime, (0, ), 2),
+                             (NativeOperation.Prime, (4, ), 7),
+                             (NativeOperation.ListIndex, (2 ** 3 * 5, 1), 3),
+                             (NativeOperation.ListIndex, (2 ** 3 * 5, 3), 1),
+                             (NativeOperation.ListIndex, (0, 3), None),
+                             (NativeOperation.Length, (2 ** 3 * 7, ), 4),
+                             (NativeOperation.Length, (1, ), 0),
+                             (NativeOperation.Length, (0, ), None),
+                         ])
+def test_native_operation(operation: NativeOperation,
+                          operands: tuple[int, ...],
+                          result: int) -> None:
+    assert operation.evaluate(*operands) == result
+
+
+def test_native_sugar(sugars: list[SyntacticSugar]) -> None:
+    assert sugars[0].native == NativeOperation.Add
+    assert sugars[1].native is None
+
+    program, source_map = Program.compile_with_source_map("X2 <- X2 + X", sugars=sugars)
+    assert program == Program([
+        Instruction(Sentence(NativeCommand(Variable("X", 2), NativeOperation.Add, (Variable("X", 2), Variable("X")))))
+    ])
+    assert source_map[0][-1] == SourceFrame("{Variable V1} += {Variable V2}", 10, "{NATIVE V1 <- ADD V1 V2}")
+    with pytest.raises(CompilationError):
+        program.encode()
+
+    strict_program, strict_source_map = Program.compile_with_source_map("X2 <- X2 + X", sugars=sugars, strict=True)
+    assert len(strict_program.instructions) == 11
+    assert strict_program.encode() >= 0
+    assert [origin[-1].line for origin in strict_source_map] == list(range(11, 22))
+
+
+@pytest.mark.parametrize("directive",
+                         [
+                             "{NATIVE V <- ADD V}",
+                             "{NATIVE V <- SQRT V K}",
+                             "{NATIVE K <- ADD V K}",
+                             "{NATIVE V <- ADD V W}",
+                         ])
+def test_native_sugar_failure(directive: str) -> None:
+    with pytest.raises(ValueError):
+        SyntacticSugar("{Variable V} += {Const K}", directive, "{REPEAT K}", "{V} <- {V} + 1", "{END REPEAT}")
@@ -0,0 +1,59 @@
+import pytest
+
+from s_interpreter.compiler import *
+from conftest import *
+
+
+@pytest.fixture(scope="module")
+def sugars() -> list[SyntacticSugar]:
+    zero: SyntacticSugar = SyntacticSugar("{Variable V} <- 0",
+                                          "[A] {V} <- {V} - 1",
+                                          "IF {V} != 0 GOTO A")
+    return [
+        zero,
+        SyntacticSugar("{Variable V1} <- {Const K}",
+                       "{V1} <- 0",
+                       "{REPEAT K}",
+                       "{V1} <- {V1} + 1",
+                       "{END REPEAT}",
+                       sugars=[zero],
+                       line_numbers=[10, 11, 12, 13])
+    ]
+
+
+def test_source_map(sugars: list[SyntacticSugar]) -> None:
+    program, source_map = Program.compile_with_source_map("X <- X + 1",
+                                                          "[B] Y <- 2",
+                                                          sugars=sugars,
+                                                          line_numbers=[3, 5])
+    assert program == Program.compile("X <- X + 1", "[B] Y <- 2", sugars=sugars)
+    assert len(source_map) == len(program.instructions) == 6
+
+    main_line: SourceFrame = SourceFrame("MAIN", 5, "[B] Y <- 2")
+    assert source_map[0] == (SourceFrame("MAIN", 3, "X <- X + 1"),)
+    assert source_map[1] == (main_line,)
+    assert source_map[2] == (main_line,
+                             SourceFrame("{Variable V1} <- {Const K}", 10, "{V1} <- 0"),
+                             SourceFrame("{Variable V} <- 0", 1, "[A] {V} <- {V} - 1"))
+    assert source_map[3][-1] == SourceFrame("{Variable V} <- 0", 2, "IF {V} != 0 GOTO A")
+    assert source_map[4] == source_map[5] == (main_line,
+                                              SourceFrame("{Variable V1} <- {Const K}", 12, "{V1} <- {V1} + 1"))
+    assert SourceMap.from_json(source_map.to_json()) == source_map
+
+
+def test_slang_file_source_map(tmp_path) -> None:
+    slang_path = tmp_path / "program.slang"
+    slang_path.write_text("> {Variable V} <- 0\n"
+                          "    [A] {V} <- {V} - 1\n"
+                          "\n"
+                          "    IF {V} != 0 GOTO A # Loop\n"
+                          "> MAIN\n"
+                          "    Y <- Y + 1\n"
+                          "    Z <- 0\n")
+    program, source_map = compile_slang_file_with_source_map(str(slang_path))
+    assert program == compile_slang_file(str(slang_path))
+    assert [origin[-1].line for origin in source_map] == [6, 2, 4]
+    assert [origin[0].line for origin in source_map] == [6, 7, 7]
+
+    main(["-f", str(slang_path), "-o", str(tmp_path / "binary.txt"), "-m", str(tmp_path / "program.map")])
+    assert SourceMap.load(str(tmp_path / "program.map")) == source_map
@@ -0,0 +1,99 @@
+import random
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+
+
+def reference_prefix(program: Program,
+                     steps: int,
+                     *x: int) -> tuple[int, int, dict[str, int]]:
+    # The straightforward reading of the S semantics, walking the dataclass tree one instruction at a time.
+    # Stops after the given amount of steps (or when the program halts), returning the instruction index,
+    # the amount of instructions performed and the variables.
+    label_map: dict[Label, int] = {}
+    for instruction_index, instruction in enumerate(program.instructions):
+        if instruction.label is not None:
+            label_map.setdefault(instruction.label, instruction_index)
+
+    variables: dict[Variable, int] = {Variable("Y"): 0}
+    for instruction in program.instructions:
+        variables[instruction.sentence.command.variable] = 0
+    for index, value in enumerate(x):
+        if Variable("X", index + 1) in variables:
+            variables[Variable("X", index + 1)] = value
+
+    instruction_index: int = 0
+    instructions_performed: int = 0
+    while instruction_index < len(program.instructions) and instructions_performed < steps:
+        command = program.instructions[instruction_index].sentence.command
+        instruction_index += 1
+        if type(command) is JumpCommand:
+            if variables[command.variable] != 0:
+                instruction_index = label_map.get(command.label, len(program.instructions))
+        elif command.command_type == VariableCommandType.Increment:
+            variables[command.variable] += 1
+        elif command.command_type == VariableCommandType.Decrement and variables[command.variable] > 0:
+            variables[command.variable] -= 1
+        instructions_performed += 1
+
+    return instruction_index, instructions_performed, {str(key): value for key, value in variables.items()}
+
+
+def reference_run(program: Program,
+                  *x: int,
+                  fuel: int = 100000) -> tuple[int, int, dict[str, int]]:
+    instruction_index, instructions_performed, variables = reference_prefix(program, fuel, *x)
+    if instruction_index < len(program.instructions):
+        raise TimeoutError("Reference run did not halt")
+    return variables["Y"], instructions_performed, variables
+
+
+def random_program(seed: int,
+                   length: int = 12) -> Program:
+    generator: random.Random = random.Random(seed)
+    variables: list[Variable] = [Variable("Y"), Variable("X", 1), Variable("X", 2), Variable("Z", 1)]
+    labels: list[Label] = [Label(name) for name in "ABCDE"]
+
+    instructions: list[Instruction] = []
+    for _ in range(length):
+        command = (
+            JumpCommand(generator.choice(variables), generator.choice(labels))
+            if generator.random() < 0.25
+            else
+            VariableCommand(generator.choice(variables),
+                            generator.choice([VariableCommandType.Increment,
+                                              VariableCommandType.Decrement,
+                                              VariableCommandType.NoOp]))
+        )
+        instructions.append(Instruction(Sentence(command),
+                                        generator.choice(labels) if generator.random() < 0.3 else None))
+    instructions.append(Instruction(Sentence(VariableCommand(Variable("Y"), VariableCommandType.Increment))))
+    return Program(instructions)
+
+
+@pytest.fixture(scope="session")
+def reference() -> Callable[..., tuple[int, int, dict[str, int]]]:
+    return reference_run
+
+
+@pytest.fixture(scope="session")
+def reference_steps() -> Callable[..., tuple[int, int, dict[str, int]]]:
+    return reference_prefix
+
+
+@pytest.fixture(scope="session")
+def halting_programs() -> list[tuple[Program, tuple[int, ...]]]:
+    programs: list[tuple[Program, tuple[int, ...]]] = []
+    seed: int = 0
+    while len(programs) < 200:
+        program: Program = random_program(seed)
+        inputs: tuple[int, ...] = (seed % 7, seed % 5)
+        try:
+            reference_run(program, *inputs)
+            programs.append((program, inputs))
+        except TimeoutError:
+            pass
+        seed += 1
+    return programs
@@ -0,0 +1,63 @@
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+np = pytest.importorskip("numpy")
+
+
+def test_batch_matches_run(halting_programs: list[tuple[Program, tuple[int, ...]]],
+                           reference: Callable[..., tuple[int, int, dict[str, int]]]) -> None:
+    for program, _ in halting_programs[:60]:
+        inputs: list[tuple[int, int]] = []
+        for row in ((x1, x2) for x1 in range(4) for x2 in range(3)):
+            try:
+                reference(program, *row)
+                inputs.append(row)
+            except TimeoutError:
+                pass
+        assert Interpreter(program).run_batch(np.array(inputs)).tolist() == [
+            Interpreter(program).run(*row) for row in inputs
+        ]
+
+
+@pytest.mark.parametrize(("inputs", "expected_outputs", "dtype"),
+                         [
+                             ([0, 1, 7], [1, 1, 7], np.int64),
+                             ([[3], [4]], [3, 4], np.int64),
+                             ([2 ** 63 - 1, 2 ** 70, 5], [2 ** 63 - 1, 2 ** 70, 5], object),
+                         ])
+def test_batch_transfer(inputs: list,
+                        expected_outputs: list[int],
+                        dtype: type) -> None:
+    outputs = Interpreter(Program.compile("[A] X <- X - 1",
+                                          "Y <- Y + 1",
+                                          "IF X != 0 GOTO A")).run_batch(inputs)
+    assert outputs.tolist() == expected_outputs
+    assert outputs.dtype == dtype
+
+
+@pytest.mark.parametrize(("inputs", "expected_outputs"),
+                         [
+                             ([[3, 4], [2 ** 63 - 1, 0]], [8, 2 ** 63 + 1]),
+                             ([[2 ** 63 - 1, 5], [1, 1]], [2 ** 63 + 5, 3]),
+                         ])
+def test_batch_overflow(inputs: list[list[int]],
+                        expected_outputs: list[int]) -> None:
+    outputs = Interpreter(Program.compile("[A] X <- X - 1",
+                                          "Y <- Y + 1",
+                                          "IF X != 0 GOTO A",
+                                          "[B] X2 <- X2 - 1",
+                                          "Y <- Y + 1",
+                                          "IF X2 != 0 GOTO B",
+                                          "Y <- Y - 1",
+                                          "Y <- Y + 1",
+                                          "Y <- Y + 1")).run_batch(inputs)
+    assert outputs.tolist() == expected_outputs
+
+
+def test_batch_negative_input() -> None:
+    with pytest.raises(InterpreterError):
+        Interpreter(Program.compile("Y <- Y + 1")).run_batch([[1], [-1]])
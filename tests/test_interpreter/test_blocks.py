@@ -0,0 +1,67 @@
+import random
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.mark.parametrize(("program_lines", "blocks"),
+                         [
+                             (("X <- X - 1",
+                               "X <- X - 1",
+                               "X <- X + 1",
+                               "Y <- Y + 1",
+                               "IF X != 0 GOTO A",
+                               "[A] Y <- Y + 1"), {0: BasicBlock(0, 5, ((0, 1),), ((1, -1, 1),), 1, 5)}),
+                             (("Y <- Y + 1",
+                               "Y <- Y",
+                               "[A] X <- X - 1",
+                               "X <- X + 1",
+                               "Z <- Z - 1",
+                               "IF X != 0 GOTO A"), {2: BasicBlock(2, 6, (), ((1, 0, 1), (2, -1, 0)), 1, 2)}),
+                             (("Y <- Y + 1",
+                               "Y <- Y + 1",
+                               "[A] Y <- Y + 1",
+                               "Y <- Y + 1",
+                               "Y <- Y + 1"), {0: BasicBlock(0, 5, ((0, 5),), (), -1, 0)}),
+                             (("Y <- Y + 1",
+                               "Y <- Y + 1",
+                               "Y <- Y + 1",
+                               "[A] IF X != 0 GOTO A"), {0: BasicBlock(0, 3, ((0, 3),), (), -1, 0)}),
+                             (("Y <- Y + 1",
+                               "IF X != 0 GOTO A",
+                               "[A] Y <- Y + 1",
+                               "Y <- Y + 1"), {}),
+                         ])
+def test_block_detection(program_lines: tuple[str, ...],
+                         blocks: dict[int, BasicBlock]) -> None:
+    assert LoweredProgram(Program.compile(*program_lines)).blocks == blocks
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_blocks_are_exact(reference_steps: Callable[..., tuple[int, int, dict[str, int]]],
+                          seed: int) -> None:
+    generator: random.Random = random.Random(seed)
+    variables: list[str] = ["Y", "X", "X2", "Z"]
+    lines: list[str] = []
+    for block_index in range(4):
+        block: list[str] = [f"{variable} <- {variable} {generator.choice(['+ 1', '- 1', ''])}"
+                            for variable in generator.choices(variables, k=generator.randint(1, 8))]
+        lines += [f"[A{block_index + 1}] {block[0]}",
+                  *block[1:],
+                  f"IF {generator.choice(variables)} != 0 GOTO A{generator.randint(1, 5)}"]
+    program: Program = Program.compile(*lines, "[A5] Y <- Y + 1")
+
+    inputs: tuple[int, int] = (seed % 4, seed % 3)
+    for fuel in range(0, 200, 3):
+        interpreter: Interpreter = Interpreter(program)
+        instruction_index, instructions_performed, variables_values = reference_steps(program, fuel, *inputs)
+        try:
+            interpreter.run(*inputs, fuel=fuel)
+        except FuelExhausted:
+            pass
+        assert interpreter.instruction_index == instruction_index
+        assert interpreter.instructions_performed == instructions_performed
+        assert interpreter.variables == variables_values
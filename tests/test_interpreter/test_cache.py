@@ -0,0 +1,84 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from s_interpreter.cache import *
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+TRANSFER: Program = Program.compile("[A] X <- X - 1",
+                                    "Y <- Y + 1",
+                                    "IF X != 0 GOTO A")
+
+
+@pytest.fixture
+def cache(tmp_path) -> ResultCache:
+    return ResultCache(str(tmp_path / "cache.sqlite"))
+
+
+def test_cache_hit(halting_programs: list[tuple[Program, tuple[int, ...]]],
+                   cache: ResultCache) -> None:
+    for program, inputs in halting_programs[:50]:
+        expected: Interpreter = Interpreter(program)
+        expected.run(*inputs)
+        for _ in range(2):
+            interpreter: Interpreter = Interpreter(program, cache=cache)
+            assert interpreter.run(*inputs) == expected.variables["Y"]
+            assert interpreter.instructions_performed == expected.instructions_performed
+            assert interpreter.variables == expected.variables
+            assert interpreter.instruction_index == len(program.instructions)
+
+
+def test_cache_is_used(cache: ResultCache) -> None:
+    digest: str = LoweredProgram(TRANSFER).digest()
+    cache.put(digest, [5], 1000, 7, [1000, 0])
+    interpreter: Interpreter = Interpreter(TRANSFER, cache=cache)
+    # Inputs the program doesn't read don't matter
+    assert interpreter.run(5, 3, 2) == 1000
+    assert interpreter.instructions_performed == 7
+
+    with pytest.raises(FuelExhausted):
+        interpreter.run(5, fuel=6)
+    assert interpreter.run(6) == 6
+    assert cache.get(digest, [6]) == (6, 18, [6, 0])
+
+
+def test_cache_eviction(tmp_path) -> None:
+    cache: ResultCache = ResultCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+    interpreter: Interpreter = Interpreter(TRANSFER, cache=cache)
+    digest: str = LoweredProgram(TRANSFER).digest()
+    interpreter.run(1)
+    interpreter.run(2)
+    assert cache.get(digest, [1]) is not None
+    interpreter.run(3)
+    assert len(cache) == 2
+    assert cache.get(digest, [2]) is None
+    assert cache.get(digest, [1]) is not None and cache.get(digest, [3]) is not None
+
+
+def test_cache_huge_values(cache: ResultCache) -> None:
+    interpreter: Interpreter = Interpreter(TRANSFER, cache=cache)
+    assert interpreter.run(2 ** 20000) == 2 ** 20000
+    assert Interpreter(TRANSFER, cache=cache).run(2 ** 20000) == 2 ** 20000
+
+
+def run_cached(cache_path: str,
+               x: int) -> int:
+    return Interpreter(TRANSFER, cache=ResultCache(cache_path)).run(x)
+
+
+def test_cache_concurrent_processes(cache: ResultCache) -> None:
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(run_cached, [cache.cache_path] * 40, list(range(1, 21)) * 2)) == list(range(1, 21)) * 2
+    assert len(cache) == 20
+
+
+def test_cli_cache(cache: ResultCache,
+                   capsys: pytest.CaptureFixture,
+                   tmp_path) -> None:
+    binary_path = tmp_path / "binary.txt"
+    binary_path.write_text(str(TRANSFER))
+    main(["4", "-b", str(binary_path), "--cache", cache.cache_path])
+    assert cache.get(LoweredProgram(TRANSFER).digest(), [4]) == (4, 12, [4, 0])
+    main(["4", "-b", str(binary_path), "--cache", cache.cache_path, "--run_info"])
+    assert "ran 12 instructions" in capsys.readouterr().out
@@ -0,0 +1,87 @@
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.fixture(scope="module")
+def counting_program() -> Program:
+    # Y <- X1 * 2, one increment at a time (the loop is not summarizable)
+    return Program.compile("[A] X <- X - 1",
+                           "Y <- Y + 1",
+                           "Z <- Z + 1",
+                           "Z <- Z - 1",
+                           "Y <- Y + 1",
+                           "IF X != 0 GOTO A")
+
+
+@pytest.mark.parametrize("fuel", [0, 1, 7, 100])
+def test_checkpoint_roundtrip(counting_program: Program,
+                              tmp_path,
+                              fuel: int) -> None:
+    checkpoint_path: str = str(tmp_path / "checkpoint.json")
+    with pytest.raises(FuelExhausted):
+        Interpreter(counting_program).run(50, fuel=fuel, checkpoint_path=checkpoint_path)
+
+    interpreter: Interpreter = Interpreter(counting_program, jit=True)
+    interpreter.load_checkpoint(checkpoint_path)
+    assert interpreter.instructions_performed == fuel
+    assert interpreter.resume() == 100
+    assert interpreter.instructions_performed == 300
+
+
+def test_requested_checkpoint(counting_program: Program,
+                              tmp_path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.json"
+    interpreter: Interpreter = Interpreter(counting_program)
+    interpreter.request_checkpoint()
+    assert interpreter.run(Interpreter.CHECK_INTERVAL, checkpoint_path=str(checkpoint_path)) == (
+        2 * Interpreter.CHECK_INTERVAL
+    )
+    assert checkpoint_path.exists()
+
+
+def test_checkpoint_of_other_program(counting_program: Program,
+                                     tmp_path) -> None:
+    checkpoint_path: str = str(tmp_path / "checkpoint.json")
+    Interpreter(counting_program).save_checkpoint(checkpoint_path)
+    with pytest.raises(InterpreterError):
+        Interpreter(Program.compile("Y <- Y + 1")).load_checkpoint(checkpoint_path)
+
+
+def test_cli_resume(counting_program: Program,
+                    capsys: pytest.CaptureFixture,
+                    tmp_path) -> None:
+    binary_path = tmp_path / "binary.txt"
+    binary_path.write_text(str(counting_program))
+    checkpoint_path: str = str(tmp_path / "checkpoint.json")
+
+    with pytest.raises(SystemExit):
+        main(["20", "-b", str(binary_path), "--fuel", "31", "--checkpoint", checkpoint_path])
+    main(["-b", str(binary_path), "--resume", checkpoint_path, "--run_info"])
+    assert "Output: 40" in capsys.readouterr().out
+
+
+def test_checkpoint_of_huge_registers(counting_program: Program,
+                                      tmp_path) -> None:
+    # Beyond the default limit of decimal integer conversions (4300 digits)
+    checkpoint_path = tmp_path / "checkpoint.json"
+    interpreter: Interpreter = Interpreter(counting_program)
+    interpreter.reset(10 ** 5000)
+    interpreter.step_n(3)
+    interpreter.save_checkpoint(str(checkpoint_path))
+    assert [path.name for path in tmp_path.iterdir()] == ["checkpoint.json"]
+
+    resumed: Interpreter = Interpreter(counting_program)
+    resumed.load_checkpoint(str(checkpoint_path))
+    assert resumed.variables == interpreter.variables
+    assert resumed.instructions_performed == 3
+
+
+def test_failed_checkpoint_leaves_no_file(counting_program: Program,
+                                          tmp_path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint_path.mkdir()
+    with pytest.raises(OSError):
+        Interpreter(counting_program).save_checkpoint(str(checkpoint_path))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["checkpoint.json"]
@@ -0,0 +1,54 @@
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.mark.parametrize("program_lines",
+                         [
+                             ("[A] IF X != 0 GOTO A",),
+                             ("[A] X <- X - 1",
+                              "Y <- Y + 1",
+                              "IF X != 0 GOTO A",
+                              "[B] Z2 <- Z2 + 1",
+                              "Z2 <- Z2 - 1",
+                              "IF Y != 0 GOTO B"),
+                             ("[A] Y <- Y",
+                              "IF X != 0 GOTO A",
+                              "Y <- Y + 1"),
+                         ])
+@pytest.mark.parametrize("options", [{}, {"jit": True}, {"memoize": True}])
+def test_cycles_are_detected(program_lines: tuple[str, ...],
+                             options: dict[str, bool]) -> None:
+    interpreter: Interpreter = Interpreter(Program.compile(*program_lines), **options)
+    with pytest.raises(CycleDetected) as exception_info:
+        interpreter.run(5000, fuel=10 ** 9, detect_cycles=True)
+
+    cycle: CycleDetected = exception_info.value
+    assert cycle.instructions_performed == interpreter.instructions_performed < 10 ** 6
+    assert cycle.period > 0
+    assert cycle.variables == interpreter.variables
+
+    # The run is back in the same state after another period
+    with pytest.raises(FuelExhausted):
+        interpreter.resume(fuel=cycle.period)
+    assert interpreter.instruction_index == cycle.instruction_index
+    assert interpreter.variables == cycle.variables
+
+
+def test_unbounded_runs_are_not_cycles() -> None:
+    interpreter: Interpreter = Interpreter(Program.compile("[A] Y <- Y + 1",
+                                                           "IF Y != 0 GOTO A"))
+    with pytest.raises(FuelExhausted):
+        interpreter.run(fuel=10 ** 5, detect_cycles=True)
+
+
+def test_halting_runs_with_cycle_detection(reference: Callable[..., tuple[int, int, dict[str, int]]],
+                                           halting_programs: list[tuple[Program, tuple[int, ...]]]) -> None:
+    for program, inputs in halting_programs:
+        interpreter: Interpreter = Interpreter(program)
+        output, instructions_performed, _ = reference(program, *inputs)
+        assert interpreter.run(*inputs, detect_cycles=True) == output
+        assert interpreter.instructions_performed == instructions_performed
@@ -0,0 +1,55 @@
+from typing import Optional
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+from s_interpreter.dovetail import *
+
+
+def expected_record(encoding: int,
+                    x: tuple[int, ...],
+                    max_steps: int) -> tuple[int, Optional[int], int]:
+    interpreter: Interpreter = Interpreter(Program.decode(encoding))
+    try:
+        return encoding, interpreter.run(*x, fuel=max_steps), interpreter.instructions_performed
+    except FuelExhausted:
+        return encoding, None, interpreter.instructions_performed
+
+
+@pytest.mark.parametrize(("x", "max_steps", "slice_steps"), [((), 50, 7), ((3,), 100, 1000), ((2, 1), 0, 1)])
+def test_dovetail_records(x: tuple[int, ...],
+                          max_steps: int,
+                          slice_steps: int) -> None:
+    encodings: range = range(300)
+    records: list[tuple[int, Optional[int], int]] = list(dovetail(encodings,
+                                                                  x,
+                                                                  max_steps=max_steps,
+                                                                  slice_steps=slice_steps,
+                                                                  workers=2,
+                                                                  chunksize=40))
+    assert sorted(records) == [expected_record(encoding, x, max_steps) for encoding in encodings]
+
+
+def test_halting_programs_retire_first() -> None:
+    diverging: int = Program.compile("[A] IF X != 0 GOTO A").encode()
+    halting: list[int] = [
+        Program.compile(*(["Y <- Y + 1"] * count)).encode()
+        for count in range(1, 6)
+    ]
+    records: list[tuple[int, Optional[int], int]] = list(dovetail([diverging, *halting],
+                                                                  (1,),
+                                                                  max_steps=10 ** 5,
+                                                                  slice_steps=2,
+                                                                  workers=1))
+    assert records[-1] == (diverging, None, 10 ** 5)
+    assert sorted(records[:-1]) == sorted((encoding, count, count) for count, encoding in enumerate(halting, 1))
+
+
+def test_dovetail_errors() -> None:
+    with pytest.raises(InterpreterError):
+        list(dovetail(range(3), max_steps=-1))
+    with pytest.raises(InterpreterError):
+        list(dovetail(range(3), slice_steps=0))
+    with pytest.raises(InterpreterError):
+        list(dovetail(range(3), (-1,)))
@@ -0,0 +1,85 @@
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+def test_step_back_matches_reference(reference_steps: Callable[..., tuple[int, int, dict[str, int]]],
+                                     halting_programs: list[tuple[Program, tuple[int, ...]]]) -> None:
+    for program, inputs in halting_programs[:50]:
+        interpreter: Interpreter = Interpreter(program, history_interval=4, max_snapshots=4)
+        interpreter.run(*inputs)
+        while interpreter.instructions_performed > 0:
+            interpreter.step_back(min(3, interpreter.instructions_performed))
+            assert (
+                (interpreter.instruction_index, interpreter.instructions_performed, interpreter.variables) ==
+                reference_steps(program, interpreter.instructions_performed, *inputs)
+            )
+        with pytest.raises(InterpreterError):
+            interpreter.step_back()
+
+
+@pytest.mark.parametrize(("x1", "x2"), [(0, 3), (4, 5), (30, 40)])
+def test_run_back_to(reference_steps: Callable[..., tuple[int, int, dict[str, int]]],
+                     x1: int,
+                     x2: int) -> None:
+    # Y <- X1 * X2
+    program: Program = Program.compile("[A] IF X != 0 GOTO B",
+                                       "Z4 <- Z4 + 1",
+                                       "IF Z4 != 0 GOTO E",
+                                       "[B] X <- X - 1",
+                                       "[C] IF X2 != 0 GOTO D",
+                                       "IF Z2 != 0 GOTO C2",
+                                       "Z3 <- Z3 + 1",
+                                       "IF Z3 != 0 GOTO A",
+                                       "[D] X2 <- X2 - 1",
+                                       "Y <- Y + 1",
+                                       "Z2 <- Z2 + 1",
+                                       "Z3 <- Z3 + 1",
+                                       "IF Z3 != 0 GOTO C",
+                                       "[C2] Z2 <- Z2 - 1",
+                                       "X2 <- X2 + 1",
+                                       "IF Z2 != 0 GOTO C2",
+                                       "Z3 <- Z3 + 1",
+                                       "IF Z3 != 0 GOTO A")
+    interpreter: Interpreter = Interpreter(program, history_interval=16, max_snapshots=8)
+    assert interpreter.run(x1, x2) == x1 * x2
+    # Every eviction halves the snapshots and doubles the interval
+    assert (interpreter.history_interval > 16) == (interpreter.instructions_performed >= 16 * 8)
+
+    stepping: Interpreter = Interpreter(program)
+    stepping.reset(x1, x2)
+    visits: list[int] = []
+    while stepping.step() is None:
+        if stepping.instruction_index == 3:
+            visits.append(stepping.instructions_performed)
+    for visit in reversed(visits):
+        interpreter.run_back_to(3)
+        assert (
+            (interpreter.instruction_index, interpreter.instructions_performed, interpreter.variables) ==
+            reference_steps(program, visit, x1, x2)
+        )
+
+    # Never before the first visit, which leaves the state untouched
+    state: tuple[int, int, dict[str, int]] = (interpreter.instruction_index,
+                                              interpreter.instructions_performed,
+                                              interpreter.variables)
+    with pytest.raises(InterpreterError):
+        interpreter.run_back_to(3)
+    assert (interpreter.instruction_index, interpreter.instructions_performed, interpreter.variables) == state
+
+    # Going back then forward again reaches the same end
+    assert interpreter.resume() == x1 * x2
+
+
+def test_history_errors() -> None:
+    program: Program = Program.compile("Y <- Y + 1")
+    with pytest.raises(InterpreterError):
+        Interpreter(program).step_back()
+    with pytest.raises(InterpreterError):
+        Interpreter(program, history_interval=0)
+    with pytest.raises(InterpreterError):
+        Interpreter(program, history_interval=4).run_back_to(1)
+    assert Interpreter(program).history_interval is None
@@ -0,0 +1,98 @@
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.fixture
+def program() -> Program:
+    return Program.compile("[A] X <- X - 1",
+                           "Y <- Y + 1",
+                           "Z2 <- Z2 + 1",
+                           "Z2 <- Z2 - 1",
+                           "IF X != 0 GOTO A",
+                           "Z3 <- Z3 + 1")
+
+
+def test_breakpoints(program: Program) -> None:
+    interpreter: Interpreter = Interpreter(program)
+    interpreter.set_breakpoint(pc=1)
+    interpreter.reset(3)
+    hits: list[tuple[int, int, int]] = []
+    while True:
+        try:
+            assert interpreter.resume() == 3
+            break
+        except BreakpointHit as hit:
+            hits.append((hit.instruction_index, hit.instructions_performed, hit.variables["Y"]))
+            assert interpreter.instruction_index == 1
+    assert hits == [(1, 1, 0), (1, 6, 1), (1, 11, 2)]
+
+    interpreter.clear_breakpoints()
+    interpreter.set_breakpoint(label="A")
+    assert interpreter.breakpoints == {0}
+    with pytest.raises(BreakpointHit):
+        interpreter.run(3)
+    assert interpreter.instructions_performed == 0
+
+    interpreter.clear_breakpoints()
+    assert interpreter.run(3) == 3
+    with pytest.raises(InterpreterError):
+        interpreter.set_breakpoint(pc=6)
+
+
+def test_watchpoints(program: Program) -> None:
+    interpreter: Interpreter = Interpreter(program)
+    interpreter.set_watchpoint("Y", 2)
+    with pytest.raises(WatchpointHit) as hit:
+        interpreter.run(5)
+    assert (hit.value.variable, hit.value.previous_value, hit.value.instructions_performed) == ("Y", 1, 7)
+    assert interpreter.variables["Y"] == 2
+
+    interpreter.clear_watchpoints()
+    interpreter.set_watchpoint("Z2")
+    assert interpreter.watchpoints == {"Z2": None}
+    interpreter.reset(3)
+    changes: list[tuple[int, int]] = []
+    while True:
+        try:
+            assert interpreter.resume() == 3
+            break
+        except WatchpointHit as hit:
+            changes.append((hit.previous_value, hit.variables["Z2"]))
+    assert changes == [(0, 1), (1, 0)] * 3
+
+    with pytest.raises(InterpreterError):
+        interpreter.set_watchpoint("Z4")
+
+
+def test_hooks_keep_runs_exact(reference: Callable[..., tuple[int, int, dict[str, int]]],
+                               halting_programs: list[tuple[Program, tuple[int, ...]]]) -> None:
+    # Hooks that never trigger leave the runs as they are, including with stops in between
+    for program, inputs in halting_programs:
+        interpreter: Interpreter = Interpreter(program)
+        interpreter.set_watchpoint("Y", 10 ** 9)
+        output, instructions_performed, variables = reference(program, *inputs)
+        assert interpreter.run(*inputs) == output
+        assert interpreter.instructions_performed == instructions_performed
+        assert interpreter.variables == variables
+
+        interpreter.reset(*inputs)
+        while interpreter.run_until(pc=len(program.instructions) - 1) is None:
+            pass
+        assert interpreter.variables == variables
+
+
+def test_hooks_with_run_until(program: Program) -> None:
+    interpreter: Interpreter = Interpreter(program)
+    interpreter.set_breakpoint(label="A")
+    interpreter.reset(2)
+    with pytest.raises(BreakpointHit):
+        interpreter.run_until(pc=4)
+    assert interpreter.run_until(pc=4) is None
+    assert (interpreter.instruction_index, interpreter.instructions_performed) == (4, 4)
+    with pytest.raises(BreakpointHit):
+        interpreter.run_until(pc=4)
+    assert interpreter.instructions_performed == 5
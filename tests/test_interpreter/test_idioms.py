@@ -0,0 +1,169 @@
+import itertools
+import re
+from typing import Optional
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.idioms import *
+from s_interpreter.interpreter import *
+
+LIBRARY_PATH: str = "tests/test_interpreter/s_interpreter.slang"
+
+
+@pytest.fixture(scope="module")
+def sugars() -> list[SyntacticSugar]:
+    return load_sugars(LIBRARY_PATH)
+
+
+@pytest.fixture(scope="module")
+def recognizer(sugars: list[SyntacticSugar]) -> IdiomRecognizer:
+    return IdiomRecognizer(sugars)
+
+
+def outcome(program: Program,
+            x: tuple[int, ...]) -> Optional[int]:
+    try:
+        return Interpreter(program).run(*x, fuel=10 ** 5)
+    except (FuelExhausted, NativeDivergence):
+        return None
+
+
+def native_count(program: Program) -> int:
+    return sum(type(instruction.sentence.command) is NativeCommand for instruction in program.instructions)
+
+
+def test_load_sugars(sugars: list[SyntacticSugar],
+                     tmp_path) -> None:
+    assert any(sugar.native is not None for sugar in sugars)
+    assert "MAIN" not in {sugar.title for sugar in sugars}
+
+    library_path = tmp_path / "library.slang"
+    library_path.write_text("> {Variable V} <- 0\n"
+                            "[A] {V} <- {V} - 1\n"
+                            "IF {V} != 0 GOTO A\n")
+    library: list[SyntacticSugar] = load_sugars(str(library_path))
+    assert [sugar.title for sugar in library] == ["{Variable V} <- 0"]
+    assert library[0].arguments == {"V": Variable}
+    with pytest.raises(CompilationError):
+        compile_slang_file(str(library_path))
+
+
+def test_idioms_cover_every_aliasing(recognizer: IdiomRecognizer) -> None:
+    natives: set[str] = {
+        str(idiom.native)
+        for idiom in recognizer.idioms
+        if idiom.title == "{Variable V1} += {Variable V2}"
+    }
+    assert natives == {"X <- NATIVE ADD X X2", "X <- NATIVE ADD X X"}
+    assert all(not any(opcode == Opcode.Native for opcode in idiom.template.opcodes) for idiom in recognizer.idioms)
+
+
+@pytest.mark.parametrize("lines",
+                         [
+                             ("Y <- X * X2",),
+                             ("Y <- X * X",),
+                             ("Y <- X / X2",),
+                             ("Y <- X % X2",),
+                             ("X <- X + X2", "Y <- X + X"),
+                             ("Z <- X AT INDEX X2", "Y <- Z + X2"),
+                             ("Y <- X - X2",),
+                             ("Y <- X", "Y <- Y + 2"),
+                             ("Y <- X2", "Z <- X", "Z <- 0"),
+                             ("Y <- X * 3", "Y <- Y - 2"),
+                         ])
+def test_recognized_programs_match(sugars: list[SyntacticSugar],
+                                   recognizer: IdiomRecognizer,
+                                   lines: tuple[str, ...]) -> None:
+    strict_program: Program = Program.compile(*lines, sugars=sugars, strict=True)
+    recognized_program: Program = recognizer.recognize(strict_program)
+    assert native_count(strict_program) == 0
+    assert 0 < native_count(recognized_program)
+    assert len(recognized_program.instructions) < len(strict_program.instructions)
+
+    # 0 is where MONUS stops subtracting, and where DIV/MOD (and their expansions) diverge
+    for x in itertools.product(range(0, 5), repeat=2):
+        assert outcome(recognized_program, x) == outcome(strict_program, x)
+
+
+def test_copies_and_consts_are_recognized(sugars: list[SyntacticSugar],
+                                         recognizer: IdiomRecognizer) -> None:
+    strict_program: Program = Program.compile("Y <- X2", "Z <- 0", "Y <- Y + 2", "Y <- Y * 3",
+                                              sugars=sugars,
+                                              strict=True)
+    assert [str(instruction.sentence) for instruction in recognizer.recognize(strict_program).instructions] == [
+        "Y <- NATIVE ADD X2 0",
+        "Z <- NATIVE ADD 0 0",
+        "Y <- NATIVE ADD Y 2",
+        "Y <- NATIVE MUL Y 3"
+    ]
+    # Consts beyond the recognizer's are left expanded (though their expansions' copies are still recognized)
+    assert {"Y <- NATIVE ADD Y 2", "Y <- NATIVE MUL Y 3"}.isdisjoint(
+        str(instruction.sentence)
+        for instruction in IdiomRecognizer(sugars, constants=range(2)).recognize(strict_program).instructions
+    )
+
+
+def test_recognized_universal_program(recognizer: IdiomRecognizer) -> None:
+    strict_program: Program = compile_slang_file(LIBRARY_PATH, strict=True)
+    recognized_program: Program = recognizer.recognize(strict_program)
+    assert 0 < native_count(recognized_program)
+    assert len(recognized_program.instructions) * 10 < len(strict_program.instructions)
+
+    for program, x in [
+        (Program.compile("Y <- Y + 1", "Y <- Y + 1"), 0),
+        (Program.compile("[A] X <- X - 1", "Y <- Y + 1", "IF X != 0 GOTO A"), 3),
+        (Program.compile("IF X != 0 GOTO B", "Y <- Y + 1", "[B] Y <- Y + 1"), 1),
+    ]:
+        assert Interpreter(recognized_program).run(x, program.encode()) == Interpreter(program).run(x)
+
+
+def test_near_misses_are_kept(sugars: list[SyntacticSugar],
+                              recognizer: IdiomRecognizer) -> None:
+    strict_program: Program = Program.compile("X <- X + X2", sugars=sugars, strict=True)
+    assert native_count(recognizer.recognize(strict_program)) == 1
+
+    temporary: Variable = next(variable
+                               for instruction in strict_program.instructions
+                               if (variable := instruction.sentence.command.variable).name == "Z")
+    touched_temporary: Program = Program([
+        *strict_program.instructions,
+        Instruction(Sentence(VariableCommand(temporary, VariableCommandType.Increment)))
+    ])
+    assert native_count(recognizer.recognize(touched_temporary)) == 0
+
+    interior_label: Label = next(instruction.label
+                                 for instruction in strict_program.instructions[1:]
+                                 if instruction.label is not None)
+    entered_interior: Program = Program([
+        Instruction(Sentence(JumpCommand(Variable("X", 3), interior_label))),
+        *strict_program.instructions
+    ])
+    assert native_count(recognizer.recognize(entered_interior)) == 0
+
+    renamed_target: Program = Program([
+        instruction
+        if type(instruction.sentence.command) is not JumpCommand
+        else
+        Instruction(Sentence(JumpCommand(instruction.sentence.command.variable, Label("E", 9))), instruction.label)
+        for instruction in strict_program.instructions
+    ])
+    assert native_count(recognizer.recognize(renamed_target)) == 0
+
+
+def test_cli_idioms(sugars: list[SyntacticSugar],
+                    capsys: pytest.CaptureFixture,
+                    tmp_path) -> None:
+    binary_path = tmp_path / "binary.txt"
+    binary_path.write_text(str(Program.compile("Y <- X * X2", sugars=sugars, strict=True)))
+    main(["3", "4", "-b", str(binary_path), "--run_info"])
+    strict_output: str = capsys.readouterr().out
+    main(["3", "4", "-b", str(binary_path), "--idioms", LIBRARY_PATH, "--run_info"])
+    recognized_output: str = capsys.readouterr().out
+    assert "Output: 12" in strict_output and "Output: 12" in recognized_output
+    instruction_counts: list[int] = [int(re.search(r"ran (\d+) instructions", output).group(1))
+                                     for output in (strict_output, recognized_output)]
+    assert instruction_counts[1] * 10 < instruction_counts[0]
+
+    with pytest.raises(SystemExit):
+        main(["3", "-d", str(binary_path), "--idioms", LIBRARY_PATH])
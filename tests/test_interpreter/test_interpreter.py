@@ -6,8 +6,10 @@ from s_interpreter.interpreter import Interpreter
 
 @pytest.fixture(scope="module")
 def compile_interpreter() -> None:
+    # The binary is pure S, so the library's native sugars are expanded
     main(["-f", "tests/test_interpreter/s_interpreter.slang",
-          "-o", "tests/test_interpreter/interpreter_program.txt"])
+          "-o", "tests/test_interpreter/interpreter_program.txt",
+          "--strict"])
 
 
 @pytest.fixture(scope="module")
@@ -17,10 +19,20 @@ def interpreter_program_lines(compile_interpreter: None) -> list[str]:
 
 
 @pytest.fixture(scope="module")
-def interpreter_program(interpreter_program_lines: list[str]) -> Program:
+def strict_interpreter_program(interpreter_program_lines: list[str]) -> Program:
     yield Program.compile(*interpreter_program_lines)
 
 
+@pytest.fixture(scope="module")
+def native_interpreter_program() -> Program:
+    yield compile_slang_file("tests/test_interpreter/s_interpreter.slang")
+
+
+@pytest.fixture(scope="module", params=["strict", "native"])
+def interpreter_program(request: pytest.FixtureRequest) -> Program:
+    yield request.getfixturevalue(f"{request.param}_interpreter_program")
+
+
 @pytest.mark.parametrize(("inputs", "expected_output"),
                          [
                              ((0, Program([
@@ -0,0 +1,55 @@
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+from s_interpreter.jit import *
+
+
+def test_jit_matches_reference(halting_programs: list[tuple[Program, tuple[int, ...]]],
+                               reference: Callable[..., tuple[int, int, dict[str, int]]]) -> None:
+    for program, inputs in halting_programs:
+        interpreter: Interpreter = Interpreter(program, jit=True)
+        output, instructions_performed, variables = reference(program, *inputs)
+        assert interpreter.run(*inputs) == output
+        assert interpreter.instructions_performed == instructions_performed
+        assert interpreter.variables == variables
+
+
+@pytest.mark.parametrize("inputs",
+                         [
+                             (0, 0),
+                             (3, 0),
+                             (0, 4),
+                             (17, 25)
+                         ])
+def test_jit_addition(inputs: tuple[int, ...]) -> None:
+    program: Program = Program.compile("[A] X <- X - 1",
+                                       "Y <- Y + 1",
+                                       "IF X != 0 GOTO A",
+                                       "[B] IF X2 = 0 GOTO E",
+                                       "X2 <- X2 - 1",
+                                       "Y <- Y + 1",
+                                       "Z <- Z + 1",
+                                       "IF Z != 0 GOTO B",
+                                       sugars=[SyntacticSugar("IF {Variable V} = 0 GOTO {Label L}",
+                                                              "IF {V} != 0 GOTO A",
+                                                              "Z <- Z + 1",
+                                                              "IF Z != 0 GOTO {L}",
+                                                              "[A] Y <- Y")])
+    interpreter: Interpreter = Interpreter(program)
+    jit_interpreter: Interpreter = Interpreter(program, jit=True)
+    assert jit_interpreter.run(*inputs) == interpreter.run(*inputs) == max(inputs[0], 1) + inputs[1]
+    assert jit_interpreter.instructions_performed == interpreter.instructions_performed
+
+
+def test_jit_cache() -> None:
+    program_lines: tuple[str, ...] = ("[A] X <- X - 1", "Y <- Y + 1", "IF X != 0 GOTO A")
+    assert (jit_compile(LoweredProgram(Program.compile(*program_lines))) is
+            jit_compile(LoweredProgram(Program.compile(*program_lines))))
+    assert "iterations" in jit_compile(LoweredProgram(Program.compile(*program_lines))).source
+    assert "while True:" in jit_compile(LoweredProgram(Program.compile("[A] X <- X - 1",
+                                                                       "Y <- Y + 1",
+                                                                       "Y <- Y - 1",
+                                                                       "IF X != 0 GOTO A"))).source
@@ -0,0 +1,162 @@
+import sys
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+from s_interpreter.lazy import *
+
+# Copies X to Y twice through Z and Z2, with an encoding of over 5000 digits
+DOUBLING: Program = Program.compile("[A] X <- X - 1",
+                                    "Z <- Z + 1",
+                                    "IF X != 0 GOTO A",
+                                    "[B] Z <- Z - 1",
+                                    "Y <- Y + 1",
+                                    "X2 <- X2 + 1",
+                                    "IF Z != 0 GOTO B",
+                                    "[C] X2 <- X2 - 1",
+                                    "Z2 <- Z2 + 1",
+                                    "IF X2 != 0 GOTO C",
+                                    "[D] Z2 <- Z2 - 1",
+                                    "Y <- Y + 1",
+                                    "IF Z2 != 0 GOTO D",
+                                    "[E] Y <- Y")
+
+
+def test_lazy_runs_match_decoded_runs(halting_programs: list[tuple[Program, tuple[int, ...]]]) -> None:
+    for program, inputs in halting_programs[:100]:
+        program_encoding: int = program.encode()
+        decoded_program: Program = Program.decode(program_encoding)
+        interpreter: Interpreter = Interpreter(decoded_program)
+        lazy_interpreter: Interpreter = Interpreter(EncodedProgram(program_encoding))
+
+        assert lazy_interpreter.run(*inputs) == interpreter.run(*inputs)
+        assert lazy_interpreter.instructions_performed == interpreter.instructions_performed
+        assert lazy_interpreter.instruction_index == interpreter.instruction_index
+        assert lazy_interpreter.variables.items() <= interpreter.variables.items()
+        assert lazy_interpreter.program == decoded_program
+        assert lazy_interpreter.lowered.encoded.length == len(decoded_program.instructions)
+
+
+def test_only_reached_instructions_are_decoded() -> None:
+    program: Program = Program.compile("[A] X <- X + 1",
+                                       "IF X != 0 GOTO A",
+                                       *(["X2 <- X2 + 1"] * 30),
+                                       "[B] Y <- Y + 1")
+    lazy_interpreter: Interpreter = Interpreter(EncodedProgram(program.encode()))
+    with pytest.raises(FuelExhausted):
+        lazy_interpreter.run(1, fuel=100)
+    assert lazy_interpreter.instructions_performed == 100
+    assert lazy_interpreter.lowered.encoded.decoded_count == 2
+    assert lazy_interpreter.lowered.encoded.length is None
+    assert lazy_interpreter.variables == {"Y": 0, "X": 51}
+
+    program = Program.compile("Y <- Y + 1",
+                              "IF Y != 0 GOTO E",
+                              *(["X2 <- X2 + 1"] * 30),
+                              "Y <- Y",
+                              "Y <- Y + 1")
+    lazy_interpreter = Interpreter(EncodedProgram(program.encode()))
+    assert lazy_interpreter.run() == 1
+    assert lazy_interpreter.lowered.encoded.decoded_count == 2
+    assert lazy_interpreter.lowered.encoded.length == len(program.instructions)
+    assert lazy_interpreter.instruction_index == len(lazy_interpreter.lowered) == len(program.instructions)
+
+
+@pytest.mark.parametrize("program_encoding", [0, 1, 2, 5, 6, 30, 2 ** 20 - 1])
+def test_small_encodings(program_encoding: int) -> None:
+    program: Program = Program.decode(program_encoding)
+    lazy_interpreter: Interpreter = Interpreter(EncodedProgram(program_encoding))
+    try:
+        output: int = Interpreter(program).run(3, fuel=1000)
+    except FuelExhausted:
+        with pytest.raises(FuelExhausted):
+            lazy_interpreter.run(3, fuel=1000)
+    else:
+        assert lazy_interpreter.run(3, fuel=1000) == output
+    assert lazy_interpreter.lowered.encoded.to_program() == program
+
+    with pytest.raises(ValueError):
+        EncodedProgram(-1)
+
+
+def test_lazy_stepping_and_hooks() -> None:
+    interpreter: Interpreter = Interpreter(DOUBLING)
+    lazy_interpreter: Interpreter = Interpreter(EncodedProgram(DOUBLING.encode()))
+    interpreter.reset(3)
+    lazy_interpreter.reset(3)
+    for _ in range(5):
+        assert lazy_interpreter.step() == interpreter.step()
+    assert lazy_interpreter.step_n(7) == interpreter.step_n(7)
+    assert lazy_interpreter.variables.items() <= interpreter.variables.items()
+
+    # Stops and hooks may be set on instructions (and variables) the run didn't reach yet
+    assert lazy_interpreter.run_until(label="C") is None
+    assert lazy_interpreter.instruction_index == 7
+    lazy_interpreter.set_watchpoint("Z2", 2)
+    with pytest.raises(WatchpointHit) as hit:
+        lazy_interpreter.resume()
+    assert hit.value.instruction_index == 9 and lazy_interpreter.variables["X2"] == 1
+    lazy_interpreter.clear_watchpoints()
+    lazy_interpreter.set_breakpoint(pc=12)
+    with pytest.raises(BreakpointHit):
+        lazy_interpreter.resume()
+    lazy_interpreter.clear_breakpoints()
+    assert lazy_interpreter.resume() == interpreter.run(3) == 6
+    assert lazy_interpreter.instructions_performed == interpreter.instructions_performed
+
+    with pytest.raises(InterpreterError):
+        Interpreter(EncodedProgram(DOUBLING.encode()), jit=True)
+    with pytest.raises(InterpreterError):
+        Interpreter(EncodedProgram(DOUBLING.encode())).profile(3)
+
+
+def test_lazy_checkpoints(tmp_path) -> None:
+    checkpoint_path: str = str(tmp_path / "checkpoint.json")
+    interpreter: Interpreter = Interpreter(EncodedProgram(DOUBLING.encode()))
+    with pytest.raises(FuelExhausted):
+        interpreter.run(4, 7, fuel=20, checkpoint_path=checkpoint_path)
+
+    # The resumed run meets the variables in another order, and X2 only after the checkpoint
+    resumed: Interpreter = Interpreter(EncodedProgram(DOUBLING.encode()))
+    resumed.load_checkpoint(checkpoint_path)
+    assert resumed.variables == interpreter.variables
+    assert resumed.resume() == interpreter.resume() == Interpreter(DOUBLING).run(4, 7)
+    assert resumed.variables == interpreter.variables
+
+    with pytest.raises(InterpreterError):
+        Interpreter(EncodedProgram(DOUBLING.encode() + 1)).load_checkpoint(checkpoint_path)
+
+
+@pytest.mark.parametrize("hexadecimal", [False, True])
+def test_cli_decode(capsys: pytest.CaptureFixture,
+                    tmp_path,
+                    hexadecimal: bool) -> None:
+    # Beyond the default limit of decimal integer conversions (4300 digits)
+    encoding_path = tmp_path / "encoding.txt"
+    if hexadecimal:
+        encoding_path.write_text(hex(DOUBLING.encode()))
+    elif not hasattr(sys, "get_int_max_str_digits"):
+        encoding_path.write_text(str(DOUBLING.encode()))
+    else:
+        max_str_digits: int = sys.get_int_max_str_digits()
+        sys.set_int_max_str_digits(0)
+        try:
+            encoding_path.write_text(str(DOUBLING.encode()))
+        finally:
+            sys.set_int_max_str_digits(max_str_digits)
+        assert len(encoding_path.read_text()) > 4300
+
+    main(["3", "-d", str(encoding_path), "--run_info"])
+    output: str = capsys.readouterr().out
+    assert "Output: 6" in output
+    assert f"It decoded {len(DOUBLING.instructions)} instructions." in output
+
+    checkpoint_path: str = str(tmp_path / "checkpoint.json")
+    with pytest.raises(SystemExit):
+        main(["3", "-d", str(encoding_path), "--fuel", "10", "--checkpoint", checkpoint_path])
+    main(["-d", str(encoding_path), "--resume", checkpoint_path])
+    assert "Output: 6" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        main(["3", "-d", str(encoding_path), "--jit"])
@@ -0,0 +1,63 @@
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_fuel_is_exact(halting_programs: list[tuple[Program, tuple[int, ...]]],
+                       reference: Callable[..., tuple[int, int, dict[str, int]]],
+                       reference_steps: Callable[..., tuple[int, int, dict[str, int]]],
+                       jit: bool) -> None:
+    for program, inputs in halting_programs[:100]:
+        interpreter: Interpreter = Interpreter(program, jit=jit)
+        _, total_instructions, _ = reference(program, *inputs)
+        for fuel in range(0, total_instructions, max(1, total_instructions // 7)):
+            with pytest.raises(FuelExhausted) as exception_info:
+                interpreter.run(*inputs, fuel=fuel)
+            instruction_index, instructions_performed, variables = reference_steps(program, fuel, *inputs)
+            assert exception_info.value.instructions_performed == instructions_performed == fuel
+            assert exception_info.value.instruction_index == instruction_index == interpreter.instruction_index
+            assert exception_info.value.variables == variables == interpreter.variables
+
+            assert interpreter.resume() == reference(program, *inputs)[0]
+            assert interpreter.instructions_performed == total_instructions
+
+
+@pytest.mark.parametrize("jit", [False, True])
+@pytest.mark.parametrize("fuel", [0, 1, 5, 29, 30, 31, 1000])
+def test_fuel_in_summarized_loop(jit: bool,
+                                 fuel: int) -> None:
+    interpreter: Interpreter = Interpreter(Program.compile("[A] X <- X - 1",
+                                                           "Y <- Y + 1",
+                                                           "IF X != 0 GOTO A"),
+                                           jit=jit)
+    if fuel >= 30:
+        assert interpreter.run(10, fuel=fuel) == 10
+    else:
+        with pytest.raises(FuelExhausted):
+            interpreter.run(10, fuel=fuel)
+        assert interpreter.instructions_performed == fuel
+        assert interpreter.variables["Y"] == fuel // 3 + (1 if fuel % 3 == 2 else 0)
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_timeout(jit: bool) -> None:
+    interpreter: Interpreter = Interpreter(Program.compile("[A] Z <- Z + 1",
+                                                           "IF Z != 0 GOTO A"),
+                                           jit=jit)
+    with pytest.raises(DeadlineExceeded) as exception_info:
+        interpreter.run(timeout=0.2)
+    assert exception_info.value.instructions_performed > 0
+    assert exception_info.value.variables["Z"] == (exception_info.value.instructions_performed + 1) // 2
+
+
+def test_cli_fuel(capsys: pytest.CaptureFixture,
+                  tmp_path) -> None:
+    binary_path = tmp_path / "binary.txt"
+    binary_path.write_text("[A] Z <- Z + 1\nIF Z != 0 GOTO A\n")
+    with pytest.raises(SystemExit):
+        main(["-b", str(binary_path), "--fuel", "101"])
+    assert "101 instructions" in capsys.readouterr().out
@@ -0,0 +1,97 @@
+import random
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.mark.parametrize(("program_lines", "loop_heads"),
+                         [
+                             (("[A] X <- X - 1",
+                               "Y <- Y + 1",
+                               "IF X != 0 GOTO A"), {0}),
+                             (("[A] X <- X - 1",
+                               "IF X != 0 GOTO A"), {0}),
+                             (("Y <- Y + 1",
+                               "[B] X <- X - 1",
+                               "X <- X - 1",
+                               "Z <- Z - 1",
+                               "Y <- Y + 1",
+                               "Y <- Y + 1",
+                               "IF X != 0 GOTO B"), {1}),
+                             (("[A] X <- X + 1",
+                               "IF X != 0 GOTO A"), set()),
+                             (("[A] X <- X - 1",
+                               "X <- X + 1",
+                               "IF X != 0 GOTO A"), set()),
+                             (("[A] X <- X - 1",
+                               "Y <- Y + 1",
+                               "Y <- Y - 1",
+                               "IF X != 0 GOTO A"), set()),
+                             (("[A] X <- X - 1",
+                               "IF Y != 0 GOTO E",
+                               "IF X != 0 GOTO A"), set()),
+                             (("[A] Y <- Y + 1",
+                               "IF X != 0 GOTO A"), set()),
+                             (("IF X != 0 GOTO A",
+                               "[A] X <- X - 1"), set()),
+                         ])
+def test_loop_detection(program_lines: tuple[str, ...],
+                        loop_heads: set[int]) -> None:
+    assert set(LoweredProgram(Program.compile(*program_lines)).loops) == loop_heads
+
+
+@pytest.mark.parametrize("jit", [False, True])
+@pytest.mark.parametrize(("inputs", "expected_output"),
+                         [
+                             ((0, 0), 1),
+                             ((1, 0), 1),
+                             ((10 ** 40, 0), 10 ** 40),
+                             ((10 ** 40, 10 ** 30), 10 ** 40 + 10 ** 30),
+                         ])
+def test_huge_transfer_loops(jit: bool,
+                             inputs: tuple[int, ...],
+                             expected_output: int) -> None:
+    interpreter: Interpreter = Interpreter(Program.compile("[A] X <- X - 1",
+                                                           "Y <- Y + 1",
+                                                           "IF X != 0 GOTO A",
+                                                           "IF X2 != 0 GOTO B",
+                                                           "Z <- Z + 1",
+                                                           "IF Z != 0 GOTO E",
+                                                           "[B] X2 <- X2 - 1",
+                                                           "Z2 <- Z2 + 1",
+                                                           "IF X2 != 0 GOTO B",
+                                                           "[C] Z2 <- Z2 - 1",
+                                                           "Y <- Y + 1",
+                                                           "IF Z2 != 0 GOTO C"),
+                                           jit=jit)
+    assert interpreter.run(*inputs) == expected_output
+    assert interpreter.instructions_performed == (
+        3 * max(inputs[0], 1) + (6 * inputs[1] + 1 if inputs[1] > 0 else 3)
+    )
+
+
+@pytest.mark.parametrize("jit", [False, True])
+@pytest.mark.parametrize("seed", range(50))
+def test_random_loops_match_reference(reference: Callable[..., tuple[int, int, dict[str, int]]],
+                                      jit: bool,
+                                      seed: int) -> None:
+    generator: random.Random = random.Random(seed)
+    variables: list[str] = ["Y", "X", "X2", "Z", "Z2"]
+    counter: str = generator.choice(variables)
+    body: list[str] = [f"{counter} <- {counter} - 1"] * generator.randint(1, 3)
+    for variable in variables:
+        if variable != counter:
+            body += [f"{variable} <- {variable} {generator.choice('+-')} 1"] * generator.randint(0, 3)
+    generator.shuffle(body)
+    program: Program = Program.compile(*[f"[A] {body[0]}", *body[1:], f"IF {counter} != 0 GOTO A"])
+
+    assert set(LoweredProgram(program).loops) == {0}
+    inputs: tuple[int, int] = generator.randint(0, 20), generator.randint(0, 20)
+    interpreter: Interpreter = Interpreter(program, jit=jit)
+    output, instructions_performed, variables_values = reference(program, *inputs)
+    assert interpreter.run(*inputs) == output
+    assert interpreter.instructions_performed == instructions_performed
+    assert interpreter.variables == variables_values
@@ -0,0 +1,69 @@
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.mark.parametrize(("program_lines", "opcodes", "slots", "targets"),
+                         [
+                             (tuple(), [Opcode.Halt], [0], [0]),
+                             (("[A] X <- X - 1",
+                               "Y <- Y + 1",
+                               "IF X != 0 GOTO A"),
+                              [Opcode.Decrement, Opcode.Increment, Opcode.Jump, Opcode.Halt],
+                              [1, 0, 1, 0],
+                              [0, 0, 0, 0]),
+                             (("IF X != 0 GOTO E",
+                               "Z <- Z",
+                               "[B] Z <- Z + 1",
+                               "[B] IF Z != 0 GOTO B"),
+                              [Opcode.Jump, Opcode.NoOp, Opcode.Increment, Opcode.Jump, Opcode.Halt],
+                              [1, 2, 2, 2, 0],
+                              [4, 0, 0, 2, 0]),
+                         ])
+def test_lowered_program(program_lines: tuple[str, ...],
+                         opcodes: list[int],
+                         slots: list[int],
+                         targets: list[int]) -> None:
+    lowered: LoweredProgram = LoweredProgram(Program.compile(*program_lines))
+    assert lowered.opcodes == opcodes
+    assert lowered.slots == slots
+    assert lowered.targets == targets
+    assert len(lowered) == len(program_lines)
+    assert lowered.variables[0] == Variable("Y")
+
+
+def test_run_matches_reference(halting_programs: list[tuple[Program, tuple[int, ...]]],
+                               reference: Callable[..., tuple[int, int, dict[str, int]]]) -> None:
+    for program, inputs in halting_programs:
+        interpreter: Interpreter = Interpreter(program)
+        output, instructions_performed, variables = reference(program, *inputs)
+        assert interpreter.run(*inputs) == output
+        assert interpreter.instructions_performed == instructions_performed
+        assert interpreter.variables == variables
+
+
+def test_step_matches_run(halting_programs: list[tuple[Program, tuple[int, ...]]]) -> None:
+    for program, inputs in halting_programs:
+        interpreter: Interpreter = Interpreter(program)
+        interpreter.reset(*inputs)
+        while (output := interpreter.step()) is None:
+            pass
+        assert output == interpreter.run(*inputs)
+
+
+def test_negative_input() -> None:
+    with pytest.raises(InterpreterError):
+        Interpreter(Program.compile("Y <- Y + 1")).run(-1)
+
+
+def test_lowered_program_pickle(halting_programs: list[tuple[Program, tuple[int, ...]]]) -> None:
+    import pickle
+
+    for program, inputs in halting_programs[:20]:
+        lowered: LoweredProgram = pickle.loads(pickle.dumps(LoweredProgram(program)))
+        assert lowered.to_program() == program
+        assert Interpreter(lowered).run(*inputs) == Interpreter(program).run(*inputs)
+        assert Interpreter(lowered).program == program
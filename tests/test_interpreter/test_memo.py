@@ -0,0 +1,96 @@
+import random
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+from s_interpreter.memo import *
+
+
+def test_memoized_runs_match_reference(reference: Callable[..., tuple[int, int, dict[str, int]]],
+                                       halting_programs: list[tuple[Program, tuple[int, ...]]]) -> None:
+    for program, inputs in halting_programs:
+        interpreter: Interpreter = Interpreter(program, memoize=True)
+        output, instructions_performed, variables = reference(program, *inputs)
+        assert interpreter.run(*inputs) == output
+        assert interpreter.instructions_performed == instructions_performed
+        assert interpreter.variables == variables
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_memoized_runs_are_exact(reference_steps: Callable[..., tuple[int, int, dict[str, int]]],
+                                 seed: int) -> None:
+    generator: random.Random = random.Random(seed)
+    variables: list[str] = ["Y", "X", "X2", "Z"]
+    lines: list[str] = []
+    for block_index in range(4):
+        block: list[str] = [f"{variable} <- {variable} {generator.choice(['+ 1', '- 1', ''])}"
+                            for variable in generator.choices(variables, k=generator.randint(1, 5))]
+        lines += [f"[A{block_index + 1}] {block[0]}",
+                  *block[1:],
+                  f"IF {generator.choice(variables)} != 0 GOTO A{generator.randint(1, 5)}"]
+    program: Program = Program.compile(*lines, "[A5] Y <- Y + 1")
+
+    inputs: tuple[int, int] = (seed % 4, seed % 3)
+    for fuel in range(0, 200, 3):
+        interpreter: Interpreter = Interpreter(program, memoize=True)
+        instruction_index, instructions_performed, variables_values = reference_steps(program, fuel, *inputs)
+        try:
+            interpreter.run(*inputs, fuel=fuel)
+        except FuelExhausted:
+            pass
+        assert interpreter.instruction_index == instruction_index
+        assert interpreter.instructions_performed == instructions_performed
+        assert interpreter.variables == variables_values
+
+
+@pytest.mark.parametrize(("x1", "x2"), [(0, 0), (1, 5), (7, 3), (20, 20)])
+def test_repeated_regions_are_looked_up(reference: Callable[..., tuple[int, int, dict[str, int]]],
+                                        x1: int,
+                                        x2: int) -> None:
+    # Y <- X1 * X2, with a transfer loop that branches every iteration
+    program: Program = Program.compile("[A] IF X != 0 GOTO B",
+                                       "Z4 <- Z4 + 1",
+                                       "IF Z4 != 0 GOTO E",
+                                       "[B] X <- X - 1",
+                                       "[C] IF X2 != 0 GOTO D",
+                                       "IF Z2 != 0 GOTO C2",
+                                       "Z3 <- Z3 + 1",
+                                       "IF Z3 != 0 GOTO A",
+                                       "[D] X2 <- X2 - 1",
+                                       "Y <- Y + 1",
+                                       "Z2 <- Z2 + 1",
+                                       "Z3 <- Z3 + 1",
+                                       "IF Z3 != 0 GOTO C",
+                                       "[C2] Z2 <- Z2 - 1",
+                                       "X2 <- X2 + 1",
+                                       "IF Z2 != 0 GOTO C2",
+                                       "Z3 <- Z3 + 1",
+                                       "IF Z3 != 0 GOTO A")
+    regions: RegionMemo = RegionMemo(LoweredProgram(program))
+    interpreter: Interpreter = Interpreter(program, memoize=True)
+    output, instructions_performed, _ = reference(program, x1, x2)
+    assert interpreter.run(x1, x2) == output == x1 * x2
+    assert interpreter.instructions_performed == instructions_performed
+
+    assert regions.transition(len(program.instructions), [0] * len(regions.lowered.variables)) is None
+    registers: list[int] = [0] * len(regions.lowered.variables)
+    assert regions.transition(3, registers) is regions.transition(3, registers)
+    assert (regions.hits, regions.misses) == (1, 1)
+
+
+def test_region_tree_limit() -> None:
+    program: Program = Program.compile("[A] X <- X - 1",
+                                       "IF Z2 != 0 GOTO B",
+                                       "IF X != 0 GOTO A",
+                                       "[B] Y <- Y + 1")
+    regions: RegionMemo = RegionMemo(LoweredProgram(program), max_tests=4, max_nodes=6)
+    for x in range(10):
+        transition: RegionTransition = regions.transition(1, [x] * len(regions.lowered.variables))
+        assert transition.length <= 3 * 4
+        assert regions.node_count <= regions.max_nodes
+    assert regions.hits + regions.misses == 10
+
+    with pytest.raises(ValueError):
+        RegionMemo(LoweredProgram(program), max_tests=0)
@@ -0,0 +1,104 @@
+import pickle
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.fixture(scope="module")
+def universal_program() -> Program:
+    return compile_slang_file("tests/test_interpreter/s_interpreter.slang")
+
+
+@pytest.fixture(scope="module")
+def strict_universal_program() -> Program:
+    return compile_slang_file("tests/test_interpreter/s_interpreter.slang", strict=True)
+
+
+@pytest.fixture(scope="module")
+def diverging_division() -> Program:
+    return Program.compile("Y <- Y + 1",
+                           "Z <- NATIVE DIV X X2",
+                           "Y <- NATIVE ADD Z 1")
+
+
+@pytest.mark.parametrize(("program", "x"),
+                         [
+                             (Program.compile("Y <- Y + 1"), 0),
+                             (Program.compile("Y <- Y + 1", "Y <- Y + 1", "Y <- Y + 1"), 0),
+                             (Program.compile("[A] X <- X - 1", "Y <- Y + 1", "IF X != 0 GOTO A"), 3),
+                             (Program.compile("[A] X <- X - 1", "Y <- Y + 1", "Y <- Y + 1", "IF X != 0 GOTO A"), 2),
+                             (Program.compile("IF X != 0 GOTO B", "Y <- Y + 1", "[B] Y <- Y + 1"), 1),
+                         ])
+def test_native_universal_program(universal_program: Program,
+                                  program: Program,
+                                  x: int) -> None:
+    interpreter: Interpreter = Interpreter(universal_program)
+    assert interpreter.run(x, program.encode()) == Interpreter(program).run(x)
+    assert Interpreter(universal_program, jit=True).run(x, program.encode()) == Interpreter(program).run(x)
+    assert interpreter.profile(x, program.encode()).output == Interpreter(program).run(x)
+
+
+def test_native_matches_strict(universal_program: Program,
+                               strict_universal_program: Program) -> None:
+    program: Program = Program.compile("Y <- Y + 1", "Y <- Y + 1")
+    native_interpreter: Interpreter = Interpreter(universal_program)
+    strict_interpreter: Interpreter = Interpreter(strict_universal_program)
+    assert native_interpreter.run(0, program.encode()) == strict_interpreter.run(0, program.encode()) == 2
+    assert native_interpreter.instructions_performed * 100 < strict_interpreter.instructions_performed
+    assert all(type(instruction.sentence.command) is not NativeCommand
+               for instruction in strict_universal_program.instructions)
+
+
+def test_native_lowering(universal_program: Program) -> None:
+    lowered: LoweredProgram = LoweredProgram(universal_program)
+    assert lowered.to_program() == universal_program
+    assert any(native is not None for native in lowered.natives)
+
+    unpickled: LoweredProgram = pickle.loads(pickle.dumps(lowered))
+    assert unpickled.digest() == lowered.digest()
+    assert unpickled.natives == lowered.natives
+    assert "natives" not in LoweredProgram(Program.compile("Y <- Y + 1")).__getstate__()
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_native_divergence(diverging_division: Program,
+                           jit: bool) -> None:
+    interpreter: Interpreter = Interpreter(diverging_division, jit=jit)
+    assert interpreter.run(7, 2) == 4
+
+    with pytest.raises(NativeDivergence) as interruption:
+        interpreter.run(7, 0)
+    assert (interruption.value.instruction_index, interruption.value.instructions_performed) == (1, 1)
+    assert interpreter.instruction_index == 1
+
+    interpreter.reset(7, 0)
+    interpreter.step()
+    with pytest.raises(NativeDivergence):
+        interpreter.step()
+
+
+def test_native_trace(diverging_division: Program,
+                      tmp_path) -> None:
+    pytest.importorskip("numpy")
+    from s_interpreter.trace import read_trace
+
+    assert Interpreter(diverging_division).trace(9, 2, trace_path=str(tmp_path / "run.trace")) == 5
+    records, variables = read_trace(str(tmp_path / "run.trace"))
+    assert [(int(record["pc"]), variables[record["slot"]], int(record["value"])) for record in records] == [
+        (0, "Y", 1),
+        (1, "Z", 4),
+        (2, "Y", 5)
+    ]
+
+
+def test_native_batch(diverging_division: Program) -> None:
+    np = pytest.importorskip("numpy")
+
+    interpreter: Interpreter = Interpreter(Program.compile("Z <- NATIVE POW X X2", "Y <- NATIVE ADD Z X"))
+    assert interpreter.run_batch(np.array([[2, 3], [3, 0], [2, 63], [10, 30]])).tolist() == [
+        10, 4, 2 ** 63 + 2, 10 ** 30 + 10
+    ]
+    with pytest.raises(NativeDivergence):
+        Interpreter(diverging_division).run_batch(np.array([[4, 2], [4, 0]]))
@@ -0,0 +1,42 @@
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.fixture(scope="module")
+def transfer_program() -> Program:
+    return Program.compile("IF X != 0 GOTO A",
+                           "GOTO E",
+                           "[A] X2 <- X2 - 1",
+                           "Z <- Z + 1",
+                           "IF X2 != 0 GOTO A",
+                           "[B] Z <- Z - 1",
+                           "X2 <- X2 + 1",
+                           "Y <- Y + 1",
+                           "IF Z != 0 GOTO B",
+                           "X <- X - 1",
+                           "IF X != 0 GOTO A",
+                           sugars=[SyntacticSugar("GOTO {Label L}",
+                                                  "Z <- Z + 1",
+                                                  "IF Z != 0 GOTO {L}")])
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_run_many_ordered(transfer_program: Program,
+                          jit: bool) -> None:
+    inputs: list[tuple[int, int]] = [(x1, x2) for x1 in range(6) for x2 in range(6)]
+    assert list(Interpreter.run_many(transfer_program, inputs, workers=2, chunksize=4, jit=jit)) == [
+        Interpreter(transfer_program).run(*x) for x in inputs
+    ]
+
+
+def test_run_many_unordered(transfer_program: Program) -> None:
+    inputs: list[tuple[int, int]] = [(x1, x2) for x1 in range(6) for x2 in range(6)]
+    assert sorted(Interpreter.run_many(LoweredProgram(transfer_program),
+                                       inputs,
+                                       workers=2,
+                                       chunksize=5,
+                                       ordered=False)) == [
+        (index, Interpreter(transfer_program).run(*x)) for index, x in enumerate(inputs)
+    ]
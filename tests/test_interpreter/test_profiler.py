@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+from s_interpreter.profiler import *
+
+
+def stepped_profile(program: Program,
+                    *x: int) -> tuple[list[int], list[int]]:
+    interpreter: Interpreter = Interpreter(program)
+    hits: list[int] = [0] * len(program.instructions)
+    taken: list[int] = [0] * len(program.instructions)
+    interpreter.reset(*x)
+    while interpreter.instruction_index < len(program.instructions):
+        instruction_index: int = interpreter.instruction_index
+        command = program.instructions[instruction_index].sentence.command
+        hits[instruction_index] += 1
+        if type(command) is JumpCommand and interpreter.variables[str(command.variable)] != 0:
+            taken[instruction_index] += 1
+        interpreter.step()
+    return hits, taken
+
+
+def test_profile_matches_stepping(halting_programs: list[tuple[Program, tuple[int, ...]]]) -> None:
+    for program, inputs in halting_programs:
+        profile: Profile = Interpreter(program).profile(*inputs)
+        assert (profile.hits, profile.taken) == stepped_profile(program, *inputs)
+        assert sum(profile.hits) == profile.instructions_performed
+        assert profile.output == Interpreter(program).run(*inputs)
+
+
+@pytest.fixture(scope="module")
+def nested_loops() -> Program:
+    return Program.compile("[A] X <- X - 1",
+                           "Y <- Y + 1",
+                           "IF X != 0 GOTO A",
+                           "[B] Z <- Z + 1",
+                           "Z <- Z + 1",
+                           "X2 <- X2 - 1",
+                           "Y <- Y - 1",
+                           "IF X2 != 0 GOTO B")
+
+
+def test_profile_report(nested_loops: Program) -> None:
+    profile: Profile = Interpreter(nested_loops).profile(5, 3)
+    assert profile.hits == [5, 5, 5, 3, 3, 3, 3, 3]
+    assert profile.back_edges() == [(2, 0, 4), (7, 3, 2)]
+    assert profile.hottest_instructions(1) == [(0, 5)]
+    assert "taken 4, not taken 1" in profile.report()
+
+    profile_json: dict = json.loads(profile.to_json())
+    assert profile_json["instructions_performed"] == 30
+    assert profile_json["instructions"][2]["taken"] == 4
+    assert profile.to_csv().splitlines()[3] == "2,IF X != 0 GOTO A,5,4,1"
+
+
+def test_profile_with_fuel(nested_loops: Program) -> None:
+    with pytest.raises(FuelExhausted) as exception_info:
+        Interpreter(nested_loops).profile(5, 3, fuel=7)
+    assert sum(exception_info.value.profile.hits) == 7
+
+
+def test_cli_profile(nested_loops: Program,
+                     capsys: pytest.CaptureFixture,
+                     tmp_path) -> None:
+    binary_path = tmp_path / "binary.txt"
+    binary_path.write_text(str(nested_loops))
+    main(["5", "3", "-b", str(binary_path), "--profile", "--profile_output", str(tmp_path / "profile.csv")])
+    assert "Hottest loops" in capsys.readouterr().out
+    assert (tmp_path / "profile.csv").read_text().startswith("index,instruction,hits,taken,not_taken")
+
+    # Profiling runs from the start, which would discard the resumed state
+    checkpoint_path: str = str(tmp_path / "checkpoint.json")
+    Interpreter(nested_loops).save_checkpoint(checkpoint_path)
+    with pytest.raises(SystemExit):
+        main(["-b", str(binary_path), "--resume", checkpoint_path, "--profile"])
+
+
+def test_profile_by_source(tmp_path,
+                           capsys: pytest.CaptureFixture) -> None:
+    slang_path = tmp_path / "program.slang"
+    slang_path.write_text("> {Variable V} <- 0\n"
+                          "    [A] {V} <- {V} - 1\n"
+                          "    IF {V} != 0 GOTO A\n"
+                          "> MAIN\n"
+                          "    Y <- Y + 1\n"
+                          "    X <- 0\n")
+    program, source_map = compile_slang_file_with_source_map(str(slang_path))
+    profile: Profile = Interpreter(program).profile(7)
+
+    source_hits = profile.by_source(source_map)
+    main_line: SourceFrame = SourceFrame("MAIN", 6, "X <- 0")
+    assert source_hits[(SourceFrame("MAIN", 5, "Y <- Y + 1"),)] == 1
+    assert source_hits[(main_line,)] == 14
+    assert source_hits[(main_line, SourceFrame("{Variable V} <- 0", 3, "IF {V} != 0 GOTO A"))] == 7
+    assert profile.source_report(source_map).splitlines()[1].endswith("'X <- 0' (line 6, MAIN)")
+
+    with pytest.raises(ValueError):
+        profile.by_source(SourceMap([]))
+
+    binary_path = tmp_path / "binary.txt"
+    binary_path.write_text(str(program))
+    source_map.save(str(tmp_path / "program.map"))
+    main(["7", "-b", str(binary_path), "--source_map", str(tmp_path / "program.map")])
+    assert "Costliest source lines" in capsys.readouterr().out
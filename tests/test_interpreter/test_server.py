@@ -0,0 +1,133 @@
+import asyncio
+import json
+import socket
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+from s_interpreter.server import *
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are unavailable")
+
+# A countdown that can't be summarized (its body has a jump), running 4X + 1 instructions
+COUNTDOWN: Program = Program.compile("[A] IF X != 0 GOTO B",
+                                     "Z <- Z + 1",
+                                     "IF Z != 0 GOTO C",
+                                     "[B] X <- X - 1",
+                                     "Y <- Y + 1",
+                                     "IF X != 0 GOTO A",
+                                     "[C] Y <- Y")
+
+
+@pytest.mark.parametrize("slice_steps", [1, 7, Interpreter.CHECK_INTERVAL])
+def test_run_async(halting_programs: list[tuple[Program, tuple[int, ...]]],
+                   slice_steps: int) -> None:
+    async def run_all() -> list[int]:
+        return await asyncio.gather(*(
+            Interpreter(program).run_async(*inputs, slice_steps=slice_steps)
+            for program, inputs in halting_programs
+        ))
+
+    assert asyncio.run(run_all()) == [Interpreter(program).run(*inputs) for program, inputs in halting_programs]
+
+
+def test_run_async_limits() -> None:
+    interpreter: Interpreter = Interpreter(COUNTDOWN)
+    with pytest.raises(FuelExhausted):
+        asyncio.run(interpreter.run_async(1000, fuel=100, slice_steps=7))
+    assert interpreter.instructions_performed == 100
+    assert asyncio.run(interpreter.resume_async()) == 1000
+
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(Interpreter(COUNTDOWN).run_async(10 ** 9, timeout=0.05))
+
+
+def test_server_time_slicing() -> None:
+    async def run_jobs() -> list[int]:
+        server: JobServer = JobServer("unused", slice_steps=100)
+        digest: str = server.register(COUNTDOWN)
+        finished: list[int] = []
+
+        async def job(x: int) -> None:
+            await server.run(digest, [x])
+            finished.append(x)
+
+        await asyncio.gather(job(100000), *(job(x) for x in range(10)))
+        return finished
+
+    # The long run is submitted first, yet every short run finishes before it
+    assert asyncio.run(run_jobs())[-1] == 100000
+
+
+def test_server_protocol(tmp_path) -> None:
+    socket_path: str = str(tmp_path / "server.sock")
+
+    async def serve() -> list[dict]:
+        async with JobServer(socket_path, slice_steps=64):
+            [registered] = await submit(socket_path, {"op": "register", "program": str(COUNTDOWN)})
+            return [registered] + await submit(socket_path,
+                                               {"op": "run", "program": registered["program"], "inputs": [5]},
+                                               {"op": "run", "program": registered["program"], "inputs": [5],
+                                                "fuel": 3},
+                                               {"op": "run", "program": "unknown", "inputs": [5]},
+                                               {"op": "compile"})
+
+    registered, output, out_of_fuel, unknown, invalid = asyncio.run(serve())
+    assert registered["program"] == LoweredProgram(COUNTDOWN).digest()
+    assert output == {"output": 5, "instructions_performed": 21}
+    assert out_of_fuel["type"] == "FuelExhausted" and out_of_fuel["instructions_performed"] == 3
+    assert unknown["type"] == "KeyError"
+    assert invalid["type"] == "ValueError"
+
+
+def test_server_huge_numbers(tmp_path) -> None:
+    socket_path: str = str(tmp_path / "server.sock")
+    transfer: Program = Program.compile("[A] X <- X - 1", "Y <- Y + 1", "IF X != 0 GOTO A")
+    huge: int = 10 ** 5000
+
+    async def serve() -> list[dict]:
+        async with JobServer(socket_path, programs=[transfer]) as server:
+            digest: str = next(iter(server.programs))
+            # Beyond the digits Python converts, so the line can only be written by hand
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            writer.write(f'{{"op": "run", "program": "{digest}", "inputs": [1{"0" * 5000}], "id": 7}}\n'.encode())
+            raw_response: bytes = await reader.readline()
+            writer.close()
+            await writer.wait_closed()
+
+            return [json.loads(raw_response)] + await submit(socket_path,
+                                                             {"op": "run", "program": digest,
+                                                              "inputs": [hex(huge)]},
+                                                             {"op": "run", "program": digest,
+                                                              "inputs": [hex(huge)], "hex": True})
+
+    decimal_input, decimal_output, hex_output = asyncio.run(serve())
+    assert decimal_input["id"] == 7 and decimal_input["type"] == "ValueError"
+    assert decimal_output["type"] == "ValueError" and "hex" in decimal_output["error"]
+    assert int(hex_output["output"], 16) == huge
+    assert int(hex_output["instructions_performed"], 16) == 3 * huge
+
+
+def test_server_drops_answered_requests(tmp_path) -> None:
+    socket_path: str = str(tmp_path / "server.sock")
+
+    async def serve() -> list[int]:
+        async with JobServer(socket_path, programs=[COUNTDOWN]) as server:
+            digest: str = next(iter(server.programs))
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            pending: list[int] = []
+            # One long-lived connection, as a front-end would keep open
+            for batch in range(3):
+                for x in range(50):
+                    writer.write(json.dumps({"op": "run", "program": digest, "inputs": [x]}).encode() + b"\n")
+                await writer.drain()
+                for _ in range(50):
+                    assert "output" in json.loads(await reader.readline())
+                await asyncio.sleep(0)
+                pending.append(server.pending_requests)
+            writer.close()
+            await writer.wait_closed()
+            return pending
+
+    assert asyncio.run(serve()) == [0, 0, 0]
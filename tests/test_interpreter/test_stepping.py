@@ -0,0 +1,97 @@
+import random
+from typing import Callable, Optional
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+def step_until(interpreter: Interpreter,
+               stops: set[int]) -> Optional[int]:
+    # The naive reading of `run_until`, one `step` at a time
+    output: Optional[int] = interpreter.step()
+    while output is None and interpreter.instruction_index not in stops:
+        output = interpreter.step()
+    return output
+
+
+def test_step_n(reference_steps: Callable[..., tuple[int, int, dict[str, int]]],
+                halting_programs: list[tuple[Program, tuple[int, ...]]]) -> None:
+    for program, inputs in halting_programs[:100]:
+        interpreter: Interpreter = Interpreter(program)
+        interpreter.reset(*inputs)
+        for steps in range(0, 60, 7):
+            output: Optional[int] = interpreter.step_n(7 if steps else 0)
+            instruction_index, instructions_performed, variables = reference_steps(program, steps, *inputs)
+            assert interpreter.instruction_index == instruction_index
+            assert interpreter.instructions_performed == instructions_performed
+            assert interpreter.variables == variables
+            assert output == (variables["Y"] if instruction_index == len(program.instructions) else None)
+
+
+def test_run_until_pc(halting_programs: list[tuple[Program, tuple[int, ...]]]) -> None:
+    generator: random.Random = random.Random(0)
+    for program, inputs in halting_programs:
+        pc: int = generator.randrange(len(program.instructions) + 1)
+        interpreter: Interpreter = Interpreter(program)
+        expected: Interpreter = Interpreter(program)
+        interpreter.reset(*inputs)
+        expected.reset(*inputs)
+        while True:
+            output: Optional[int] = interpreter.run_until(pc=pc)
+            assert output == step_until(expected, {pc})
+            assert interpreter.instruction_index == expected.instruction_index
+            assert interpreter.instructions_performed == expected.instructions_performed
+            assert interpreter.variables == expected.variables
+            if output is not None:
+                break
+
+
+def test_run_until_label() -> None:
+    program: Program = Program.compile("[A] X <- X - 1",
+                                       "Y <- Y + 1",
+                                       "Y <- Y + 1",
+                                       "[B] IF X != 0 GOTO A",
+                                       "[B] Z2 <- Z2 + 1")
+    interpreter: Interpreter = Interpreter(program)
+    interpreter.reset(3)
+    assert interpreter.run_until(label="B") is None
+    assert (interpreter.instruction_index, interpreter.instructions_performed) == (3, 3)
+    assert interpreter.run_until(label=Label.compile("A")) is None
+    assert (interpreter.instruction_index, interpreter.instructions_performed) == (0, 4)
+    assert interpreter.run_until(label="B") is None
+    assert interpreter.run_until(label="B") is None
+    assert (interpreter.instruction_index, interpreter.instructions_performed) == (3, 11)
+    assert interpreter.run_until(label="C") == 6
+
+
+@pytest.mark.parametrize("check_every", [1, 3, 10])
+def test_run_until_predicate(check_every: int) -> None:
+    program: Program = Program.compile("[A] X <- X - 1",
+                                       "Y <- Y + 1",
+                                       "Y <- Y + 1",
+                                       "IF X != 0 GOTO A")
+    interpreter: Interpreter = Interpreter(program)
+    interpreter.reset(100)
+    assert interpreter.run_until(lambda running: running.variables["Y"] >= 50, check_every=check_every) is None
+    assert interpreter.instructions_performed % check_every == 0
+    assert interpreter.variables["Y"] >= 50
+    assert interpreter.run_until(lambda running: False, check_every=check_every) == 200
+
+
+def test_run_until_errors() -> None:
+    program: Program = Program.compile("[A] IF X != 0 GOTO A")
+    interpreter: Interpreter = Interpreter(program)
+    interpreter.reset(1)
+    with pytest.raises(InterpreterError):
+        interpreter.run_until()
+    with pytest.raises(InterpreterError):
+        interpreter.run_until(pc=2)
+    with pytest.raises(InterpreterError):
+        interpreter.run_until(lambda _: False, check_every=0)
+    with pytest.raises(InterpreterError):
+        interpreter.step_n(-1)
+    with pytest.raises(FuelExhausted):
+        interpreter.run_until(pc=1, fuel=1000)
+    assert interpreter.instructions_performed == 1000
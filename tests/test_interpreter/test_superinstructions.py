@@ -0,0 +1,81 @@
+import random
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.mark.parametrize(("program_lines", "superinstructions"),
+                         [
+                             (("Z <- Z + 1",
+                               "IF Z != 0 GOTO A",
+                               "Y <- Y + 1",
+                               "[A] Y <- Y + 1"), {0: Superinstruction(Opcode.Goto, 3, 2)}),
+                             (("Z <- Z + 1",
+                               "IF Z != 0 GOTO E",
+                               "Y <- Y + 1"), {0: Superinstruction(Opcode.Goto, 3, 2)}),
+                             (("Z <- Z + 1",
+                               "IF Z != 0 GOTO A",
+                               "Y <- Y + 1",
+                               "[A] Y <- Y",
+                               "Y <- Y",
+                               "X <- X - 1"), {0: Superinstruction(Opcode.Goto, 5, 4),
+                                               3: Superinstruction(Opcode.Skip, 5, 2)}),
+                             (("Z <- Z + 1",
+                               "IF Z2 != 0 GOTO A",
+                               "[A] Y <- Y + 1"), {}),
+                             (("Z <- Z - 1",
+                               "IF Z != 0 GOTO A",
+                               "[A] Y <- Y + 1"), {}),
+                             (("[A] Y <- Y",
+                               "X <- X + 1",
+                               "[B] Y <- Y"), {}),
+                             (("[A] Y <- Y",
+                               "[B] X <- X",
+                               "Y <- Y",
+                               "X <- X + 1"), {0: Superinstruction(Opcode.Skip, 3, 3),
+                                               1: Superinstruction(Opcode.Skip, 3, 2)}),
+                         ])
+def test_superinstruction_detection(program_lines: tuple[str, ...],
+                                    superinstructions: dict[int, Superinstruction]) -> None:
+    assert LoweredProgram(Program.compile(*program_lines)).superinstructions == superinstructions
+
+
+def idiomatic_program(seed: int) -> Program:
+    # Random programs made of the idioms of expanded code: GOTOs, clearing loops and no-op placeholders
+    generator: random.Random = random.Random(seed)
+    variables: list[str] = ["Y", "X", "X2", "Z2"]
+    lines: list[str] = []
+    for block_index in range(6):
+        label: str = f"[A{block_index + 1}] "
+        idiom: int = generator.randrange(4)
+        variable: str = generator.choice(variables)
+        if idiom == 0:
+            lines += [f"{label}Z <- Z + 1", f"IF Z != 0 GOTO A{generator.randint(1, 7)}"]
+        elif idiom == 1:
+            lines += [f"{label}{variable} <- {variable} - 1", f"IF {variable} != 0 GOTO A{block_index + 1}"]
+        elif idiom == 2:
+            lines += [f"{label}Y <- Y"] + ["Y <- Y"] * generator.randrange(3)
+        else:
+            lines += [f"{label}{variable} <- {variable} {generator.choice('+-')} 1",
+                      f"IF {generator.choice(variables)} != 0 GOTO A{generator.randint(1, 7)}"]
+    return Program.compile(*lines, "[A7] Y <- Y + 1")
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_superinstructions_are_exact(reference_steps: Callable[..., tuple[int, int, dict[str, int]]],
+                                     seed: int) -> None:
+    program: Program = idiomatic_program(seed)
+    inputs: tuple[int, int] = (seed % 5, seed % 3)
+    for fuel in range(60):
+        interpreter: Interpreter = Interpreter(program)
+        instruction_index, instructions_performed, variables = reference_steps(program, fuel, *inputs)
+        try:
+            interpreter.run(*inputs, fuel=fuel)
+        except FuelExhausted:
+            pass
+        assert interpreter.instruction_index == instruction_index
+        assert interpreter.instructions_performed == instructions_performed
+        assert interpreter.variables == variables
@@ -0,0 +1,62 @@
+from typing import Callable
+
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+from s_interpreter.trace import *
+
+np = pytest.importorskip("numpy")
+
+
+def test_trace_matches_reference(halting_programs: list[tuple[Program, tuple[int, ...]]],
+                                 reference: Callable[..., tuple[int, int, dict[str, int]]],
+                                 reference_steps: Callable[..., tuple[int, int, dict[str, int]]],
+                                 tmp_path) -> None:
+    trace_path: str = str(tmp_path / "trace.bin")
+    for program, inputs in halting_programs[:100]:
+        assert Interpreter(program).trace(*inputs, trace_path=trace_path, capacity=3) == reference(program, *inputs)[0]
+
+        records, variables = read_trace(trace_path)
+        loop_heads: set[int] = set(LoweredProgram(program).loops)
+        assert list(records["step"]) == sorted(records["step"])
+        for step, pc, slot, value in records.tolist():
+            assert reference_steps(program, step, *inputs)[2][variables[slot]] == value
+            assert str(program.instructions[pc].sentence.command.variable) == variables[slot] or pc in loop_heads
+
+
+def test_trace_records(tmp_path) -> None:
+    trace_path: str = str(tmp_path / "trace.bin")
+    interpreter: Interpreter = Interpreter(Program.compile("Z <- Z + 1",
+                                                           "[A] X <- X - 1",
+                                                           "Y <- Y + 1",
+                                                           "IF X != 0 GOTO A",
+                                                           "IF Z != 0 GOTO E"))
+    assert interpreter.trace(10, trace_path=trace_path) == 10
+
+    records, variables = read_trace(trace_path)
+    assert variables == ["Y", "Z", "X"]
+    # The transfer loop is summarized, so it's logged once with the final values of its registers
+    assert records.tolist() == [(1, 0, 1, 1), (31, 1, 2, 0), (31, 1, 0, 10)]
+
+
+def test_trace_saturation_and_interruption(tmp_path) -> None:
+    trace_path: str = str(tmp_path / "trace.bin")
+    interpreter: Interpreter = Interpreter(Program.compile("[A] X <- X + 1",
+                                                           "Y <- Y + 1",
+                                                           "IF X != 0 GOTO A"))
+    with pytest.raises(FuelExhausted):
+        interpreter.trace(2 ** 70, trace_path=trace_path, fuel=7, capacity=2)
+
+    records, _ = read_trace(trace_path)
+    assert list(records["step"]) == [1, 2, 4, 5, 7]
+    assert list(records["value"]) == [SATURATED_VALUE, 1, SATURATED_VALUE, 2, SATURATED_VALUE]
+
+
+def test_cli_trace(tmp_path,
+                   capsys: pytest.CaptureFixture) -> None:
+    binary_path = tmp_path / "binary.txt"
+    binary_path.write_text(str(Program.compile("Y <- Y + 1", "Y <- Y + 1")))
+    main(["-b", str(binary_path), "--trace", str(tmp_path / "trace.bin")])
+    assert "Output: 2" in capsys.readouterr().out
+    assert read_trace(str(tmp_path / "trace.bin"))[0].tolist() == [(1, 0, 0, 1), (2, 1, 0, 2)]
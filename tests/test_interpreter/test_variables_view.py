@@ -0,0 +1,51 @@
+import pytest
+
+from s_interpreter.compiler import *
+from s_interpreter.interpreter import *
+
+
+@pytest.fixture
+def interpreter() -> Interpreter:
+    interpreter: Interpreter = Interpreter(Program.compile("[A] X <- X - 1",
+                                                           "Y <- Y + 1",
+                                                           "Z2 <- Z2 + 1",
+                                                           "Z2 <- Z2 - 1",
+                                                           "IF X != 0 GOTO A",
+                                                           "Z3 <- Z3 + 1"))
+    interpreter.reset(3)
+    return interpreter
+
+
+def test_view_is_live(interpreter: Interpreter) -> None:
+    view: VariablesView = interpreter.view_variables()
+    assert dict(view) == interpreter.variables == {"Y": 0, "X": 3, "Z2": 0, "Z3": 0}
+    interpreter.step_n(2)
+    assert (view["X"], view["Y"]) == (2, 1)
+    assert dict(view) == interpreter.variables
+    assert list(view) == ["Y", "X", "Z2", "Z3"]
+    assert len(view) == 4
+    assert "Z3" in view and "Z4" not in view
+    with pytest.raises(KeyError):
+        view["Z4"]
+    with pytest.raises(TypeError):
+        view["Y"] = 5
+
+    interpreter.run(5)
+    assert dict(view) == interpreter.variables == {"Y": 5, "X": 0, "Z2": 0, "Z3": 1}
+
+
+def test_deltas(interpreter: Interpreter) -> None:
+    view: VariablesView = interpreter.view_variables()
+    other_view: VariablesView = interpreter.view_variables()
+    assert list(view.deltas()) == []
+
+    interpreter.step_n(3)
+    assert list(view.deltas()) == [("Y", 1), ("X", 2), ("Z2", 1)]
+    assert list(view.deltas()) == []
+
+    # Z2 goes back to the value it was last observed with
+    interpreter.step_n(3)
+    assert list(view.deltas()) == [("X", 1), ("Z2", 0)]
+    assert list(view.deltas()) == []
+
+    assert list(other_view.deltas()) == [("Y", 1), ("X", 1)]